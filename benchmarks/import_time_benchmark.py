@@ -0,0 +1,76 @@
+"""Measure cold import times of zquantum.core modules.
+
+Every import is timed in a fresh interpreter, like in a workflow step. The script
+also reports which heavy frameworks each import pulls in, and exits with status 1
+if the median import time of any module exceeds the budget. The same budget is
+enforced by tests/zquantum/core/lazy_imports_test.py.
+
+Usage:
+    python benchmarks/import_time_benchmark.py [budget_seconds] [n_repeats]
+"""
+import json
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    "zquantum.core.utils",
+    "zquantum.core.bitstring_distribution",
+    "zquantum.core.circuits",
+    "zquantum.core.measurement",
+    "zquantum.core.openfermion",
+    "zquantum.core.interfaces.backend",
+    "zquantum.core.interfaces.estimation",
+    "zquantum.core.estimation",
+]
+
+FRAMEWORKS = ["cirq", "networkx", "openfermion", "pyquil", "qiskit", "sympy"]
+
+_MEASURE_IMPORT = """
+import json, sys, time
+modules_before = set(sys.modules)
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [
+    framework for framework in {frameworks!r}
+    if framework in sys.modules and framework not in modules_before
+]
+print(json.dumps({{"time": elapsed, "frameworks": loaded}}))
+"""
+
+
+def measure_import(module):
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            _MEASURE_IMPORT.format(module=module, frameworks=FRAMEWORKS),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main(budget=2.0, n_repeats=3):
+    print(f"{'module':<38} {'median [s]':>10}  frameworks imported")
+    over_budget = []
+    for module in MODULES:
+        measurements = [measure_import(module) for _ in range(n_repeats)]
+        median_time = statistics.median(
+            measurement["time"] for measurement in measurements
+        )
+        frameworks = ", ".join(measurements[0]["frameworks"])
+        print(f"{module:<38} {median_time:>10.3f}  {frameworks}")
+        if median_time > budget:
+            over_budget.append(module)
+
+    if over_budget:
+        print(f"Import time budget of {budget} s exceeded by: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(*map(float, sys.argv[1:2]), *map(int, sys.argv[2:3]))
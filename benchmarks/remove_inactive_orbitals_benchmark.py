@@ -0,0 +1,79 @@
+"""Compare the tensor-based active space reduction with the FermionOperator round-trip.
+
+Usage:
+    python benchmarks/remove_inactive_orbitals_benchmark.py [max_n_orbitals]
+"""
+import sys
+import timeit
+
+import numpy as np
+from openfermion import (
+    freeze_orbitals,
+    get_fermion_operator,
+    get_interaction_operator,
+    random_interaction_operator,
+)
+from zquantum.core.openfermion import remove_inactive_orbitals
+
+
+def remove_inactive_orbitals_via_fermion_operator(interaction_op, n_active, n_core):
+    """Reference implementation freezing orbitals on the FermionOperator."""
+    fermion_op = get_fermion_operator(interaction_op)
+    occupied = range(2 * n_core)
+    unoccupied = range(
+        2 * n_core + 2 * n_active, interaction_op.one_body_tensor.shape[0]
+    )
+    return get_interaction_operator(freeze_orbitals(fermion_op, occupied, unoccupied))
+
+
+def _max_difference(operator, reference):
+    return max(
+        abs(operator.constant - reference.constant),
+        np.max(np.abs(operator.one_body_tensor - reference.one_body_tensor)),
+        np.max(np.abs(operator.two_body_tensor - reference.two_body_tensor)),
+    )
+
+
+def main(max_n_orbitals=8):
+    print(
+        f"{'orbitals':>8} {'core':>4} {'active':>6} {'fermion op [s]':>15} "
+        f"{'tensors [s]':>12} {'speedup':>8} {'max diff':>9}"
+    )
+    for n_orbitals in range(2, max_n_orbitals + 1, 2):
+        interaction_op = random_interaction_operator(
+            n_orbitals, expand_spin=True, real=True, seed=n_orbitals
+        )
+        n_core = n_orbitals // 4
+        n_active = n_orbitals // 2
+
+        reference = remove_inactive_orbitals_via_fermion_operator(
+            interaction_op, n_active, n_core
+        )
+        reduced = remove_inactive_orbitals(interaction_op, n_active, n_core)
+
+        n_repeats = 3
+        reference_time = (
+            timeit.timeit(
+                lambda: remove_inactive_orbitals_via_fermion_operator(
+                    interaction_op, n_active, n_core
+                ),
+                number=n_repeats,
+            )
+            / n_repeats
+        )
+        tensor_time = (
+            timeit.timeit(
+                lambda: remove_inactive_orbitals(interaction_op, n_active, n_core),
+                number=n_repeats,
+            )
+            / n_repeats
+        )
+        print(
+            f"{n_orbitals:>8} {n_core:>4} {n_active:>6} {reference_time:>15.4f} "
+            f"{tensor_time:>12.4f} {reference_time / tensor_time:>8.1f} "
+            f"{_max_difference(reduced, reference):>9.1e}"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
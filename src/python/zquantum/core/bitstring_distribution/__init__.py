@@ -1,5 +1,3 @@
-import math  # This is needed for tests to work because of monkey patching
-
 from ._bitstring_distribution import (
     BitstringDistribution,
     are_keys_binary_strings,
@@ -15,9 +13,14 @@ from ._bitstring_distribution import (
     save_bitstring_distribution,
     save_bitstring_distributions,
 )
+from ._prepared_target import PreparedTargetDistribution
 from .distance_measures import (
     compute_clipped_negative_log_likelihood,
+    compute_clipped_negative_log_likelihood_batch,
+    compute_jensen_shannon_divergence,
+    compute_jensen_shannon_divergence_batch,
     compute_mmd,
+    compute_mmd_batch,
     compute_multi_rbf_kernel,
     compute_rbf_kernel,
 )
@@ -8,7 +8,11 @@ from typing import Any, Callable, Dict, List
 import numpy as np
 
 from ..typing import AnyPath
-from ..utils import SCHEMA_VERSION
+from ..utils import (
+    SCHEMA_VERSION,
+    _convert_integers_to_bitstrings,
+    get_bit_reversal_permutation,
+)
 
 
 class BitstringDistribution:
@@ -260,18 +264,13 @@ def create_bitstring_distribution_from_probability_distribution(
         The BitstringDistribution object corresponding to the input measurements.
     """
 
-    # Create dictionary of bitstring tuples as keys with probability as value
-    prob_dict = {}
-    for state in range(len(prob_distribution)):
-        # Convert state to bitstring
-        bitstring = format(state, "b")
-        while len(bitstring) < np.log2(len(prob_distribution)):
-            bitstring = "0" + bitstring
-        # Reverse bitstring
-        bitstring = bitstring[::-1]
-
-        # Add to dict
-        prob_dict[bitstring] = prob_distribution[state]
+    # Bitstrings of the states are reversed, i.e. qubit 0 comes first
+    n_states = len(prob_distribution)
+    n_bits = max((n_states - 1).bit_length(), 1)
+    bitstrings = _convert_integers_to_bitstrings(
+        get_bit_reversal_permutation(n_bits)[:n_states], n_bits
+    )
+    prob_dict = dict(zip(bitstrings, prob_distribution))
 
     return BitstringDistribution(prob_dict)
 
@@ -286,6 +285,9 @@ def evaluate_distribution_distance(
     distribution and the one predicted (measured) by your model - based on the given
     distance measure.
 
+    To evaluate the distance of many distributions to the same target, use
+    PreparedTargetDistribution, which validates and indexes the target only once.
+
     Args:
          target_distribution: The target bitstring probability distribution
          measured_distribution: The measured bitstring probability distribution
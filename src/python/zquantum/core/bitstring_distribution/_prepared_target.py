@@ -0,0 +1,292 @@
+import math
+from typing import TYPE_CHECKING, Callable, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..utils import (
+    _convert_bitstrings_to_integers,
+    _convert_integers_to_bitstrings,
+    get_bit_reversal_permutation,
+)
+from ._bitstring_distribution import BitstringDistribution, is_normalized
+from .distance_measures import (
+    compute_clipped_negative_log_likelihood,
+    compute_jensen_shannon_divergence,
+    compute_mmd,
+)
+from .distance_measures.mmd import (
+    _compute_mmd_for_aligned_distributions,
+    _get_kernel_table,
+)
+
+if TYPE_CHECKING:
+    from ..measurement import Measurements
+
+# Kernel values of MMD are tabulated only for cutoffs below this distance.
+_MAX_KERNEL_TABLE_SIZE = 2 ** 20
+
+# Outcomes of more qubits are not reordered through a bit-reversal permutation, as
+# its size grows exponentially with the number of qubits.
+_MAX_BIT_REVERSAL_QUBITS = 16
+
+
+def _convert_outcomes_to_integers(outcomes: np.ndarray, n_qubits: int) -> np.ndarray:
+    """Convert measurement outcomes, in which qubit i is the i-th bit, to integers
+    obtained by reading their bitstrings as binary numbers, i.e. with qubit 0 being
+    the most significant bit.
+    """
+    outcomes = outcomes.astype(np.int64 if n_qubits <= 63 else object)
+    if n_qubits <= _MAX_BIT_REVERSAL_QUBITS:
+        return get_bit_reversal_permutation(n_qubits)[outcomes]
+    return _convert_bitstrings_to_integers(
+        bitstring[::-1]
+        for bitstring in _convert_integers_to_bitstrings(outcomes, n_qubits)
+    )
+
+
+class PreparedTargetDistribution:
+    """Target bitstring distribution prepared for evaluating its distance to many
+    measured distributions.
+
+    The target is validated, and its support indexed as sorted integer outcomes,
+    once. So are the tables needed by the distance measure: clipped logarithms of
+    the target probabilities for the (symmetrized) clipped negative log likelihood,
+    and kernel values for MMD. Each evaluation then takes time proportional to the
+    size of the supports instead of re-aligning bitstrings of both distributions.
+
+    Distance measures other than compute_clipped_negative_log_likelihood,
+    compute_jensen_shannon_divergence and compute_mmd are supported as well, but are
+    evaluated by calling the distance measure function.
+
+    Args:
+        target_distribution: The target bitstring probability distribution.
+        distance_measure_function: function used to calculate the distance measure.
+        Additional distance measure parameters can be passed as key word arguments,
+        like in evaluate_distribution_distance.
+    """
+
+    def __init__(
+        self,
+        target_distribution: BitstringDistribution,
+        distance_measure_function: Callable,
+        **kwargs,
+    ):
+        if not isinstance(target_distribution, BitstringDistribution):
+            raise TypeError("Target distribution must be a BitstringDistribution.")
+
+        self.target_distribution = target_distribution
+        self.distance_measure_function = distance_measure_function
+        self._kwargs = kwargs
+        self._parameters = kwargs.get("distance_measure_parameters", {})
+        self._is_normalized = is_normalized(target_distribution.distribution_dict)
+
+        outcomes, probabilities, n_qubits = self._get_outcomes_and_probabilities(
+            target_distribution
+        )
+        self._n_qubits = n_qubits
+        order = np.argsort(outcomes)
+        self._outcomes = outcomes[order]
+        self._probabilities = probabilities[order]
+
+        if distance_measure_function is compute_mmd:
+            self._kernel_table = _get_kernel_table(
+                self._parameters.get("sigma", 1.0), _MAX_KERNEL_TABLE_SIZE
+            )
+        elif distance_measure_function in (
+            compute_clipped_negative_log_likelihood,
+            compute_jensen_shannon_divergence,
+        ):
+            self._epsilon = self._parameters.get("epsilon", 1e-9)
+            self._clipped_log_probabilities = np.log(
+                np.maximum(self._epsilon, self._probabilities)
+            )
+
+    def _get_outcomes_and_probabilities(
+        self, distribution: Union[BitstringDistribution, "Measurements"]
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        from ..measurement import Measurements
+
+        if isinstance(distribution, BitstringDistribution):
+            distribution_dict = distribution.distribution_dict
+            if not distribution_dict:
+                raise ValueError("Bitstring distribution is empty.")
+            probabilities = np.fromiter(
+                distribution_dict.values(), dtype=float, count=len(distribution_dict)
+            )
+            outcomes = _convert_bitstrings_to_integers(distribution_dict.keys())
+            return outcomes, probabilities, distribution.get_qubits_number()
+        if isinstance(distribution, Measurements):
+            outcomes, counts, n_qubits = distribution.get_histogram()
+            if len(counts) == 0:
+                raise ValueError("Measurements are empty.")
+            return (
+                _convert_outcomes_to_integers(outcomes, n_qubits),
+                counts / np.sum(counts),
+                n_qubits,
+            )
+        raise TypeError(
+            "Measured distribution must be either a BitstringDistribution or "
+            "Measurements."
+        )
+
+    def _validate(
+        self, distribution: Union[BitstringDistribution, "Measurements"], n_qubits: int
+    ):
+        if n_qubits != self._n_qubits:
+            raise RuntimeError(
+                "Bitstring Distribution Distance Evaluation FAILED: target "
+                "and measured distributions are defined on bitstrings of different "
+                "length."
+            )
+        # Distributions estimated from measurements are normalized by construction.
+        if (
+            not isinstance(distribution, BitstringDistribution)
+            or is_normalized(distribution.distribution_dict)
+        ) != self._is_normalized:
+            raise RuntimeError(
+                "Bitstring Distribution Distance Evaluation FAILED: one among target "
+                "and measured distribution is normalized, whereas the other is not."
+            )
+
+    def _locate_in_target(self, outcomes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Get indices of the outcomes in the target support, and the mask of outcomes
+        that belong to it."""
+        indices = np.searchsorted(self._outcomes, outcomes)
+        indices[indices == len(self._outcomes)] = 0
+        return indices, self._outcomes[indices] == outcomes
+
+    def _evaluate_clipped_negative_log_likelihood(
+        self, candidate_indices, outcomes, probabilities, n_candidates
+    ) -> np.ndarray:
+        target_indices, in_target = self._locate_in_target(outcomes)
+        measured_probabilities = np.zeros((n_candidates, len(self._outcomes)))
+        measured_probabilities[
+            candidate_indices[in_target], target_indices[in_target]
+        ] = probabilities[in_target]
+        log_probabilities = np.log(np.maximum(self._epsilon, measured_probabilities))
+        return -log_probabilities.dot(self._probabilities)
+
+    def _evaluate_jensen_shannon_divergence(
+        self, candidate_indices, outcomes, probabilities, n_candidates
+    ) -> np.ndarray:
+        target_indices, in_target = self._locate_in_target(outcomes)
+        target_log_probabilities = np.where(
+            in_target,
+            self._clipped_log_probabilities[target_indices],
+            math.log(self._epsilon),
+        )
+        reversed_likelihood = -np.bincount(
+            candidate_indices,
+            weights=probabilities * target_log_probabilities,
+            minlength=n_candidates,
+        )
+        return (
+            self._evaluate_clipped_negative_log_likelihood(
+                candidate_indices, outcomes, probabilities, n_candidates
+            )
+            / 2
+            + reversed_likelihood / 2
+        )
+
+    def _evaluate_mmd(
+        self, candidate_indices, outcomes, probabilities, n_candidates
+    ) -> np.ndarray:
+        # Candidates are aligned with the target one by one, as aligning all of them
+        # at once would multiply the size of the common support by their number.
+        sections = np.cumsum(
+            [0, *np.bincount(candidate_indices, minlength=n_candidates)]
+        )
+        mmd = np.zeros(n_candidates)
+        for candidate_index in range(n_candidates):
+            start, stop = sections[candidate_index], sections[candidate_index + 1]
+            candidate_outcomes = outcomes[start:stop]
+            candidate_probabilities = probabilities[start:stop]
+            support, indices = np.unique(
+                np.concatenate([self._outcomes, candidate_outcomes]),
+                return_inverse=True,
+            )
+            indices = indices.ravel()
+            target_probabilities = np.zeros(len(support))
+            target_probabilities[indices[: len(self._outcomes)]] = self._probabilities
+            measured_probabilities = np.zeros(len(support))
+            measured_probabilities[
+                indices[len(self._outcomes) :]
+            ] = candidate_probabilities
+            mmd[candidate_index] = _compute_mmd_for_aligned_distributions(
+                support,
+                target_probabilities,
+                measured_probabilities,
+                self._parameters.get("sigma", 1.0),
+                self._kernel_table,
+            )[0]
+        return mmd
+
+    def evaluate(
+        self, measured_distribution: Union[BitstringDistribution, "Measurements"]
+    ) -> float:
+        """Evaluate the distance between the target and a measured distribution.
+
+        Args:
+            measured_distribution: The measured bitstring probability distribution,
+                or measurements from which it is estimated.
+
+        Returns:
+            The value of the distance measure.
+        """
+        return self.evaluate_batch([measured_distribution])[0]
+
+    def evaluate_batch(
+        self,
+        measured_distributions: Sequence[Union[BitstringDistribution, "Measurements"]],
+    ) -> np.ndarray:
+        """Evaluate the distance between the target and each measured distribution.
+
+        Args:
+            measured_distributions: The measured bitstring probability
+                distributions, or measurements from which they are estimated.
+
+        Returns:
+            The values of the distance measure, one per measured distribution.
+        """
+        all_outcomes = []
+        all_probabilities = []
+        for distribution in measured_distributions:
+            outcomes, probabilities, n_qubits = self._get_outcomes_and_probabilities(
+                distribution
+            )
+            self._validate(distribution, n_qubits)
+            all_outcomes.append(outcomes)
+            all_probabilities.append(probabilities)
+
+        evaluate = {
+            compute_clipped_negative_log_likelihood: (
+                self._evaluate_clipped_negative_log_likelihood
+            ),
+            compute_jensen_shannon_divergence: self._evaluate_jensen_shannon_divergence,
+            compute_mmd: self._evaluate_mmd,
+        }.get(self.distance_measure_function)
+
+        if evaluate is None:
+            return np.array(
+                [
+                    self.distance_measure_function(
+                        self.target_distribution,
+                        distribution
+                        if isinstance(distribution, BitstringDistribution)
+                        else distribution.get_distribution(),
+                        **self._kwargs,
+                    )
+                    for distribution in measured_distributions
+                ]
+            )
+
+        n_candidates = len(measured_distributions)
+        candidate_indices = np.repeat(
+            np.arange(n_candidates), [len(outcomes) for outcomes in all_outcomes]
+        )
+        return evaluate(
+            candidate_indices,
+            np.concatenate(all_outcomes) if all_outcomes else np.zeros(0, np.int64),
+            np.concatenate(all_probabilities) if all_probabilities else np.zeros(0),
+            n_candidates,
+        )
@@ -0,0 +1,46 @@
+from typing import TYPE_CHECKING, Sequence, Tuple
+
+import numpy as np
+
+from ...utils import _convert_bitstrings_to_integers
+
+if TYPE_CHECKING:
+    from zquantum.core.bitstring_distribution import BitstringDistribution
+
+
+def align_distributions(
+    distributions: Sequence["BitstringDistribution"],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Represent bitstring distributions as probabilities on their common support.
+
+    Args:
+        distributions: the distributions to align.
+
+    Returns:
+        Tuple of the sorted, unique integer outcomes (bitstrings read as binary
+        numbers) in the union of the supports of the distributions, and an array
+        with one row of probabilities of these outcomes per distribution.
+    """
+    outcomes = []
+    probabilities = []
+    for distribution in distributions:
+        distribution_dict = distribution.distribution_dict
+        outcomes.append(_convert_bitstrings_to_integers(distribution_dict.keys()))
+        probabilities.append(
+            np.fromiter(
+                distribution_dict.values(), dtype=float, count=len(distribution_dict)
+            )
+        )
+
+    support, indices = np.unique(
+        np.concatenate(outcomes) if outcomes else np.zeros(0, dtype=np.int64),
+        return_inverse=True,
+    )
+    rows = np.repeat(np.arange(len(outcomes)), [len(row) for row in outcomes])
+    aligned_probabilities = np.zeros((len(outcomes), len(support)))
+    np.add.at(
+        aligned_probabilities,
+        (rows, indices.ravel()),
+        np.concatenate(probabilities) if probabilities else np.zeros(0),
+    )
+    return support, aligned_probabilities
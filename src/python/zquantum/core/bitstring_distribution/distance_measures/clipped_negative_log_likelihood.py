@@ -1,10 +1,38 @@
-import math
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Sequence
+
+import numpy as np
+
+from ._alignment import align_distributions
 
 if TYPE_CHECKING:
     from zquantum.core.bitstring_distribution import BitstringDistribution
 
 
+def _compute_clipped_negative_log_likelihood_for_aligned_distributions(
+    target_probabilities: np.ndarray,
+    measured_probabilities: np.ndarray,
+    epsilon: float,
+) -> np.ndarray:
+    """Compute the clipped negative log likelihood between a target and measured
+    distributions given as probabilities of the same outcomes.
+
+    Args:
+        target_probabilities: probabilities of the outcomes in the target.
+        measured_probabilities: probabilities of the outcomes, one row per measured
+            distribution.
+        epsilon: The small parameter needed to regularize log computation when
+            argument is zero.
+
+    Returns:
+        The value of the clipped negative log likelihood for each measured
+        distribution.
+    """
+    log_probabilities = np.log(
+        np.maximum(epsilon, np.atleast_2d(measured_probabilities))
+    )
+    return -log_probabilities.dot(target_probabilities)
+
+
 def compute_clipped_negative_log_likelihood(
     target_distribution: "BitstringDistribution",
     measured_distribution: "BitstringDistribution",
@@ -24,21 +52,34 @@ def compute_clipped_negative_log_likelihood(
     Returns:
         The value of the clipped negative log likelihood
     """
+    return compute_clipped_negative_log_likelihood_batch(
+        target_distribution, [measured_distribution], distance_measure_parameters
+    )[0]
 
+
+def compute_clipped_negative_log_likelihood_batch(
+    target_distribution: "BitstringDistribution",
+    measured_distributions: Sequence["BitstringDistribution"],
+    distance_measure_parameters: Dict,
+) -> np.ndarray:
+    """Compute the clipped negative log likelihood between a target bitstring
+    distribution and each of the measured bitstring distributions.
+
+    Args:
+        target_distribution: The target bitstring probability distribution.
+        measured_distributions: The measured bitstring probability distributions.
+        distance_measure_parameters:
+            epsilon (float): The small parameter needed to regularize log computation
+                when argument is zero. The default value is 1e-9.
+
+    Returns:
+        The values of the clipped negative log likelihood, one per measured
+        distribution.
+    """
     epsilon = distance_measure_parameters.get("epsilon", 1e-9)
-    value = 0.0
-    target_keys = target_distribution.distribution_dict.keys()
-    measured_keys = measured_distribution.distribution_dict.keys()
-    all_keys = set(target_keys).union(measured_keys)
-
-    for bitstring in all_keys:
-        target_bitstring_value = target_distribution.distribution_dict.get(bitstring, 0)
-        measured_bitstring_value = measured_distribution.distribution_dict.get(
-            bitstring, 0
-        )
-
-        value += target_bitstring_value * math.log(
-            max(epsilon, measured_bitstring_value)
-        )
-
-    return -value
+    _, probabilities = align_distributions(
+        [target_distribution, *measured_distributions]
+    )
+    return _compute_clipped_negative_log_likelihood_for_aligned_distributions(
+        probabilities[0], probabilities[1:], epsilon
+    )
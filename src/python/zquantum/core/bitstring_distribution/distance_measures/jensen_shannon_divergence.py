@@ -1,11 +1,46 @@
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Sequence
 
-from .clipped_negative_log_likelihood import compute_clipped_negative_log_likelihood
+import numpy as np
+
+from ._alignment import align_distributions
+from .clipped_negative_log_likelihood import (
+    _compute_clipped_negative_log_likelihood_for_aligned_distributions,
+)
 
 if TYPE_CHECKING:
     from zquantum.core.bitstring_distribution import BitstringDistribution
 
 
+def _compute_jensen_shannon_divergence_for_aligned_distributions(
+    target_probabilities: np.ndarray,
+    measured_probabilities: np.ndarray,
+    epsilon: float,
+) -> np.ndarray:
+    """Compute the symmetrized clipped negative log likelihood between a target and
+    measured distributions given as probabilities of the same outcomes.
+
+    Args:
+        target_probabilities: probabilities of the outcomes in the target.
+        measured_probabilities: probabilities of the outcomes, one row per measured
+            distribution.
+        epsilon: The small parameter needed to regularize log computation when
+            argument is zero.
+
+    Returns:
+        The value of the symmetrized clipped negative log likelihood for each
+        measured distribution.
+    """
+    measured_probabilities = np.atleast_2d(measured_probabilities)
+    target_log_probabilities = np.log(np.maximum(epsilon, target_probabilities))
+    return (
+        _compute_clipped_negative_log_likelihood_for_aligned_distributions(
+            target_probabilities, measured_probabilities, epsilon
+        )
+        / 2
+        - measured_probabilities.dot(target_log_probabilities) / 2
+    )
+
+
 def compute_jensen_shannon_divergence(
     target_distribution: "BitstringDistribution",
     measured_distribution: "BitstringDistribution",
@@ -26,16 +61,37 @@ def compute_jensen_shannon_divergence(
     Returns:
         float: The value of the symmetrized version
     """
+    return compute_jensen_shannon_divergence_batch(
+        target_distribution, [measured_distribution], distance_measure_parameters
+    )[0]
 
-    value = (
-        compute_clipped_negative_log_likelihood(
-            target_distribution, measured_distribution, distance_measure_parameters
-        )
-        / 2
-        + compute_clipped_negative_log_likelihood(
-            measured_distribution, target_distribution, distance_measure_parameters
-        )
-        / 2
-    )
 
-    return value
+def compute_jensen_shannon_divergence_batch(
+    target_distribution: "BitstringDistribution",
+    measured_distributions: Sequence["BitstringDistribution"],
+    distance_measure_parameters: Dict,
+) -> np.ndarray:
+    """Computes the symmetrized version of the clipped negative log likelihood between
+    a target bitstring distribution and each of the measured bitstring distributions.
+
+    The distributions are aligned on their common support once, and both directions
+    of the clipped negative log likelihood are computed from the aligned
+    probabilities.
+
+    Args:
+        target_distribution: The target bitstring probability distribution.
+        measured_distributions: The measured bitstring probability distributions.
+        distance_measure_parameters:
+            epsilon (float): The small parameter needed to regularize log computation
+            when argument is zero. The default value is 1e-9.
+
+    Returns:
+        The values of the symmetrized version, one per measured distribution.
+    """
+    epsilon = distance_measure_parameters.get("epsilon", 1e-9)
+    _, probabilities = align_distributions(
+        [target_distribution, *measured_distributions]
+    )
+    return _compute_jensen_shannon_divergence_for_aligned_distributions(
+        probabilities[0], probabilities[1:], epsilon
+    )
@@ -23,10 +23,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import TYPE_CHECKING, Dict, List, Sequence, Union
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Sequence, Union
 
 import numpy as np
 
+from ._alignment import align_distributions
+
 if TYPE_CHECKING:
     from zquantum.core.bitstring_distribution import BitstringDistribution
 
@@ -82,6 +85,160 @@ def compute_multi_rbf_kernel(
     return kernel_matrix / len(sigmas)
 
 
+# exp(-x) is exactly 0.0 in double precision for x > 745.2, so kernel values of
+# outcomes further apart than sqrt(_KERNEL_UNDERFLOW_EXPONENT / gamma) vanish.
+_KERNEL_UNDERFLOW_EXPONENT = 746.0
+
+# Longest FFT used to compute the histogram of distances between outcomes.
+_MAX_FFT_LENGTH = 2 ** 24
+
+
+def _get_gammas(sigma: Union[float, Sequence[float]]) -> np.ndarray:
+    sigmas = np.array(sigma if hasattr(sigma, "__len__") else [sigma], dtype=float)
+    if np.any(sigmas == 0):
+        raise ValueError("sigma must be non-zero")
+    return 1.0 / (2 * sigmas)
+
+
+def _get_kernel_values(distances: np.ndarray, gammas: np.ndarray) -> np.ndarray:
+    """Evaluate the (multi-)gaussian kernel of outcomes the given distance apart."""
+    squared_distances = np.asarray(distances, dtype=float) ** 2
+    return np.exp(-gammas[:, None] * squared_distances).mean(axis=0)
+
+
+def _get_kernel_cutoff(gammas: np.ndarray) -> float:
+    """Distance beyond which the (multi-)gaussian kernel is exactly zero."""
+    if np.any(gammas <= 0):
+        return np.inf
+    return np.floor(np.sqrt(_KERNEL_UNDERFLOW_EXPONENT / np.min(gammas)))
+
+
+def _get_kernel_table(
+    sigma: Union[float, Sequence[float]], max_size: int
+) -> Optional[np.ndarray]:
+    """Tabulate the kernel at distances 0, 1, ... up to the kernel cutoff, unless the
+    table would be longer than max_size.
+    """
+    gammas = _get_gammas(sigma)
+    cutoff = _get_kernel_cutoff(gammas)
+    if cutoff >= max_size:
+        return None
+    kernel_table = _get_kernel_values(np.arange(int(cutoff) + 1), gammas)
+    kernel_table.setflags(write=False)
+    return kernel_table
+
+
+def _compute_banded_mmd(
+    outcomes: np.ndarray,
+    differences: np.ndarray,
+    kernel: Callable[[np.ndarray], np.ndarray],
+    max_distance,
+) -> np.ndarray:
+    """Sum the kernel over pairs of outcomes at most max_distance apart.
+
+    Outcomes have to be sorted and unique, so that the distance between the i-th and
+    the (i + shift)-th outcome grows with the shift. Pairs are visited one shift at a
+    time, hence the memory used is linear in the number of outcomes.
+    """
+    mmd = np.einsum("ij,ij->i", differences, differences)
+    for shift in range(1, len(outcomes)):
+        distances = outcomes[shift:] - outcomes[:-shift]
+        in_range = distances <= max_distance
+        if not np.any(in_range):
+            break
+        if np.all(in_range):
+            products = differences[:, shift:] * differences[:, :-shift]
+        else:
+            distances = distances[in_range]
+            products = (
+                differences[:, shift:][:, in_range]
+                * differences[:, :-shift][:, in_range]
+            )
+        mmd = mmd + 2 * products.dot(kernel(distances))
+    return mmd
+
+
+def _compute_mmd_from_distance_histogram(
+    outcomes: np.ndarray,
+    differences: np.ndarray,
+    kernel: Callable[[np.ndarray], np.ndarray],
+    max_distance: int,
+    fft_length: int,
+) -> np.ndarray:
+    """Compute MMD from the histogram of distances between outcomes.
+
+    The kernel depends only on the distance d = |x - y| of outcomes, so the MMD is
+    sum_d k(d) h(d), where h(d) sums products of differences of all pairs of outcomes
+    d apart. The histogram is the autocorrelation of the differences laid out on the
+    range of outcomes, computed with FFT in time independent of the number of
+    sigmas.
+    """
+    positions = (outcomes - outcomes[0]).astype(np.int64)
+    kernel_values = np.array(kernel(np.arange(max_distance + 1)))
+    kernel_values[1:] *= 2
+    mmd = np.zeros(len(differences))
+    for row, row_differences in enumerate(differences):
+        spectrum = np.fft.rfft(
+            np.bincount(positions, weights=row_differences), fft_length
+        )
+        histogram = np.fft.irfft(np.abs(spectrum) ** 2, fft_length)
+        mmd[row] = histogram[: max_distance + 1].dot(kernel_values)
+    return mmd
+
+
+def _compute_mmd_for_aligned_distributions(
+    outcomes: np.ndarray,
+    target_probabilities: np.ndarray,
+    measured_probabilities: np.ndarray,
+    sigma: Union[float, Sequence[float]],
+    kernel_table: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Compute MMD between a target and measured distributions on common support.
+
+    Args:
+        outcomes: sorted, unique integer outcomes of the common support.
+        target_probabilities: probabilities of the outcomes in the target.
+        measured_probabilities: probabilities of the outcomes, one row per measured
+            distribution.
+        sigma: bandwidth(s) of the gaussian kernel.
+        kernel_table: optional values of the kernel for the given sigma, as returned
+            by _get_kernel_table, used instead of evaluating the kernel.
+
+    Returns:
+        The value of MMD for each measured distribution.
+    """
+    gammas = _get_gammas(sigma)
+    if kernel_table is None:
+        kernel = partial(_get_kernel_values, gammas=gammas)
+    else:
+
+        def kernel(distances):
+            return kernel_table[np.asarray(distances, dtype=np.int64)]
+
+    differences = np.atleast_2d(target_probabilities - measured_probabilities)
+    n_outcomes = len(outcomes)
+    if n_outcomes == 0:
+        return np.zeros(len(differences))
+
+    span = outcomes[-1] - outcomes[0]
+    cutoff = _get_kernel_cutoff(gammas)
+    max_distance = span if cutoff >= span else int(cutoff)
+
+    # The banded sum visits at most n_outcomes * min(n_outcomes - 1, max_distance)
+    # pairs, which for dense supports is more than the cost of the FFT.
+    if outcomes.dtype != object:
+        fft_length = 1 << int(span + max_distance).bit_length()
+        n_pairs = n_outcomes * min(n_outcomes - 1, max_distance)
+        if (
+            fft_length <= _MAX_FFT_LENGTH
+            and fft_length * fft_length.bit_length() < n_pairs
+        ):
+            return _compute_mmd_from_distance_histogram(
+                outcomes, differences, kernel, int(max_distance), fft_length
+            )
+    return _compute_banded_mmd(outcomes, differences, kernel, max_distance)
+
+
 def compute_mmd(
     target_distribution: "BitstringDistribution",
     measured_distribution: "BitstringDistribution",
@@ -102,26 +259,37 @@ def compute_mmd(
         Returns:
             The value of the maximum mean discrepancy.
     """
+    return compute_mmd_batch(
+        target_distribution, [measured_distribution], distance_measure_parameters
+    )[0]
 
-    sigma = distance_measure_parameters.get("sigma", 1.0)
-    target_keys = target_distribution.distribution_dict.keys()
-    measured_keys = measured_distribution.distribution_dict.keys()
-    all_keys = set(target_keys).union(measured_keys)
-
-    target_values = []
-    measured_values = []
-    for bitstring in all_keys:
-        # Add 0 to the values list whenever a bistrings isn't found among the keys.
-        target_values.append(target_distribution.distribution_dict.get(bitstring, 0))
-        measured_values.append(
-            measured_distribution.distribution_dict.get(bitstring, 0)
-        )
 
-    basis = np.asarray([int(item, 2) for item in all_keys])  # bitstring to int
-    if not hasattr(sigma, "__len__"):
-        kernel_matrix = compute_rbf_kernel(basis, basis, sigma)
-    else:
-        kernel_matrix = compute_multi_rbf_kernel(basis, basis, sigma)
+def compute_mmd_batch(
+    target_distribution: "BitstringDistribution",
+    measured_distributions: Sequence["BitstringDistribution"],
+    distance_measure_parameters: Dict,
+) -> np.ndarray:
+    """Compute the squared Maximum Mean Discrepancy (MMD) between a target bitstring
+    distribution and each of the measured bitstring distributions.
 
-    diff = np.array(target_values) - np.array(measured_values)
-    return diff.dot(kernel_matrix.dot(diff))
+    Kernel values are only evaluated for pairs of outcomes close enough for the
+    gaussian kernel not to vanish, so memory doesn't grow with the square of the
+    size of the support.
+
+    Args:
+        target_distribution: The target bitstring probability distribution.
+        measured_distributions: The measured bitstring probability distributions.
+        distance_measure_parameters:
+            sigma (float/np.array): the bandwidth parameter used to compute the
+                single/multi gaussian kernel. The default value is 1.0.
+
+    Returns:
+        The values of the maximum mean discrepancy, one per measured distribution.
+    """
+    sigma = distance_measure_parameters.get("sigma", 1.0)
+    outcomes, probabilities = align_distributions(
+        [target_distribution, *measured_distributions]
+    )
+    return _compute_mmd_for_aligned_distributions(
+        outcomes, probabilities[0], probabilities[1:], sigma
+    )
@@ -113,6 +113,7 @@ Extending built-in gates requires:
     same name defined in PyQuil our converters will use it by default without need for
     explicit mappings.
 """
+import importlib
 
 from ._builtin_gates import (
     CNOT,
@@ -162,6 +163,26 @@ from ._serde import (
 )
 from ._testing import create_random_circuit
 from ._wavefunction_operations import MultiPhaseOperation
-from .conversions.cirq_conversions import export_to_cirq, import_from_cirq
-from .conversions.pyquil_conversions import export_to_pyquil, import_from_pyquil
-from .conversions.qiskit_conversions import export_to_qiskit, import_from_qiskit
+
+# Conversions are imported on first use, so that importing circuits doesn't import
+# Cirq, PyQuil and Qiskit.
+_LAZY_ATTRIBUTES = {
+    "export_to_cirq": ".conversions.cirq_conversions",
+    "import_from_cirq": ".conversions.cirq_conversions",
+    "export_to_pyquil": ".conversions.pyquil_conversions",
+    "import_from_pyquil": ".conversions.pyquil_conversions",
+    "export_to_qiskit": ".conversions.qiskit_conversions",
+    "import_from_qiskit": ".conversions.qiskit_conversions",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
@@ -1,10 +1,23 @@
 """Zquantum <-> Cirq conversions."""
 import hashlib
+from collections.abc import Hashable
 from dataclasses import dataclass
 from functools import singledispatch
 from itertools import chain
 from operator import attrgetter
-from typing import Callable, Dict, Type, Union, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
 
 import cirq
 import numpy as np
@@ -238,9 +251,7 @@ def _export_gate_operation_to_cirq(
 
 @_export_to_cirq.register
 def _export_circuit_to_cirq(circuit: _circuit.Circuit) -> cirq.Circuit:
-    return cirq.Circuit(
-        [_export_to_cirq(operation) for operation in circuit.operations]
-    )
+    return CirqConverter().export_circuit(circuit)
 
 
 def import_from_cirq(obj):
@@ -336,9 +347,25 @@ def _gen_custom_gate_name(gate_cls, matrix: np.ndarray):
     return f"{gate_cls.__name__}.{matrix_hash}"
 
 
-@_import_from_cirq.register(cirq.GateOperation)
-@_import_from_cirq.register(cirq.ControlledOperation)
-def _convert_gate_operation_to_zquantum(operation) -> _gates.GateOperation:
+def _define_custom_gate(
+    non_native_gate: NonNativeGate,
+    custom_gate_definitions: Dict[Tuple, _gates.CustomGateDefinition],
+) -> _gates.CustomGateDefinition:
+    matrix = non_native_gate.matrix
+    key = (non_native_gate.cirq_class, matrix.shape, matrix.dtype, matrix.tobytes())
+    custom_gate = custom_gate_definitions.get(key)
+    if custom_gate is None:
+        custom_gate = custom_gate_definitions[key] = _gates.CustomGateDefinition(
+            gate_name=_gen_custom_gate_name(non_native_gate.cirq_class, matrix),
+            matrix=sympy.Matrix(matrix),
+            params_ordering=(),
+        )
+    return custom_gate
+
+
+def _import_gate_operation(
+    operation, custom_gate_definitions: Dict[Tuple, _gates.CustomGateDefinition]
+) -> _gates.GateOperation:
     if not all(isinstance(qubit, cirq.LineQubit) for qubit in operation.qubits):
         raise NotImplementedError(
             f"Failed to import {operation}. Grid qubits are not yet supported."
@@ -348,20 +375,137 @@ def _convert_gate_operation_to_zquantum(operation) -> _gates.GateOperation:
     qubit_indices = map(qubit_index, operation.qubits)
 
     if isinstance(imported_gate, NonNativeGate):
-        custom_gate = _gates.CustomGateDefinition(
-            gate_name=_gen_custom_gate_name(
-                imported_gate.cirq_class, imported_gate.matrix
-            ),
-            matrix=sympy.Matrix(imported_gate.matrix),
-            params_ordering=(),
-        )
+        custom_gate = _define_custom_gate(imported_gate, custom_gate_definitions)
         return custom_gate()(*qubit_indices)
     else:
         return imported_gate(*qubit_indices)
 
 
+@_import_from_cirq.register(cirq.GateOperation)
+@_import_from_cirq.register(cirq.ControlledOperation)
+def _convert_gate_operation_to_zquantum(operation) -> _gates.GateOperation:
+    return _import_gate_operation(operation, {})
+
+
 @_import_from_cirq.register
 def _import_circuit_from_cirq(circuit: cirq.Circuit) -> _circuit.Circuit:
-    return _circuit.Circuit(
-        [_import_from_cirq(op) for op in chain.from_iterable(circuit.moments)]
-    )
+    return CirqConverter().import_circuit(circuit)
+
+
+def _gate_translation_key(gate: _gates.Gate) -> Optional[Hashable]:
+    """Key identifying translation of a gate to Cirq, or None if it is not memoized.
+
+    Parameters are keyed together with their types, so that e.g. gates with sympy and
+    native float parameters, which are exported differently, don't share a key.
+    """
+    if isinstance(gate, _gates.MatrixFactoryGate):
+        params = tuple((type(param), param) for param in gate.params)
+        return (
+            (gate.name, params)
+            if all(isinstance(param, Hashable) for param in gate.params)
+            else None
+        )
+    if isinstance(gate, _gates.ControlledGate):
+        wrapped_key = _gate_translation_key(gate.wrapped_gate)
+        return (
+            None
+            if wrapped_key is None
+            else (gate.name, gate.num_control_qubits, wrapped_key)
+        )
+    if isinstance(gate, _gates.Dagger):
+        wrapped_key = _gate_translation_key(gate.wrapped_gate)
+        return None if wrapped_key is None else (gate.name, wrapped_key)
+    return None
+
+
+class CirqConverter:
+    """Converter between ZQuantum and Cirq circuits reusing translations of gates.
+
+    Translations are memoized per converter, so that gates repeated across converted
+    circuits are translated once. Keeping a converter around, e.g. in a backend
+    executing many similar circuits, amortizes this work over all of them:
+
+    - exported gates are keyed on the gate name and parameters (and, for controlled
+      gates and daggers, on the wrapped gate),
+    - custom gate definitions of imported gates without ZQuantum counterparts are
+      keyed on the class and unitary of the Cirq gate.
+
+    Parametrized circuits are exported once, with sympy symbols as parameters, and
+    bound by resolving these symbols with cirq.ParamResolver.
+    """
+
+    def __init__(self):
+        self._exported_gates: Dict[Hashable, cirq.Gate] = {}
+        self._custom_gate_definitions: Dict[Tuple, _gates.CustomGateDefinition] = {}
+
+    def export_gate(self, gate: _gates.Gate) -> cirq.Gate:
+        """Export ZQuantum gate to its Cirq equivalent, see export_to_cirq."""
+        key = _gate_translation_key(gate)
+        if key is None:
+            return _export_to_cirq(gate)
+        exported_gate = self._exported_gates.get(key)
+        if exported_gate is None:
+            exported_gate = self._exported_gates[key] = _export_to_cirq(gate)
+        return exported_gate
+
+    def export_circuit(self, circuit: _circuit.Circuit) -> cirq.Circuit:
+        """Export ZQuantum circuit to its Cirq equivalent, see export_to_cirq."""
+        return cirq.Circuit(
+            [
+                self.export_gate(operation.gate)(
+                    *map(cirq.LineQubit, operation.qubit_indices)
+                )
+                if isinstance(operation, _gates.GateOperation)
+                else _export_to_cirq(operation)
+                for operation in circuit.operations
+            ]
+        )
+
+    def export_circuitset(
+        self, circuits: Iterable[_circuit.Circuit]
+    ) -> List[cirq.Circuit]:
+        """Export ZQuantum circuits to their Cirq equivalents, sharing translations of
+        gates between them."""
+        return [self.export_circuit(circuit) for circuit in circuits]
+
+    def export_bound_circuits(
+        self,
+        circuit: _circuit.Circuit,
+        symbols_maps: Sequence[Dict[sympy.Symbol, Any]],
+    ) -> List[cirq.Circuit]:
+        """Export parametrized ZQuantum circuit bound to each of given symbols maps.
+
+        The circuit is exported once, and its parameters are bound by resolving
+        symbols of the exported circuit instead of binding and exporting the circuit
+        for each symbols map.
+
+        Args:
+            circuit: circuit to export.
+            symbols_maps: maps of the symbols of the circuit to their values.
+
+        Returns:
+            Cirq circuits corresponding to the circuit bound to each symbols map.
+        """
+        exported_circuit = self.export_circuit(circuit)
+        return [
+            cirq.resolve_parameters(exported_circuit, cirq.ParamResolver(symbols_map))
+            for symbols_map in symbols_maps
+        ]
+
+    def import_circuit(self, circuit: cirq.Circuit) -> _circuit.Circuit:
+        """Import Cirq circuit, converting it to its ZQuantum counterpart, see
+        import_from_cirq."""
+        return _circuit.Circuit(
+            [
+                _import_gate_operation(operation, self._custom_gate_definitions)
+                if isinstance(operation, (cirq.GateOperation, cirq.ControlledOperation))
+                else _import_from_cirq(operation)
+                for operation in chain.from_iterable(circuit.moments)
+            ]
+        )
+
+    def import_circuitset(
+        self, circuits: Iterable[cirq.Circuit]
+    ) -> List[_circuit.Circuit]:
+        """Import Cirq circuits, sharing custom gate definitions between them."""
+        return [self.import_circuit(circuit) for circuit in circuits]
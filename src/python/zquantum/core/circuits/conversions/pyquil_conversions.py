@@ -1,5 +1,5 @@
 from functools import singledispatch
-from typing import Iterable, Mapping, Tuple, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 import numpy as np
 import pyquil
@@ -8,7 +8,7 @@ import sympy
 from .. import _builtin_gates, _circuit, _gates
 from ..symbolic.pyquil_expressions import QUIL_DIALECT, expression_from_pyquil
 from ..symbolic.sympy_expressions import SYMPY_DIALECT, expression_from_sympy
-from ..symbolic.translations import translate_expression
+from ..symbolic.translations import ExpressionTranslator
 
 
 def _n_qubits_by_ops(ops: Iterable[_gates.GateOperation]):
@@ -18,12 +18,25 @@ def _n_qubits_by_ops(ops: Iterable[_gates.GateOperation]):
         return 0
 
 
+# Dialect in which symbols are read from declared memory regions, instead of being
+# formal parameters of gate definitions.
+QUIL_MEMORY_DIALECT = QUIL_DIALECT._replace(
+    symbol_factory=lambda symbol: pyquil.quilatom.MemoryReference(symbol.name)
+)
+
+_SYMPY_TRANSLATOR = ExpressionTranslator(SYMPY_DIALECT)
+_QUIL_TRANSLATOR = ExpressionTranslator(QUIL_DIALECT)
+_QUIL_MEMORY_TRANSLATOR = ExpressionTranslator(QUIL_MEMORY_DIALECT)
+
+
 def _import_expression(pyquil_expr):
-    return translate_expression(expression_from_pyquil(pyquil_expr), SYMPY_DIALECT)
+    return _SYMPY_TRANSLATOR(expression_from_pyquil(pyquil_expr))
 
 
-def _export_expression(expr: sympy.Expr):
-    return translate_expression(expression_from_sympy(expr), QUIL_DIALECT)
+def _export_expression(
+    expr: sympy.Expr, translator: ExpressionTranslator = _QUIL_TRANSLATOR
+):
+    return translator(expression_from_sympy(expr))
 
 
 def _import_matrix(pyquil_matrix: np.ndarray):
@@ -136,15 +149,35 @@ def _import_pyquil_qubits(qubits):
     return tuple(qubit.index for qubit in qubits)
 
 
+def _export_gate_def(gate_def: _gates.CustomGateDefinition) -> pyquil.quil.DefGate:
+    pyquil_params = list(map(_export_expression, gate_def.params_ordering))
+    return pyquil.quil.DefGate(
+        gate_def.gate_name, _export_matrix(gate_def.matrix), pyquil_params
+    )
+
+
+ExportedGateDefs = Dict[str, Tuple[_gates.CustomGateDefinition, pyquil.quil.DefGate]]
+
+
 def _assign_custom_defs(
-    program: pyquil.Program, custom_gate_defs: Iterable[_gates.CustomGateDefinition]
+    program: pyquil.Program,
+    custom_gate_defs: Iterable[_gates.CustomGateDefinition],
+    exported_gate_defs: Optional[ExportedGateDefs] = None,
 ):
-    """Mutates `program` to assign ZQuantum custom gate definitions"""
+    """Mutates `program` to assign ZQuantum custom gate definitions.
+
+    Definitions found in `exported_gate_defs` are reused instead of being exported
+    again, and newly exported ones are added to it.
+    """
+    exported_gate_defs = {} if exported_gate_defs is None else exported_gate_defs
     for gate_def in custom_gate_defs:
-        pyquil_params = list(map(_export_expression, gate_def.params_ordering))
-        program.defgate(
-            gate_def.gate_name, _export_matrix(gate_def.matrix), pyquil_params
-        )
+        exported = exported_gate_defs.get(gate_def.gate_name)
+        if exported is None or exported[0] != gate_def:
+            exported = exported_gate_defs[gate_def.gate_name] = (
+                gate_def,
+                _export_gate_def(gate_def),
+            )
+        program.inst(exported[1])
 
 
 @singledispatch
@@ -192,6 +225,14 @@ def _collect_unsupported_builtin_gate_defs(gates: Iterable[_gates.Gate]):
 
 
 def export_to_pyquil(circuit: _circuit.Circuit) -> pyquil.Program:
+    return _export_to_pyquil(circuit, _QUIL_TRANSLATOR)
+
+
+def _export_to_pyquil(
+    circuit: _circuit.Circuit,
+    translator: ExpressionTranslator,
+    exported_gate_defs: Optional[ExportedGateDefs] = None,
+) -> pyquil.Program:
     var_declarations = map(_param_declaration, sorted(map(str, circuit.free_symbols)))
     custom_gate_definitions = [
         *circuit.collect_custom_gate_definitions(),
@@ -199,63 +240,152 @@ def export_to_pyquil(circuit: _circuit.Circuit) -> pyquil.Program:
     ]
     custom_gate_names = {gate_def.gate_name for gate_def in custom_gate_definitions}
     gate_instructions = [
-        _export_gate(op.gate, op.qubit_indices, custom_gate_names)
+        _export_gate(op.gate, op.qubit_indices, custom_gate_names, translator)
         for op in circuit.operations
     ]
     program = pyquil.Program(*[*var_declarations, *gate_instructions])
-    _assign_custom_defs(program, custom_gate_definitions)
+    _assign_custom_defs(program, custom_gate_definitions, exported_gate_defs)
     return program
 
 
+class PyQuilProgramTemplate:
+    """Parametrized circuit exported once to a PyQuil program reading its parameters
+    from declared memory.
+
+    Each free symbol of the circuit is declared as a REAL memory region of the same
+    name, and gate parameters are expressions of these regions. Executing the program
+    for new parameter values only requires writing them to memory, e.g. by passing
+    `memory_map(symbols_map)` to `QuantumComputer.run` or writing them to a compiled
+    executable, so the program doesn't have to be exported or compiled again.
+
+    Args:
+        circuit: parametrized circuit to export.
+
+    Attributes:
+        symbols: free symbols of the circuit, sorted by their names like the memory
+            declarations of the program.
+        program: exported PyQuil program.
+    """
+
+    def __init__(
+        self,
+        circuit: _circuit.Circuit,
+        _exported_gate_defs: Optional[ExportedGateDefs] = None,
+    ):
+        self.symbols = sorted(circuit.free_symbols, key=str)
+        self.program = _export_to_pyquil(
+            circuit, _QUIL_MEMORY_TRANSLATOR, _exported_gate_defs
+        )
+
+    @classmethod
+    def for_circuitset(
+        cls, circuits: Iterable[_circuit.Circuit]
+    ) -> List["PyQuilProgramTemplate"]:
+        """Export templates of each circuit, exporting gate definitions shared by
+        the circuits only once."""
+        exported_gate_defs: ExportedGateDefs = {}
+        return [cls(circuit, exported_gate_defs) for circuit in circuits]
+
+    def memory_map(
+        self, symbols_map: Mapping[sympy.Symbol, Any]
+    ) -> Dict[str, List[float]]:
+        """Map memory regions of the program to values of the corresponding symbols.
+
+        Args:
+            symbols_map: values of all free symbols of the circuit.
+
+        Returns:
+            Memory map assigning a single value to each declared region.
+        """
+        return {str(symbol): [float(symbols_map[symbol])] for symbol in self.symbols}
+
+    def memory_maps(self, parameter_values: np.ndarray) -> List[Dict[str, List[float]]]:
+        """Get memory maps for each row of parameter values.
+
+        Args:
+            parameter_values: array of shape (number of executions, number of symbols)
+                of values of the symbols, ordered like `symbols`.
+
+        Returns:
+            Memory maps, one per row of values.
+        """
+        parameter_values = np.asarray(parameter_values, dtype=float)
+        if parameter_values.ndim != 2 or parameter_values.shape[1] != len(self.symbols):
+            raise ValueError(
+                f"Expected values of {len(self.symbols)} symbols for each execution, "
+                f"got array of shape {parameter_values.shape}."
+            )
+        names = [str(symbol) for symbol in self.symbols]
+        return [
+            {name: [value] for name, value in zip(names, values)}
+            for values in parameter_values.tolist()
+        ]
+
+
 def _param_declaration(param_name: str):
     return pyquil.quil.Declare(param_name, "REAL")
 
 
 @singledispatch
-def _export_gate(gate: _gates.Gate, qubit_indices, custom_gate_names):
+def _export_gate(
+    gate: _gates.Gate, qubit_indices, custom_gate_names, translator=_QUIL_TRANSLATOR
+):
     try:
-        return _export_gate_via_name(gate, qubit_indices, custom_gate_names)
+        return _export_gate_via_name(gate, qubit_indices, custom_gate_names, translator)
     except ValueError:
         pass
 
-    return _export_custom_gate(gate, qubit_indices, custom_gate_names)
+    return _export_custom_gate(gate, qubit_indices, custom_gate_names, translator)
 
 
-def _export_custom_gate(gate: _gates.Gate, qubit_indices, custom_gate_names):
+def _export_custom_gate(
+    gate: _gates.Gate, qubit_indices, custom_gate_names, translator=_QUIL_TRANSLATOR
+):
     if gate.name not in custom_gate_names:
         raise ValueError(
             f"Can't export {gate} as custom gate, custom gate definition is missing"
         )
-    pyquil_params = list(map(_export_expression, gate.params))
+    pyquil_params = [_export_expression(param, translator) for param in gate.params]
     return (gate.name, pyquil_params) + qubit_indices
 
 
 @_export_gate.register
 def _export_controlled_gate(
-    gate: _gates.ControlledGate, qubit_indices, custom_gate_names
+    gate: _gates.ControlledGate,
+    qubit_indices,
+    custom_gate_names,
+    translator=_QUIL_TRANSLATOR,
 ):
     wrapped_qubit_indices = qubit_indices[gate.num_control_qubits :]
     control_qubit_indices = qubit_indices[0 : gate.num_control_qubits]
-    exported = _export_gate(gate.wrapped_gate, wrapped_qubit_indices, custom_gate_names)
+    exported = _export_gate(
+        gate.wrapped_gate, wrapped_qubit_indices, custom_gate_names, translator
+    )
     for index in reversed(control_qubit_indices):
         exported = exported.controlled(index)
     return exported
 
 
 @_export_gate.register
-def _export_dagger(gate: _gates.Dagger, qubit_indices, custom_gate_names):
-    return _export_gate(gate.wrapped_gate, qubit_indices, custom_gate_names).dagger()
+def _export_dagger(
+    gate: _gates.Dagger, qubit_indices, custom_gate_names, translator=_QUIL_TRANSLATOR
+):
+    return _export_gate(
+        gate.wrapped_gate, qubit_indices, custom_gate_names, translator
+    ).dagger()
 
 
 def _pyquil_gate_by_name(name):
     return getattr(pyquil.gates, name)
 
 
-def _export_gate_via_name(gate: _gates.Gate, qubit_indices, custom_gate_names):
+def _export_gate_via_name(
+    gate: _gates.Gate, qubit_indices, custom_gate_names, translator=_QUIL_TRANSLATOR
+):
     try:
         pyquil_fn = _pyquil_gate_by_name(gate.name)
     except AttributeError:
         raise ValueError(f"Can't export {gate} to PyQuil as a built-in gate")
 
-    pyquil_params = map(_export_expression, gate.params)
+    pyquil_params = [_export_expression(param, translator) for param in gate.params]
     return pyquil_fn(*pyquil_params, *qubit_indices)
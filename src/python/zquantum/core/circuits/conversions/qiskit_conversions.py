@@ -1,14 +1,16 @@
 import hashlib
-from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple, Union
+from collections.abc import Hashable
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence, Tuple, Union
 
 import numpy as np
 import qiskit
 import sympy
 
 from .. import _builtin_gates, _circuit, _gates
+from ..symbolic.numpy_expressions import compile_expressions
 from ..symbolic.qiskit_expressions import QISKIT_DIALECT, expression_from_qiskit
 from ..symbolic.sympy_expressions import SYMPY_DIALECT, expression_from_sympy
-from ..symbolic.translations import translate_expression
+from ..symbolic.translations import ExpressionTranslator
 
 QiskitOperation = Tuple[
     qiskit.circuit.Instruction, List[qiskit.circuit.Qubit], List[qiskit.circuit.Clbit]
@@ -25,14 +27,17 @@ def _import_qiskit_qubit(qubit: qiskit.circuit.Qubit) -> int:
     return qubit.index
 
 
-def _qiskit_expr_from_zquantum(expr):
+_SYMPY_TRANSLATOR = ExpressionTranslator(SYMPY_DIALECT)
+
+
+def _qiskit_expr_from_zquantum(expr, translator: ExpressionTranslator):
     intermediate = expression_from_sympy(expr)
-    return translate_expression(intermediate, QISKIT_DIALECT)
+    return translator(intermediate)
 
 
 def _zquantum_expr_from_qiskit(expr):
     intermediate = expression_from_qiskit(expr)
-    return translate_expression(intermediate, SYMPY_DIALECT)
+    return _SYMPY_TRANSLATOR(intermediate)
 
 
 ZQUANTUM_QISKIT_GATE_MAP = {
@@ -88,125 +93,187 @@ QISKIT_ZQUANTUM_GATE_MAP = {
 }
 
 
+_QISKIT_GATE_CLASS_BY_GATE_NAME = {
+    name: ZQUANTUM_QISKIT_GATE_MAP[gate_ref]
+    for name, gate_ref in vars(_builtin_gates).items()
+    if isinstance(gate_ref, Hashable) and gate_ref in ZQUANTUM_QISKIT_GATE_MAP
+}
+
+
+def _make_qiskit_translator() -> ExpressionTranslator:
+    """Make translator into Qiskit dialect, translating each symbol to the same
+    Parameter.
+
+    Qiskit distinguishes parameters by identity rather than by name, and doesn't allow
+    distinct parameters with the same name in one circuit.
+    """
+    parameters: Dict[str, qiskit.circuit.Parameter] = {}
+
+    def _parameter_factory(symbol) -> qiskit.circuit.Parameter:
+        parameter = parameters.get(symbol.name)
+        if parameter is None:
+            parameter = parameters[symbol.name] = QISKIT_DIALECT.symbol_factory(symbol)
+        return parameter
+
+    return ExpressionTranslator(
+        QISKIT_DIALECT._replace(symbol_factory=_parameter_factory)
+    )
+
+
 def export_to_qiskit(circuit: _circuit.Circuit) -> qiskit.QuantumCircuit:
     q_circuit = qiskit.QuantumCircuit(circuit.n_qubits)
     custom_names = {
         gate_def.gate_name for gate_def in circuit.collect_custom_gate_definitions()
     }
-    q_triplets = [
-        _export_gate_to_qiskit(
-            gate_op.gate,
-            applied_qubit_indices=gate_op.qubit_indices,
-            n_qubits_in_circuit=circuit.n_qubits,
-            custom_names=custom_names,
+    translator = _make_qiskit_translator()
+    for gate_op in circuit.operations:
+        q_circuit.append(
+            _export_gate_to_qiskit(gate_op.gate, custom_names, translator),
+            [q_circuit.qubits[qubit_i] for qubit_i in gate_op.qubit_indices],
+            [],
         )
-        for gate_op in circuit.operations
-    ]
-    for q_gate, q_qubits, q_clbits in q_triplets:
-        q_circuit.append(q_gate, q_qubits, q_clbits)
     return q_circuit
 
 
 def _export_gate_to_qiskit(
-    gate, applied_qubit_indices, n_qubits_in_circuit, custom_names
-):
-    try:
-        return _export_gate_via_mapping(
-            gate, applied_qubit_indices, n_qubits_in_circuit, custom_names
-        )
-    except ValueError:
-        pass
+    gate, custom_names, translator
+) -> qiskit.circuit.Instruction:
+    qiskit_cls = _QISKIT_GATE_CLASS_BY_GATE_NAME.get(gate.name)
+    if qiskit_cls is not None:
+        return _export_gate_via_mapping(gate, qiskit_cls, translator)
 
-    try:
-        return _export_controlled_gate(
-            gate, applied_qubit_indices, n_qubits_in_circuit, custom_names
-        )
-    except ValueError:
-        pass
+    if isinstance(gate, _gates.ControlledGate):
+        return _export_controlled_gate(gate, custom_names, translator)
 
-    try:
-        return _export_custom_gate(
-            gate, applied_qubit_indices, n_qubits_in_circuit, custom_names
-        )
-    except ValueError:
-        pass
+    if gate.name in custom_names and not gate.params:
+        return _export_custom_gate(gate)
 
     raise NotImplementedError(f"Exporting gate {gate} to Qiskit is unsupported")
 
 
-def _export_gate_via_mapping(
-    gate, applied_qubit_indices, n_qubits_in_circuit, custom_names
-):
-    try:
-        qiskit_cls = ZQUANTUM_QISKIT_GATE_MAP[
-            _builtin_gates.builtin_gate_by_name(gate.name)
-        ]
-    except KeyError:
-        raise ValueError(f"Can't export gate {gate} to Qiskit via mapping")
+def _export_gate_via_mapping(gate, qiskit_cls, translator):
+    return qiskit_cls(
+        *(_qiskit_expr_from_zquantum(param, translator) for param in gate.params)
+    )
 
-    qiskit_params = [_qiskit_expr_from_zquantum(param) for param in gate.params]
-    qiskit_qubits = [
-        qiskit_qubit(qubit_i, n_qubits_in_circuit) for qubit_i in applied_qubit_indices
-    ]
 
-    return qiskit_cls(*qiskit_params), qiskit_qubits, []
+def _export_controlled_gate(gate: _gates.ControlledGate, custom_names, translator):
+    target_gate = _export_gate_to_qiskit(gate.wrapped_gate, custom_names, translator)
+    return target_gate.control(gate.num_control_qubits)
 
 
-def _export_controlled_gate(
-    gate: _gates.ControlledGate,
-    applied_qubit_indices,
-    n_qubits_in_circuit,
-    custom_names,
-):
-    if not isinstance(gate, _gates.ControlledGate):
-        # Raising an exception here is redundant to the type hint, but it allows us
-        # to handle exporting all gates in the same way, regardless of type
-        raise ValueError(f"Can't export gate {gate} as a controlled gate")
-
-    target_indices = applied_qubit_indices[gate.num_control_qubits :]
-    target_gate, _, _ = _export_gate_to_qiskit(
-        gate.wrapped_gate,
-        applied_qubit_indices=target_indices,
-        n_qubits_in_circuit=n_qubits_in_circuit,
-        custom_names=custom_names,
-    )
-    controlled_gate = target_gate.control(gate.num_control_qubits)
-    qiskit_qubits = [
-        qiskit_qubit(qubit_i, n_qubits_in_circuit) for qubit_i in applied_qubit_indices
-    ]
-    return controlled_gate, qiskit_qubits, []
-
-
-def _export_custom_gate(
-    gate: _gates.MatrixFactoryGate,
-    applied_qubit_indices,
-    n_qubits_in_circuit,
-    custom_names,
-):
-    if gate.name not in custom_names:
-        raise ValueError(
-            f"Can't export gate {gate} as a custom gate, the circuit is missing its "
-            "definition"
+def _export_custom_gate(gate: _gates.MatrixFactoryGate):
+    # At that time of writing it Qiskit doesn't support parametrized gates defined with
+    # a symbolic matrix, hence only gates without params are exported as custom gates.
+    # See https://github.com/Qiskit/qiskit-terra/issues/4751 for more info.
+    qiskit_matrix = np.array(gate.matrix)
+    return qiskit.extensions.UnitaryGate(qiskit_matrix, label=gate.name)
+
+
+class QiskitCircuitTemplate:
+    """Parametrized circuit exported to Qiskit once, to be bound to many values.
+
+    The circuit is exported with its free symbols translated to Qiskit Parameters.
+    Binding the template assigns values to these Parameters, which is much cheaper
+    than binding and exporting the ZQuantum circuit for each set of values.
+
+    For binding batches, the circuit is additionally exported with a Parameter in
+    place of each distinct symbolic gate parameter. Values of these expressions are
+    computed for the whole batch at once with NumPy, and Qiskit only assigns numbers
+    to Parameters, instead of evaluating parameter expressions of every gate.
+
+    Args:
+        circuit: parametrized circuit to export.
+
+    Attributes:
+        symbols: free symbols of the circuit, sorted by their names like in
+            PyQuilProgramTemplate. Rows of values passed to `bind_batch` are ordered
+            accordingly.
+        qiskit_circuit: exported circuit with Qiskit Parameters.
+    """
+
+    def __init__(self, circuit: _circuit.Circuit):
+        self.symbols = sorted(circuit.free_symbols, key=str)
+        self.qiskit_circuit = export_to_qiskit(circuit)
+        parameters_by_name = {
+            parameter.name: parameter for parameter in self.qiskit_circuit.parameters
+        }
+        # Symbols can be missing from exported circuit, e.g. if they cancel out
+        # during translation of expressions to Qiskit.
+        self._parameters = [
+            parameters_by_name.get(symbol.name) for symbol in self.symbols
+        ]
+
+        expressions: Dict[sympy.Expr, sympy.Symbol] = {}
+        for operation in circuit.operations:
+            for param in operation.params:
+                if isinstance(param, sympy.Expr) and param.free_symbols:
+                    expressions.setdefault(
+                        param, sympy.Symbol(f"_expression_{len(expressions)}")
+                    )
+        self._evaluate_expressions = compile_expressions(
+            list(expressions), self.symbols
+        )
+        self._batch_circuit = export_to_qiskit(
+            _circuit.Circuit(
+                [
+                    operation.replace_params(
+                        tuple(
+                            expressions.get(param, param) for param in operation.params
+                        )
+                    )
+                    for operation in circuit.operations
+                ],
+                n_qubits=circuit.n_qubits,
+            )
         )
+        batch_parameters_by_name = {
+            parameter.name: parameter for parameter in self._batch_circuit.parameters
+        }
+        self._batch_parameters = [
+            batch_parameters_by_name[placeholder.name]
+            for placeholder in expressions.values()
+        ]
 
-    if gate.params:
-        raise ValueError(
-            f"Can't export parametrized gate {gate}, Qiskit doesn't support "
-            "parametrized custom gates"
+    def bind(self, symbols_map: Dict[sympy.Symbol, Any]) -> qiskit.QuantumCircuit:
+        """Bind the exported circuit to the values in the symbols map.
+
+        Symbols missing from the map are left unbound, like in Circuit.bind.
+        """
+        return self.qiskit_circuit.assign_parameters(
+            {
+                parameter: symbols_map[symbol]
+                for symbol, parameter in zip(self.symbols, self._parameters)
+                if parameter is not None and symbol in symbols_map
+            }
         )
-    # At that time of writing it Qiskit doesn't support parametrized gates defined with
-    # a symbolic matrix.
-    # See https://github.com/Qiskit/qiskit-terra/issues/4751 for more info.
 
-    qiskit_qubits = [
-        qiskit_qubit(qubit_i, n_qubits_in_circuit) for qubit_i in applied_qubit_indices
-    ]
-    qiskit_matrix = np.array(gate.matrix)
-    return (
-        qiskit.extensions.UnitaryGate(qiskit_matrix, label=gate.name),
-        qiskit_qubits,
-        [],
-    )
+    def bind_batch(self, parameter_values: np.ndarray) -> List[qiskit.QuantumCircuit]:
+        """Bind the exported circuit to each row of parameter values.
+
+        Args:
+            parameter_values: array of shape (number of circuits, number of symbols)
+                of values of the symbols, ordered like `symbols`.
+
+        Returns:
+            Bound Qiskit circuits, one per row of values.
+        """
+        parameter_values = np.asarray(parameter_values, dtype=float)
+        if parameter_values.ndim != 2 or parameter_values.shape[1] != len(self.symbols):
+            raise ValueError(
+                f"Expected values of {len(self.symbols)} symbols for each circuit, "
+                f"got array of shape {parameter_values.shape}."
+            )
+
+        expression_values = self._evaluate_expressions(parameter_values)
+        if np.iscomplexobj(expression_values):
+            expression_values = np.real_if_close(expression_values)
+        return [
+            self._batch_circuit.assign_parameters(
+                dict(zip(self._batch_parameters, values))
+            )
+            for values in expression_values.tolist()
+        ]
 
 
 class AnonGateOperation(NamedTuple):
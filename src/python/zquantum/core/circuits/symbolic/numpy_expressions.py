@@ -0,0 +1,133 @@
+"""Compilation of intermediate expression trees into NumPy-vectorized callables.
+
+Attributes:
+    NUMPY_DIALECT: Mapping from the intermediate expression tree into Python
+        callables. Translating an expression into this dialect gives a function
+        mapping symbol names to (arrays of) their values into (an array of) values of
+        the expression. Can be used with
+        `zquantum.core.circuit.symbolic.translations.translate_expression`.
+"""
+import operator
+from numbers import Number
+from typing import Any, Callable, Mapping, Sequence
+
+import numpy as np
+import sympy
+
+from .expressions import ExpressionDialect, Symbol, reduction
+from .sympy_expressions import expression_from_sympy
+from .translations import ExpressionTranslator
+
+CompiledExpression = Callable[[Mapping[str, Any]], Any]
+
+
+def _compile_symbol(symbol: Symbol) -> CompiledExpression:
+    name = symbol.name
+    return lambda values: values[name]
+
+
+def _compile_number(number: Number) -> CompiledExpression:
+    return lambda values: number
+
+
+def _power(base, exponent):
+    # Roots of negative numbers are imaginary, like in sympy. Other powers of real
+    # numbers stay real.
+    base = np.asarray(base)
+    if not np.iscomplexobj(base):
+        is_root_of_negative = not np.iscomplexobj(exponent) and np.any(
+            (base < 0) & (np.mod(exponent, 1) != 0)
+        )
+        base = base.astype(complex if is_root_of_negative else float)
+    return np.power(base, exponent)
+
+
+def _compile_function(
+    function: Callable[..., Any]
+) -> Callable[..., CompiledExpression]:
+    def _compile_call(*args: CompiledExpression) -> CompiledExpression:
+        return lambda values: function(*(arg(values) for arg in args))
+
+    return _compile_call
+
+
+NUMPY_DIALECT = ExpressionDialect(
+    symbol_factory=_compile_symbol,
+    number_factory=_compile_number,
+    known_functions={
+        name: _compile_function(function)
+        for name, function in {
+            "add": reduction(operator.add),
+            "mul": reduction(operator.mul),
+            "div": operator.truediv,
+            "sub": operator.sub,
+            "pow": _power,
+            "cos": np.cos,
+            "sin": np.sin,
+            "exp": np.exp,
+            "sqrt": np.emath.sqrt,
+            "tan": np.tan,
+        }.items()
+    },
+)
+
+_NUMPY_TRANSLATOR = ExpressionTranslator(NUMPY_DIALECT)
+
+
+def compile_expressions(
+    expressions: Sequence[sympy.Expr], symbols: Sequence[sympy.Symbol]
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Compile sympy expressions into a function evaluating them for batches of
+    values of their symbols.
+
+    The expressions are translated once, and evaluated with NumPy operations
+    vectorized over the batch, instead of substituting values into each expression.
+
+    Args:
+        expressions: expressions to compile, e.g. parameters of gates in a circuit.
+        symbols: symbols that the expressions depend on.
+
+    Returns:
+        Function mapping an array of shape (batch size, number of symbols), with
+        values of the symbols ordered like `symbols`, into an array of shape (batch
+        size, number of expressions) of values of the expressions.
+
+    Raises:
+        ValueError: if the expressions depend on symbols not listed in `symbols`.
+    """
+    missing_symbols = set().union(
+        *(getattr(expression, "free_symbols", ()) for expression in expressions)
+    ) - set(symbols)
+    if missing_symbols:
+        raise ValueError(
+            "Expressions depend on symbols missing from the compiled ones: "
+            f"{sorted(missing_symbols, key=str)}."
+        )
+    compiled_expressions = [
+        _NUMPY_TRANSLATOR(expression_from_sympy(expression))
+        for expression in expressions
+    ]
+    names = [str(symbol) for symbol in symbols]
+
+    def _evaluate(symbol_values: np.ndarray) -> np.ndarray:
+        symbol_values = np.asarray(symbol_values)
+        if not np.iscomplexobj(symbol_values):
+            symbol_values = symbol_values.astype(float)
+        if symbol_values.ndim != 2 or symbol_values.shape[1] != len(names):
+            raise ValueError(
+                f"Expected values of {len(names)} symbols for each evaluation, got "
+                f"array of shape {symbol_values.shape}."
+            )
+        batch_size = symbol_values.shape[0]
+        values = dict(zip(names, symbol_values.T))
+        if not compiled_expressions:
+            return np.zeros((batch_size, 0), dtype=symbol_values.dtype)
+        return np.stack(
+            [
+                np.broadcast_to(compiled_expression(values), (batch_size,))
+                for compiled_expression in compiled_expressions
+            ],
+            axis=1,
+        )
+
+    return _evaluate
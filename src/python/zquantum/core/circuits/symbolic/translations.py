@@ -1,7 +1,10 @@
 """Utilities related to translation of symbolic expressions."""
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
 from functools import singledispatch
 from numbers import Number
-from typing import Iterable, Tuple, Union
+from typing import Any, Iterable, Optional, Tuple, Union
 
 from .expressions import Expression, ExpressionDialect, FunctionCall, Symbol
 
@@ -35,3 +38,91 @@ def translate_function_call(function_call: FunctionCall, dialect: ExpressionDial
 
 def translate_tuple(expression_tuple: Iterable[Expression], dialect: ExpressionDialect):
     return tuple(translate_expression(element, dialect) for element in expression_tuple)
+
+
+def _structural_key(expression: Expression) -> Optional[Hashable]:
+    """Key identifying expression tree by its structure, or None if it has none.
+
+    Numbers are keyed together with their types, because e.g. 2 and 2.0 are equal
+    but can translate to different expressions, like sympy Integer and Float.
+    """
+    if isinstance(expression, Symbol):
+        return expression
+    if isinstance(expression, FunctionCall):
+        if not isinstance(expression.args, tuple):
+            return None
+        arg_keys = tuple(map(_structural_key, expression.args))
+        return None if None in arg_keys else (expression.name, arg_keys)
+    if isinstance(expression, Number):
+        return (type(expression), expression)
+    return None
+
+
+class ExpressionTranslator:
+    """Translator of expressions into a dialect, memoizing translations.
+
+    Translations of symbols and function calls, including the subexpressions of
+    translated expressions, are cached by the structure of the expressions. The
+    cache is bounded, translations used least recently are evicted first. Access to
+    the cache is synchronized, so a translator can be shared between threads.
+
+    Since translations are reused, the dialect should produce immutable expressions.
+
+    Args:
+        dialect: dialect to translate expressions into.
+        maxsize: maximum number of cached translations.
+    """
+
+    def __init__(self, dialect: ExpressionDialect, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError(f"Cache size has to be positive, got {maxsize}.")
+        self.dialect = dialect
+        self.maxsize = maxsize
+        self._cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, expression: Expression):
+        """Translate expression into the dialect, see translate_expression."""
+        key = _structural_key(expression)
+        if key is None:
+            return translate_expression(expression, self.dialect)
+        return self._translate(expression, key)
+
+    def _translate(self, expression: Expression, key: Hashable):
+        if isinstance(expression, Number):
+            return self.dialect.number_factory(expression)
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        if isinstance(expression, Symbol):
+            translated = self.dialect.symbol_factory(expression)
+        else:
+            if expression.name not in self.dialect.known_functions:
+                raise ValueError(
+                    f"Function {expression.name} is unknown in this dialect."
+                )
+            translated = self.dialect.known_functions[expression.name](
+                *(
+                    self._translate(arg, arg_key)
+                    for arg, arg_key in zip(expression.args, key[1])
+                )
+            )
+
+        with self._lock:
+            self._cache[key] = translated
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return translated
+
+    @property
+    def cache_size(self) -> int:
+        """Number of currently cached translations."""
+        return len(self._cache)
+
+    def clear_cache(self):
+        """Forget all cached translations."""
+        with self._lock:
+            self._cache.clear()
@@ -28,6 +28,7 @@ from .measurement import (
     ExpectationValues,
     concatenate_expectation_values,
     expectation_values_to_real,
+    get_total_estimator_variance,
 )
 from .utils import ValueEstimate, create_symbols_map
 
@@ -174,10 +175,9 @@ def sum_expectation_values(expectation_values: ExpectationValues) -> ValueEstima
     precision = None
 
     if expectation_values.estimator_covariances:
-        estimator_variance = 0.0
-        for frame_covariance in expectation_values.estimator_covariances:
-            estimator_variance += float(np.sum(frame_covariance, (0, 1)))
-        precision = np.sqrt(estimator_variance)
+        precision = np.sqrt(
+            get_total_estimator_variance(expectation_values.estimator_covariances)
+        )
     return ValueEstimate(value, precision)
 
 
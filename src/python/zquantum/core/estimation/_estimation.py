@@ -1,17 +1,26 @@
-from typing import Dict, List, Optional, Tuple, cast
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Sequence, Tuple, cast
 
 import numpy as np
 import sympy
-from openfermion import IsingOperator, QubitOperator
 
-from ..circuits import RX, RY, Circuit
-from ..hamiltonian import estimate_nmeas_for_frames, group_comeasureable_terms_greedy
+from ..circuits import RX, RY, Circuit, ControlledGate, Dagger, Gate
 from ..interfaces.backend import QuantumBackend, QuantumSimulator
 from ..interfaces.estimation import EstimationTask
-from ..measurement import ExpectationValues, expectation_values_to_real
-from ..openfermion import change_operator_type
+from ..measurement import (
+    ExpectationValues,
+    Measurements,
+    expectation_values_to_real,
+    get_total_estimator_variance,
+)
 from ..utils import scale_and_discretize
 
+if TYPE_CHECKING:
+    from openfermion import IsingOperator, QubitOperator
+    from pyquil.wavefunction import Wavefunction
+
 
 def get_context_selection_circuit_for_group(
     qubit_operator: QubitOperator,
@@ -22,6 +31,8 @@ def get_context_selection_circuit_for_group(
     Args:
         qubit_operator: operator representing group of co-measurable Pauli term
     """
+    from openfermion import IsingOperator
+
     context_selection_circuit = Circuit()
     transformed_operator = IsingOperator()
     context: List[Tuple[int, str]] = []
@@ -97,6 +108,8 @@ def group_greedily(
     Args:
         estimation_tasks: list of estimation tasks
     """
+    from ..hamiltonian import group_comeasureable_terms_greedy
+
     if sort_terms:
         print("Greedy grouping with pre-sorting")
     else:
@@ -150,6 +163,8 @@ def allocate_shots_proportionally(
         prior_expectation_values: object containing the expectation
             values of all operators in frame_operators
     """
+    from ..hamiltonian import estimate_nmeas_for_frames
+
     if total_n_shots <= 0:
         raise ValueError("total_n_shots must be positive.")
 
@@ -282,6 +297,55 @@ def evaluate_constant_estimation_tasks(
     return expectation_values
 
 
+def _gate_fingerprint(gate: Gate) -> Hashable:
+    if isinstance(gate, ControlledGate):
+        return (
+            gate.name,
+            gate.num_control_qubits,
+            _gate_fingerprint(gate.wrapped_gate),
+        )
+    elif isinstance(gate, Dagger):
+        return (gate.name, _gate_fingerprint(gate.wrapped_gate))
+    else:
+        return (gate.name, tuple(gate.params))
+
+
+def _circuit_fingerprint(circuit: Circuit) -> Hashable:
+    """Hashable key identifying circuit by its structure and gate parameters.
+
+    Unlike `Circuit.__eq__`, parameters are compared exactly, so circuits that are equal
+    only up to numerical tolerance get different fingerprints.
+    """
+    return (
+        circuit.n_qubits,
+        tuple(
+            (_gate_fingerprint(operation.gate), tuple(operation.qubit_indices))
+            for operation in circuit.operations
+        ),
+    )
+
+
+def _group_identical_circuits(
+    circuits: Sequence[Circuit],
+) -> Tuple[List[Circuit], List[int]]:
+    """Finds the unique circuits in a sequence.
+
+    Returns:
+        unique_circuits: circuits with duplicates removed, in order of first appearance
+        indices: the i-th entry is the index in unique_circuits of the i-th circuit
+    """
+    unique_circuits: List[Circuit] = []
+    indices = []
+    index_by_fingerprint: Dict[Hashable, int] = {}
+    for circuit in circuits:
+        fingerprint = _circuit_fingerprint(circuit)
+        if fingerprint not in index_by_fingerprint:
+            index_by_fingerprint[fingerprint] = len(unique_circuits)
+            unique_circuits.append(circuit)
+        indices.append(index_by_fingerprint[fingerprint])
+    return unique_circuits, indices
+
+
 def estimate_expectation_values_by_averaging(
     backend: QuantumBackend,
     estimation_tasks: List[EstimationTask],
@@ -289,12 +353,17 @@ def estimate_expectation_values_by_averaging(
     """Basic method for estimating expectation values for list of estimation tasks.
 
     It executes specified circuit and calculates expectation values based on the
-    measurements.
+    measurements. Tasks sharing the same circuit are measured together: the circuit is
+    executed only once, with the largest number of shots requested by these tasks,
+    and the resulting measurements are used for all of their operators.
 
     Args:
         backend: backend used for executing circuits
         estimation_tasks: list of estimation tasks
     """
+    from openfermion import IsingOperator
+
+    from ..openfermion import change_operator_type
 
     (
         estimation_tasks_to_measure,
@@ -314,15 +383,26 @@ def estimate_expectation_values_by_averaging(
         ]
     )
 
-    measurements_list = backend.run_circuitset_and_measure(circuits, shots_per_circuit)
+    unique_circuits, circuit_indices = _group_identical_circuits(circuits)
+    shots_per_unique_circuit: List[Optional[int]] = [None for _ in unique_circuits]
+    for circuit_index, number_of_shots in zip(circuit_indices, shots_per_circuit):
+        current_number_of_shots = shots_per_unique_circuit[circuit_index]
+        if current_number_of_shots is None or (
+            number_of_shots is not None and number_of_shots > current_number_of_shots
+        ):
+            shots_per_unique_circuit[circuit_index] = number_of_shots
+
+    measurements_list = backend.run_circuitset_and_measure(
+        unique_circuits, shots_per_unique_circuit
+    )
 
     measured_expectation_values_list = [
         expectation_values_to_real(
-            measurements.get_expectation_values(
+            measurements_list[circuit_index].get_expectation_values(
                 change_operator_type(frame_operator, IsingOperator)
             )
         )
-        for frame_operator, measurements in zip(operators, measurements_list)
+        for frame_operator, circuit_index in zip(operators, circuit_indices)
     ]
 
     full_expectation_values: List[Optional[ExpectationValues]] = [
@@ -344,20 +424,237 @@ def estimate_expectation_values_by_averaging(
     return cast(List[ExpectationValues], full_expectation_values)
 
 
+def _calculate_precision_of_sum(
+    expectation_values_list: List[ExpectationValues],
+) -> float:
+    """Precision of the sum of all expectation values, computed in the same way as in
+    `zquantum.core.cost_function.sum_expectation_values`.
+    """
+    return np.sqrt(
+        get_total_estimator_variance(
+            [
+                frame_covariance
+                for expectation_values in expectation_values_list
+                for frame_covariance in expectation_values.estimator_covariances or []
+            ]
+        )
+    )
+
+
+def estimate_expectation_values_to_precision(
+    backend: QuantumBackend,
+    estimation_tasks: List[EstimationTask],
+    target_precision: float,
+    max_number_of_shots: Optional[int] = None,
+) -> List[ExpectationValues]:
+    """Estimates expectation values by sampling circuits in rounds until the sum of
+    all expectation values reaches the target precision.
+
+    In each round, every task is measured number_of_shots more times and the
+    measurements are accumulated with those from previous rounds. Sampling stops once
+    the precision of the sum of all expectation values (as reported by
+    `zquantum.core.cost_function.sum_expectation_values`) is at most target_precision,
+    or when another round would exceed max_number_of_shots. At least one round is
+    always performed.
+
+    To be used as an estimation method, the additional arguments have to be fixed,
+    e.g. using `functools.partial`.
+
+    Args:
+        backend: backend used for executing circuits
+        estimation_tasks: list of estimation tasks. number_of_shots of each task is
+            interpreted as the number of shots taken for that task in a single round.
+        target_precision: precision of the summed expectation values at which
+            sampling stops
+        max_number_of_shots: cap on the total number of shots taken across all tasks
+            and rounds. If None, sampling continues until target_precision is met.
+    """
+    from openfermion import IsingOperator
+
+    from ..openfermion import change_operator_type
+
+    if target_precision <= 0:
+        raise ValueError("target_precision must be positive.")
+
+    (
+        estimation_tasks_to_measure,
+        estimation_tasks_for_constants,
+        indices_to_measure,
+        indices_for_constants,
+    ) = split_constant_estimation_tasks(estimation_tasks)
+
+    if any(task.number_of_shots is None for task in estimation_tasks_to_measure):
+        raise ValueError(
+            "number_of_shots needs to be specified for every EstimationTask with "
+            "non-constant terms."
+        )
+
+    expectation_values_for_constants = evaluate_constant_estimation_tasks(
+        estimation_tasks_for_constants
+    )
+
+    circuits = [task.circuit for task in estimation_tasks_to_measure]
+    operators = [
+        change_operator_type(task.operator, IsingOperator)
+        for task in estimation_tasks_to_measure
+    ]
+    shots_per_round = [
+        cast(int, task.number_of_shots) for task in estimation_tasks_to_measure
+    ]
+    accumulated_measurements = [Measurements() for _ in circuits]
+    total_number_of_shots = 0
+
+    measured_expectation_values_list: List[ExpectationValues] = []
+    while circuits:
+        measurements_list = backend.run_circuitset_and_measure(
+            circuits, shots_per_round
+        )
+        for accumulated, measurements in zip(
+            accumulated_measurements, measurements_list
+        ):
+            accumulated.add_counts(measurements.get_counts())
+        total_number_of_shots += sum(shots_per_round)
+
+        measured_expectation_values_list = [
+            expectation_values_to_real(measurements.get_expectation_values(operator))
+            for operator, measurements in zip(operators, accumulated_measurements)
+        ]
+
+        if _calculate_precision_of_sum(
+            measured_expectation_values_list
+        ) <= target_precision or (
+            max_number_of_shots is not None
+            and total_number_of_shots + sum(shots_per_round) > max_number_of_shots
+        ):
+            break
+
+    full_expectation_values: List[Optional[ExpectationValues]] = [
+        None for _ in range(len(estimation_tasks))
+    ]
+    for ex_val, final_index in zip(
+        expectation_values_for_constants, indices_for_constants
+    ):
+        full_expectation_values[final_index] = ex_val
+    for ex_val, final_index in zip(
+        measured_expectation_values_list, indices_to_measure
+    ):
+        full_expectation_values[final_index] = ex_val
+
+    return cast(List[ExpectationValues], full_expectation_values)
+
+
+class WavefunctionCache:
+    """Least-recently-used cache of wavefunctions keyed by circuits.
+
+    Can be passed to calculate_exact_expectation_values to reuse wavefunctions
+    between calls. The cached wavefunctions depend on the backend that produced them,
+    so a cache should only be used together with a single backend.
+
+    Args:
+        maxsize: maximal number of wavefunctions kept in the cache
+    """
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive.")
+        self.maxsize = maxsize
+        self._wavefunctions: "OrderedDict[Hashable, Wavefunction]" = OrderedDict()
+
+    def get(self, circuit: Circuit) -> Optional[Wavefunction]:
+        fingerprint = _circuit_fingerprint(circuit)
+        wavefunction = self._wavefunctions.get(fingerprint)
+        if wavefunction is not None:
+            self._wavefunctions.move_to_end(fingerprint)
+        return wavefunction
+
+    def put(self, circuit: Circuit, wavefunction: Wavefunction) -> None:
+        fingerprint = _circuit_fingerprint(circuit)
+        self._wavefunctions[fingerprint] = wavefunction
+        self._wavefunctions.move_to_end(fingerprint)
+        while len(self._wavefunctions) > self.maxsize:
+            self._wavefunctions.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._wavefunctions)
+
+
 def calculate_exact_expectation_values(
     backend: QuantumSimulator,
     estimation_tasks: List[EstimationTask],
+    wavefunction_cache: Optional[WavefunctionCache] = None,
 ) -> List[ExpectationValues]:
     """Calculates exact expectation values using built-in method of a provided backend.
 
+    Backends that don't override QuantumSimulator.get_exact_expectation_values
+    compute them from wavefunctions, so for them every distinct circuit is simulated
+    only once, and the terms of all the tasks sharing it are evaluated on its
+    wavefunction in a single pass.
+
     Args:
         backend: backend used for executing circuits
         estimation_tasks: list of estimation tasks
+        wavefunction_cache: cache used to reuse wavefunctions between calls. If None,
+            wavefunctions are reused only within a single call. Not used by backends
+            with their own implementation of get_exact_expectation_values.
     """
-    expectation_values_list = [
-        backend.get_exact_expectation_values(
-            estimation_task.circuit, estimation_task.operator
+    from openfermion import QubitOperator
+
+    from ..openfermion import get_expectation_values_for_terms
+
+    if (
+        type(backend).get_exact_expectation_values
+        is not QuantumSimulator.get_exact_expectation_values
+    ):
+        return [
+            backend.get_exact_expectation_values(
+                estimation_task.circuit, estimation_task.operator
+            )
+            for estimation_task in estimation_tasks
+        ]
+
+    unique_circuits, circuit_indices = _group_identical_circuits(
+        [estimation_task.circuit for estimation_task in estimation_tasks]
+    )
+
+    wavefunctions = []
+    for circuit in unique_circuits:
+        wavefunction = (
+            wavefunction_cache.get(circuit) if wavefunction_cache is not None else None
         )
-        for estimation_task in estimation_tasks
-    ]
-    return expectation_values_list
+        if wavefunction is None:
+            wavefunction = backend.get_wavefunction(circuit)
+            if wavefunction_cache is not None:
+                wavefunction_cache.put(circuit, wavefunction)
+        wavefunctions.append(wavefunction)
+
+    task_indices_by_circuit: Dict[int, List[int]] = {}
+    for task_index, circuit_index in enumerate(circuit_indices):
+        task_indices_by_circuit.setdefault(circuit_index, []).append(task_index)
+
+    expectation_values_list: List[Optional[ExpectationValues]] = [None] * len(
+        estimation_tasks
+    )
+    for circuit_index, task_indices in task_indices_by_circuit.items():
+        # Terms of all operators measured on the state are evaluated in one pass,
+        # with unit coefficients so that terms shared by operators are not merged.
+        term_indices: Dict[Tuple, int] = {}
+        for task_index in task_indices:
+            for term in estimation_tasks[task_index].operator.terms:
+                term_indices.setdefault(term, len(term_indices))
+        combined_operator = QubitOperator()
+        combined_operator.terms = dict.fromkeys(term_indices, 1.0)
+        term_values = get_expectation_values_for_terms(
+            combined_operator, wavefunctions[circuit_index]
+        )
+
+        for task_index in task_indices:
+            terms = estimation_tasks[task_index].operator.terms
+            indices = np.fromiter(
+                (term_indices[term] for term in terms), dtype=np.int64, count=len(terms)
+            )
+            coefficients = np.fromiter(terms.values(), dtype=complex, count=len(terms))
+            expectation_values_list[task_index] = ExpectationValues(
+                np.real(coefficients * term_values[indices])
+            )
+
+    return cast(List[ExpectationValues], expectation_values_list)
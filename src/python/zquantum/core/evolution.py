@@ -1,9 +1,8 @@
 """Functions for constructing circuits simulating evolution under given Hamiltonian."""
-import operator
 import warnings
-from functools import reduce, singledispatch
+from functools import singledispatch
 from itertools import chain
-from typing import List, Tuple, Union
+from typing import List, Sequence, Tuple, Union, overload
 
 import numpy as np
 import pyquil.paulis
@@ -21,6 +20,9 @@ def time_evolution(
 ) -> circuits.Circuit:
     """Create a circuit simulating evolution under given Hamiltonian.
 
+    If circuits for the same Hamiltonian are needed for many different times, consider
+    using TrotterCircuitTemplate directly.
+
     Args:
         hamiltonian: The Hamiltonian to be evolved under.
         time: Time duration of the evolution.
@@ -33,24 +35,88 @@ def time_evolution(
     """
     if method != "Trotter":
         raise ValueError(f"Currently the method {method} is not supported.")
-    if isinstance(hamiltonian, QubitOperator):
-        terms = list(hamiltonian.get_operators())
-    elif isinstance(hamiltonian, pyquil.paulis.PauliSum):
+    if isinstance(hamiltonian, pyquil.paulis.PauliSum):
         warnings.warn(
             "PauliSum as an input to time_evolution will be depreciated, please change "
             "to QubitOperator instead.",
             DeprecationWarning,
         )
-        terms = hamiltonian.terms
 
-    return reduce(
-        operator.add,
-        (
-            time_evolution_for_term(term, time / trotter_order)
-            for _index_order in range(trotter_order)
-            for term in terms
-        ),
-    )
+    return TrotterCircuitTemplate(hamiltonian).instantiate(time, trotter_order)
+
+
+def _get_hamiltonian_terms(
+    hamiltonian: Union[pyquil.paulis.PauliSum, QubitOperator]
+) -> list:
+    if isinstance(hamiltonian, QubitOperator):
+        return list(hamiltonian.get_operators())
+    elif isinstance(hamiltonian, pyquil.paulis.PauliSum):
+        return hamiltonian.terms
+    else:
+        raise TypeError(f"Unsupported type of Hamiltonian: {type(hamiltonian)}.")
+
+
+def _is_time_dependent(operation: circuits.GateOperation) -> bool:
+    """Check if the angle of operation is proportional to the evolution time.
+
+    See `_adjust_gate_angle` for explanation why these are exactly RZ and PHASE gates.
+    """
+    return operation.gate.name in ("RZ", "PHASE")
+
+
+class TrotterCircuitTemplate:
+    """Reusable skeleton of a single Trotter step for a given Hamiltonian.
+
+    Gates of the step are constructed once, for evolution time equal to 1. Creating
+    a circuit for a concrete (numerical or symbolic) time only rescales angles of
+    the time-dependent gates, which is considerably cheaper than constructing the
+    evolution of every term from scratch.
+
+    Args:
+        hamiltonian: The Hamiltonian to be evolved under.
+
+    Attributes:
+        n_qubits: number of qubits of the created circuits.
+    """
+
+    def __init__(self, hamiltonian: Union[pyquil.paulis.PauliSum, QubitOperator]):
+        self._operations = [
+            operation
+            for term in _get_hamiltonian_terms(hamiltonian)
+            for operation in time_evolution_for_term(term, 1.0).operations
+        ]
+        self._time_dependent_indices = [
+            index
+            for index, operation in enumerate(self._operations)
+            if _is_time_dependent(operation)
+        ]
+        self._unit_time_angles = np.array(
+            [
+                self._operations[index].params[0]
+                for index in self._time_dependent_indices
+            ]
+        )
+        self.n_qubits = circuits.Circuit(self._operations).n_qubits
+
+    def instantiate(
+        self, time: Union[float, sympy.Expr], trotter_order: int = 1
+    ) -> circuits.Circuit:
+        """Create a circuit simulating evolution for given time.
+
+        Args:
+            time: Time duration of the evolution.
+            trotter_order: order of Trotter evolution (1 by default).
+
+        Returns:
+            Circuit approximating evolution under the Hamiltonian, the same as the one
+            returned by `time_evolution`.
+        """
+        step_operations = list(self._operations)
+        angles = (self._unit_time_angles * (time / trotter_order)).tolist()
+        for index, angle in zip(self._time_dependent_indices, angles):
+            step_operations[index] = self._operations[index].replace_params((angle,))
+
+        return circuits.Circuit(step_operations * trotter_order, n_qubits=self.n_qubits)
 
 
 def _adjust_gate_angle(operation: circuits.GateOperation, time):
@@ -167,16 +233,24 @@ def time_evolution_derivatives(
     time: float,
     method: str = "Trotter",
     trotter_order: int = 1,
-) -> Tuple[List[circuits.Circuit], List[float]]:
+    lazy: bool = False,
+) -> Tuple[Sequence[circuits.Circuit], List[float]]:
     """Generates derivative circuits for the time evolution operator defined in
     function time_evolution
 
+    The evolution of every term is constructed only once and derivative circuits are
+    assembled from these shared segments.
+
     Args:
         hamiltonian: The Hamiltonian to be evolved under. It should contain numeric
             coefficients, symbolic expressions aren't supported.
         time: time duration of the evolution.
         method: time evolution method. Currently the only option is 'Trotter'.
         trotter_order: order of Trotter evolution
+        lazy: if True, derivative circuits are returned as a sequence assembling
+            each circuit only when it is accessed. It can be passed directly to
+            `run_circuitset_and_measure` of backends that process circuits one by one,
+            so that the whole set of circuits is never kept in memory.
 
     Returns:
         A Circuit simulating time evolution.
@@ -184,7 +258,6 @@ def time_evolution_derivatives(
     if method != "Trotter":
         raise ValueError(f"The method {method} is currently not supported.")
 
-    single_trotter_derivatives = []
     factors = [1.0, -1.0]
     output_factors = []
     if isinstance(hamiltonian, QubitOperator):
@@ -197,84 +270,88 @@ def time_evolution_derivatives(
         )
         terms = hamiltonian.terms
 
-    for i, term_1 in enumerate(terms):
+    derivative_segments = []
+    for term in terms:
         for factor in factors:
-            output = circuits.Circuit()
-
             try:
-                if isinstance(term_1, QubitOperator):
-                    r = list(term_1.terms.values())[0] / trotter_order
+                if isinstance(term, QubitOperator):
+                    r = list(term.terms.values())[0] / trotter_order
                 else:
-                    r = complex(term_1.coefficient).real / trotter_order
+                    r = complex(term.coefficient).real / trotter_order
             except TypeError:
                 raise ValueError(
-                    "Term coefficients need to be numerical. "
-                    f"Offending term: {term_1}"
+                    "Term coefficients need to be numerical. " f"Offending term: {term}"
                 )
             output_factors.append(r * factor)
             shift = factor * (np.pi / (4.0 * r))
 
-            for j, term_2 in enumerate(terms):
-                output += time_evolution_for_term(
-                    term_2,
-                    (time + shift) / trotter_order if i == j else time / trotter_order,
-                )
-
-            single_trotter_derivatives.append(output)
+            derivative_segments.append(
+                time_evolution_for_term(term, (time + shift) / trotter_order).operations
+            )
 
-    if trotter_order > 1:
-        output_circuits = []
-        final_factors = []
+    step_segments = [
+        time_evolution_for_term(term, time / trotter_order).operations for term in terms
+    ]
 
-        repeated_circuit = time_evolution(
-            hamiltonian, time, method="Trotter", trotter_order=1
-        )
+    derivative_circuits = _TimeEvolutionDerivativeCircuits(
+        step_segments, derivative_segments, trotter_order
+    )
 
-        for position in range(trotter_order):
-            for factor, different_circuit in zip(
-                output_factors, single_trotter_derivatives
-            ):
-                output_circuits.append(
-                    _generate_circuit_sequence(
-                        repeated_circuit, different_circuit, trotter_order, position
-                    )
-                )
-                final_factors.append(factor)
-        return output_circuits, final_factors
-    else:
-        return single_trotter_derivatives, output_factors
+    return (
+        derivative_circuits if lazy else list(derivative_circuits),
+        output_factors * trotter_order,
+    )
 
 
-def _generate_circuit_sequence(
-    repeated_circuit: circuits.Circuit,
-    different_circuit: circuits.Circuit,
-    length: int,
-    position: int,
-):
-    """Join multiple copies of circuit, replacing one copy with a different circuit.
+class _TimeEvolutionDerivativeCircuits(Sequence[circuits.Circuit]):
+    """Sequence of derivative circuits assembled on access from shared segments.
 
-    Args:
-        repeated_circuit: circuit which copies should be concatenated
-        different_circuit: circuit that will replace one copy of `repeated_circuit
-        length: total number of circuits to join
-        position: which copy of repeated_circuit should be replaced by
-        `different_circuit`.
-    Returns:
-        Concatenation of circuits C_1, ..., C_length, where C_i = `repeated_circuit`
-        if i != position and C_i = `different_circuit` if i == position.
+    Circuit at index `position * len(derivative_segments) + k` consists of
+    `trotter_order` Trotter steps, each joining all of `step_segments`, except that in
+    the step at `position` the segment of the term k // 2 is replaced with
+    `derivative_segments[k]`.
     """
-    if position >= length:
-        raise ValueError(f"Position {position} should be < {length}")
-
-    return circuits.Circuit(
-        list(
-            chain.from_iterable(
-                [
-                    (
-                        repeated_circuit if i != position else different_circuit
-                    ).operations
-                    for i in range(length)
-                ]
-            )
+
+    def __init__(
+        self,
+        step_segments: List[List[circuits.GateOperation]],
+        derivative_segments: List[List[circuits.GateOperation]],
+        trotter_order: int,
+    ):
+        self._step_operations = list(chain.from_iterable(step_segments))
+        self._segment_offsets = np.cumsum(
+            [0] + [len(segment) for segment in step_segments]
+        ).tolist()
+        self._derivative_segments = derivative_segments
+        self._trotter_order = trotter_order
+
+    def __len__(self) -> int:
+        return len(self._derivative_segments) * self._trotter_order
+
+    @overload
+    def __getitem__(self, index: int) -> circuits.Circuit:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[circuits.Circuit]:
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Derivative circuit index out of range.")
+
+        position, derivative_index = divmod(index, len(self._derivative_segments))
+        term_index = derivative_index // 2
+
+        return circuits.Circuit(
+            self._step_operations * position
+            + self._step_operations[: self._segment_offsets[term_index]]
+            + self._derivative_segments[derivative_index]
+            + self._step_operations[self._segment_offsets[term_index + 1] :]
+            + self._step_operations * (self._trotter_order - position - 1)
         )
-    )
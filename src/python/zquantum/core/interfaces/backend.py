@@ -1,10 +1,10 @@
+from __future__ import annotations
+
 import warnings
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Sequence
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 
 import numpy as np
-from openfermion import IsingOperator, QubitOperator, SymbolicOperator
-from pyquil.wavefunction import Wavefunction
 
 from ..bitstring_distribution import (
     BitstringDistribution,
@@ -13,7 +13,11 @@ from ..bitstring_distribution import (
 from ..circuits import Circuit
 from ..circuits.layouts import CircuitConnectivity
 from ..measurement import ExpectationValues, Measurements, expectation_values_to_real
-from ..openfermion import change_operator_type, get_expectation_value
+from ..utils import reverse_bit_order
+
+if TYPE_CHECKING:
+    from openfermion import SymbolicOperator
+    from pyquil.wavefunction import Wavefunction
 
 
 class QuantumBackend(ABC):
@@ -168,11 +172,11 @@ class QuantumSimulator(QuantumBackend):
         Returns:
             Expectation values for given operator.
         """
+        from ..openfermion import get_expectation_values_for_terms
+
         wavefunction = self.get_wavefunction(circuit)
-        if isinstance(operator, IsingOperator):
-            operator = change_operator_type(operator, QubitOperator)
         expectation_values = ExpectationValues(
-            np.array([get_expectation_value(term, wavefunction) for term in operator])
+            get_expectation_values_for_terms(operator, wavefunction)
         )
         expectation_values = expectation_values_to_real(expectation_values)
         return expectation_values
@@ -199,15 +203,7 @@ class QuantumSimulator(QuantumBackend):
             return measurements.get_distribution()
 
 
-def _flip_bits(n, num_bits):
-    return int(bin(n)[2:].zfill(num_bits)[::-1], 2)
-
-
 def flip_wavefunction(wavefunction: Wavefunction):
-    number_of_states = len(wavefunction.amplitudes)
-    ordering = [
-        _flip_bits(n, number_of_states.bit_length() - 1)
-        for n in range(number_of_states)
-    ]
-    flipped_amplitudes = [wavefunction.amplitudes[i] for i in ordering]
-    return Wavefunction(np.array(flipped_amplitudes))
+    from pyquil.wavefunction import Wavefunction
+
+    return Wavefunction(reverse_bit_order(wavefunction.amplitudes))
@@ -1,13 +1,17 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from openfermion import SymbolicOperator
 from typing_extensions import Protocol
 
 from ..circuits import Circuit
 from ..measurement import ExpectationValues
 from .backend import QuantumBackend
 
+if TYPE_CHECKING:
+    from openfermion import SymbolicOperator
+
 
 @dataclass(frozen=True)
 class EstimationTask:
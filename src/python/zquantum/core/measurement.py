@@ -1,35 +1,39 @@
 from __future__ import annotations
 
-import copy
+import itertools
 import json
+import os
 from collections import Counter
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
     Iterable,
     List,
     Optional,
     Sequence,
-    TextIO,
     Tuple,
     Union,
     cast,
 )
 
 import numpy as np
-from openfermion.ops import IsingOperator
-from pyquil.wavefunction import Wavefunction
 from zquantum.core.typing import AnyPath, LoadSource
 
 from .bitstring_distribution import BitstringDistribution
 from .utils import (
     SCHEMA_VERSION,
+    _apportion_by_largest_remainders,
+    _get_random_generator,
     convert_array_to_dict,
     convert_dict_to_array,
     convert_tuples_to_bitstrings,
-    sample_from_probability_distribution,
 )
 
+if TYPE_CHECKING:
+    from openfermion.ops import IsingOperator
+    from pyquil.wavefunction import Wavefunction
+
 
 def save_expectation_values(
     expectation_values: ExpectationValues, filename: AnyPath
@@ -75,6 +79,7 @@ def load_wavefunction(file: LoadSource) -> Wavefunction:
     Returns:
         wavefunction (pyquil.wavefunction.Wavefunction): the wavefunction object
     """
+    from pyquil.wavefunction import Wavefunction
 
     if isinstance(file, str):
         with open(file, "r") as f:
@@ -292,35 +297,28 @@ def get_expectation_values_from_parities(parities: Parities) -> ExpectationValue
     Returns:
         Expectation values of the operators and the associated precisions.
     """
-    values = []
-    estimator_covariances = []
-
-    for i in range(len(parities.values)):
-        N0 = parities.values[i][0]
-        N1 = parities.values[i][1]
-        N = N0 + N1
-        if N == 0:
-            raise ValueError("There must be at least one sample for each operator")
-
-        p = N0 / N
-        value = 2.0 * p - 1.0
-
-        # If there are enough samples and the probability of getting a sample with even
-        # parity is not close to 0 or 1, then we can use p=N0/N to approximate this
-        # probability and plug it into the formula for the precision.
-        if N >= 100 and p >= 0.1 and p <= 0.9:
-            precision = 2.0 * np.sqrt(p * (1.0 - p)) / np.sqrt(N)
-        else:
-            # Otherwise, p=N0/N may be not a good approximation of this probability.
-            # So we use an upper bound on the precision instead.
-            precision = 1.0 / np.sqrt(N)
-
-        values.append(value)
-        estimator_covariances.append(np.array([[precision ** 2.0]]))
-
-    return ExpectationValues(
-        values=np.array(values), estimator_covariances=estimator_covariances
+    parity_counts = np.asarray(parities.values).reshape(-1, 2)
+    N0 = parity_counts[:, 0]
+    N = parity_counts.sum(axis=1)
+    if np.any(N == 0):
+        raise ValueError("There must be at least one sample for each operator")
+
+    p = N0 / N
+    values = 2.0 * p - 1.0
+
+    # If there are enough samples and the probability of getting a sample with even
+    # parity is not close to 0 or 1, then we can use p=N0/N to approximate this
+    # probability and plug it into the formula for the precision. Otherwise, p=N0/N
+    # may be not a good approximation of this probability, so we use an upper bound
+    # on the precision instead.
+    precisions = np.where(
+        (N >= 100) & (p >= 0.1) & (p <= 0.9),
+        2.0 * np.sqrt(p * (1.0 - p)) / np.sqrt(N),
+        1.0 / np.sqrt(N),
     )
+    estimator_covariances = list((precisions ** 2.0).reshape(-1, 1, 1))
+
+    return ExpectationValues(values=values, estimator_covariances=estimator_covariances)
 
 
 def get_parities_from_measurements(
@@ -336,39 +334,35 @@ def get_parities_from_measurements(
         zquantum.core.measurement.Parities: the parities of each term in the operator
     """
 
+    from openfermion.ops import IsingOperator
+
     # check input format
     if not isinstance(ising_operator, IsingOperator):
         raise TypeError("Input operator not openfermion.IsingOperator")
 
-    # Count number of occurrences of bitstrings
-    bitstring_frequencies = Counter(measurements)
+    outcomes, counts, n_qubits = Measurements(measurements).get_histogram()
+    signs = _get_parity_signs(ising_operator, outcomes, n_qubits)
+    signed_counts = signs * counts
+    number_of_samples = counts.sum()
 
     # Count parity occurrences
-    values = []
-    for _, term in enumerate(ising_operator.terms):
-        values.append([0, 0])
-        marked_qubits = [op[0] for op in term]
-        for bitstring, count in bitstring_frequencies.items():
-            if check_parity(bitstring, marked_qubits):
-                values[-1][0] += count
-            else:
-                values[-1][1] += count
-
-    # Count parity occurrences for pairwise products of operators
-    correlations = [np.zeros((len(ising_operator.terms), len(ising_operator.terms), 2))]
-    for term1_index, term1 in enumerate(ising_operator.terms):
-        for term2_index, term2 in enumerate(ising_operator.terms):
-            marked_qubits_term1 = [op[0] for op in term1]
-            marked_qubits_term2 = [op[0] for op in term2]
-            for bitstring, count in bitstring_frequencies.items():
-                parity1 = check_parity(bitstring, marked_qubits_term1)
-                parity2 = check_parity(bitstring, marked_qubits_term2)
-                if parity1 == parity2:
-                    correlations[0][term1_index, term2_index][0] += count
-                else:
-                    correlations[0][term1_index, term2_index][1] += count
-
-    return Parities(np.array(values), correlations)
+    odd_counts = ((number_of_samples - signed_counts.sum(axis=1)) / 2).astype(int)
+    values = np.stack([number_of_samples - odd_counts, odd_counts], axis=1)
+
+    # Count parity occurrences for pairwise products of operators. The parities of
+    # two terms are equal when the product of their eigenvalues is +1.
+    sign_products_sums = signed_counts @ signs.T
+    correlations = [
+        np.stack(
+            [
+                (number_of_samples + sign_products_sums) / 2,
+                (number_of_samples - sign_products_sums) / 2,
+            ],
+            axis=2,
+        )
+    ]
+
+    return Parities(values, correlations)
 
 
 def expectation_values_to_real(
@@ -381,12 +375,7 @@ def expectation_values_to_real(
     Returns:
         expectation_values (zquantum.core.measurement.ExpectationValues object)
     """
-    values = []
-    for i, value in enumerate(expectation_values.values):
-        if isinstance(value, complex):
-            value = value.real
-        values.append(value)
-    expectation_values.values = np.array(values)
+    expectation_values.values = np.array(np.real(expectation_values.values))
     if expectation_values.correlations:
         for i, value in enumerate(expectation_values.correlations):
             if isinstance(value, complex):
@@ -453,18 +442,213 @@ def get_expectation_value_from_frequencies(
     return expectation
 
 
+def _get_outcome_dtype(n_qubits: int):
+    # Outcomes of more than 64 qubits don't fit into machine integers, so Python
+    # integers are used for them instead.
+    return np.uint64 if n_qubits <= 64 else object
+
+
+def _convert_bits_to_outcomes(
+    bits: Sequence[Sequence[int]], n_qubits: int
+) -> np.ndarray:
+    """Encode bitstrings as integers in which the value of qubit i is the i-th bit."""
+    dtype = _get_outcome_dtype(n_qubits)
+    bits_array = np.asarray(bits, dtype=np.uint8).reshape(len(bits), n_qubits)
+    weights = np.array([1 << qubit for qubit in range(n_qubits)], dtype=dtype)
+    return (bits_array.astype(dtype) * weights).sum(axis=1, dtype=dtype)
+
+
+def _convert_outcomes_to_bits(outcomes: np.ndarray, n_qubits: int) -> np.ndarray:
+    """Decode integer outcomes into an array of bits with one row per outcome."""
+    shifts = np.arange(n_qubits).astype(outcomes.dtype)
+    return ((outcomes[:, None] >> shifts) & 1).astype(np.uint8)
+
+
+def _convert_outcomes_to_bitstrings(outcomes: np.ndarray, n_qubits: int) -> List[str]:
+    if n_qubits == 0:
+        return [""] * len(outcomes)
+    characters = _convert_outcomes_to_bits(outcomes, n_qubits) + ord("0")
+    return characters.view(f"S{n_qubits}").ravel().astype(str).tolist()
+
+
+def _get_odd_parities(outcomes: np.ndarray, masks: np.ndarray) -> np.ndarray:
+    """Get a boolean array telling for each mask (rows) and outcome (columns) whether
+    an odd number of the bits selected by the mask are set in the outcome.
+    """
+    masked_outcomes = masks[:, None] & outcomes[None, :]
+    if masked_outcomes.dtype == object:
+        return np.vectorize(
+            lambda outcome: bin(outcome).count("1") % 2 == 1, otypes=[bool]
+        )(masked_outcomes)
+    for shift in (32, 16, 8, 4, 2, 1):
+        masked_outcomes ^= masked_outcomes >> np.uint64(shift)
+    return (masked_outcomes & 1).astype(bool)
+
+
+def _get_parity_signs(
+    ising_operator: IsingOperator, outcomes: np.ndarray, n_qubits: int
+) -> np.ndarray:
+    """Get the eigenvalues (+1 or -1) of each term of an Ising operator (rows) for each
+    of the measured outcomes (columns).
+    """
+    if len(outcomes) > 0 and any(
+        qubit >= n_qubits for term in ising_operator.terms for qubit, _ in term
+    ):
+        raise ValueError("The operator acts on qubits that were not measured.")
+    masks = np.array(
+        [sum(1 << qubit for qubit, _ in term) for term in ising_operator.terms],
+        dtype=outcomes.dtype,
+    )
+    return 1.0 - 2.0 * _get_odd_parities(outcomes, masks)
+
+
+_BINARY_MEASUREMENTS_MAGIC = b"\x93ZQUANTUM-MEASUREMENTS\n"
+
+
+def _write_binary_measurements(
+    filename: AnyPath, outcomes: np.ndarray, counts: np.ndarray, n_qubits: int
+) -> None:
+    """Write a histogram of measurements in the binary measurements format.
+
+    The file starts with a magic string and a line of JSON metadata, followed by the
+    counts and the outcomes stored as arrays in the .npy format. Outcomes of up to 64
+    qubits are stored as unsigned integers, larger ones as rows of packed bits.
+    """
+    if n_qubits <= 64:
+        encoding = "uint64"
+        outcomes_array = np.asarray(outcomes, dtype="<u8")
+    else:
+        encoding = "packed_bits"
+        outcomes_array = np.packbits(
+            _convert_outcomes_to_bits(outcomes, n_qubits), axis=1, bitorder="little"
+        )
+    metadata = json.dumps(
+        {
+            "schema": SCHEMA_VERSION + "-measurements",
+            "n_qubits": n_qubits,
+            "outcome_encoding": encoding,
+        }
+    ).encode()
+    # Pad the metadata so that the arrays start at an aligned offset
+    padding = -(len(_BINARY_MEASUREMENTS_MAGIC) + len(metadata) + 1) % 64
+    with open(filename, "wb") as f:
+        f.write(_BINARY_MEASUREMENTS_MAGIC + metadata + b" " * padding + b"\n")
+        np.lib.format.write_array(f, np.asarray(counts, dtype="<i8"))
+        np.lib.format.write_array(f, outcomes_array)
+
+
+def _read_npy_array(file, filename: Optional[AnyPath]) -> np.ndarray:
+    """Read an array in the .npy format starting at the current position of the file,
+    memory-mapping it if the name of the file is known.
+    """
+    version = np.lib.format.read_magic(file)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+    order = "F" if fortran_order else "C"
+    n_bytes = int(np.prod(shape)) * dtype.itemsize
+
+    if filename is None or n_bytes == 0:
+        array = np.frombuffer(file.read(n_bytes), dtype=dtype)
+        return array.reshape(shape, order=order)
+
+    offset = file.tell()
+    file.seek(offset + n_bytes)
+    return np.memmap(
+        filename, dtype=dtype, mode="r", offset=offset, shape=shape, order=order
+    )
+
+
+def _read_binary_measurements(
+    file, filename: Optional[AnyPath] = None
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Read the histogram of measurements from a file in the binary format, positioned
+    right after the magic string.
+    """
+    metadata = json.loads(file.readline())
+    n_qubits = metadata["n_qubits"]
+    counts = _read_npy_array(file, filename)
+    outcomes = _read_npy_array(file, filename)
+    if metadata["outcome_encoding"] == "packed_bits":
+        bits = np.unpackbits(outcomes, axis=1, count=n_qubits, bitorder="little")
+        outcomes = _convert_bits_to_outcomes(bits, n_qubits)
+    return outcomes, counts, n_qubits
+
+
 class Measurements:
     """A class representing measurements from a quantum circuit. The bitstrings variable
     represents the internal data structure of the Measurements class. It is expressed as
     a list of tuples wherein each tuple is a measurement and the value of the tuple at a
-    given index is the measured bit-value of the qubit (indexed from 0 -> N-1)"""
+    given index is the measured bit-value of the qubit (indexed from 0 -> N-1)
+
+    Measurements created from counts are instead stored as a histogram: the unique
+    outcomes encoded as integers (qubit i being the i-th bit) and the number of times
+    each of them was measured. All statistics are computed from the histogram, and the
+    list of bitstrings is only created when the bitstrings attribute is accessed."""
 
     def __init__(self, bitstrings: Optional[List[Tuple[int, ...]]] = None):
-        if bitstrings is None:
-            self.bitstrings = []
-        else:
+        self._bitstrings: Optional[List[Tuple[int, ...]]] = None
+        self._reset_histogram()
+        if bitstrings is not None:
             self.bitstrings = bitstrings
 
+    def _reset_histogram(self):
+        self._n_qubits = 0
+        self._outcomes = np.zeros(0, dtype=_get_outcome_dtype(0))
+        self._counts = np.zeros(0, dtype=np.int64)
+
+    @property
+    def bitstrings(self) -> List[Tuple[int, ...]]:
+        if self._bitstrings is None:
+            # From now on the list is the source of truth, so that modifying it in
+            # place is reflected in the measurements.
+            unique_bitstrings = map(
+                tuple,
+                _convert_outcomes_to_bits(self._outcomes, self._n_qubits).tolist(),
+            )
+            self._bitstrings = list(
+                itertools.chain.from_iterable(
+                    itertools.repeat(bitstring, count)
+                    for bitstring, count in zip(
+                        unique_bitstrings, self._counts.tolist()
+                    )
+                )
+            )
+        return self._bitstrings
+
+    @bitstrings.setter
+    def bitstrings(self, bitstrings: List[Tuple[int, ...]]):
+        self._bitstrings = bitstrings
+        # The list replaces all measurements, including those stored as counts
+        self._reset_histogram()
+
+    def get_histogram(self) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Get the histogram of the measurements without materializing bitstrings.
+
+        Returns:
+            Unique outcomes, encoded as integers whose i-th bit is the outcome of
+            qubit i, their counts and the number of measured qubits.
+
+        Raises:
+            ValueError: if bitstrings of different lengths were measured.
+        """
+        if self._bitstrings is None:
+            return self._outcomes, self._counts, self._n_qubits
+
+        frequencies = Counter(map(tuple, self._bitstrings))
+        n_qubits = len(next(iter(frequencies), ()))
+        if any(len(bitstring) != n_qubits for bitstring in frequencies):
+            raise ValueError(
+                "Measurements of bitstrings of different lengths can't be represented "
+                "as a histogram."
+            )
+        outcomes = _convert_bits_to_outcomes(list(frequencies.keys()), n_qubits)
+        counts = np.fromiter(
+            frequencies.values(), dtype=np.int64, count=len(frequencies)
+        )
+        return outcomes, counts, n_qubits
+
     @classmethod
     def from_counts(cls, counts: Dict[str, int]):
         """Create an instance of the Measurements class from a dictionary
@@ -484,66 +668,64 @@ class Measurements:
         """Create an instance of the Measurements class that exactly (or as closely as
         possible) resembles the input bitstring distribution.
 
+        The expected number of occurrences of each bitstring is rounded down, and the
+        samples still missing are given to the bitstrings with the largest fractional
+        parts of the expected numbers (largest remainder method). The measurements
+        are stored as counts.
+
         Args:
             bitstring_distribution: the bitstring distribution to be sampled
             number_of_samples: the number of measurements
         """
-        distribution = copy.deepcopy(bitstring_distribution.distribution_dict)
-
-        bitstring_samples = []
-        # Rounding gives the closest integer to the observed frequency
-        for state in distribution:
-            bitstring = tuple([int(measurement_value) for measurement_value in state])
-
-            bitstring_samples += [bitstring] * int(
-                round(distribution[state] * number_of_samples)
-            )
-
-        # If frequencies are inconsistent with number of samples, we may need to
-        # add or delete samples. The bitstrings to correct are chosen at random,
-        # giving more weight to those with non-integer part closest to 0.5
-        if len(bitstring_samples) != number_of_samples:
-            leftover_distribution = BitstringDistribution(
-                {
-                    states: 0.5
-                    - abs(0.5 - (distribution[states] * number_of_samples) % 1)
-                    for states in distribution
-                },
-                True,
-            )
+        distribution = bitstring_distribution.distribution_dict
+        probabilities = np.fromiter(
+            distribution.values(), dtype=float, count=len(distribution)
+        )
+        # Bitstrings with equally large fractional parts of their expected counts are
+        # chosen at random to get the samples left after rounding down.
+        counts = _apportion_by_largest_remainders(
+            probabilities * (number_of_samples / probabilities.sum()),
+            number_of_samples,
+            _get_random_generator(),
+        )
+        return cls.from_counts(dict(zip(distribution.keys(), counts.tolist())))
 
-            samples = sample_from_probability_distribution(
-                leftover_distribution.distribution_dict,
-                abs(number_of_samples - len(bitstring_samples)),
-            )
-            if number_of_samples - len(bitstring_samples) > 0:
-                for sample in samples:
-                    bitstring_samples += [
-                        tuple([int(measurement_value) for measurement_value in sample])
-                    ] * samples[sample]
-            else:
-                for sample in samples:
-                    for _ in range(samples[sample]):
-                        bitstring_samples.remove(
-                            tuple(
-                                [int(measurement_value) for measurement_value in sample]
-                            )
-                        )
-
-        return cls(bitstring_samples)
+    @classmethod
+    def _from_histogram(
+        cls, outcomes: np.ndarray, counts: np.ndarray, n_qubits: int
+    ) -> Measurements:
+        measurements = cls()
+        measurements._outcomes = outcomes
+        measurements._counts = counts
+        measurements._n_qubits = n_qubits
+        return measurements
 
     @classmethod
-    def load_from_file(cls, file: TextIO):
+    def load_from_file(cls, file: LoadSource):
         """Load a set of measurements from file
 
+        Both the JSON and the binary format written by save are supported, and the
+        format is detected automatically. Files in the binary format are
+        memory-mapped, so statistics of the measurements are computed without
+        reading the whole file into Python objects.
+
         Args:
             file (str or file-like object): the name of the file, or a file-like object
         """
-        if isinstance(file, str):
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with open(file, "rb") as f:
+                if (
+                    f.read(len(_BINARY_MEASUREMENTS_MAGIC))
+                    == _BINARY_MEASUREMENTS_MAGIC
+                ):
+                    return cls._from_histogram(*_read_binary_measurements(f, file))
             with open(file, "r") as f:
                 data = json.load(f)
         else:
-            data = json.load(file)
+            start = file.read(len(_BINARY_MEASUREMENTS_MAGIC))
+            if start == _BINARY_MEASUREMENTS_MAGIC:
+                return cls._from_histogram(*_read_binary_measurements(file))
+            data = json.loads(start + file.read())
 
         bitstrings = []
         for bitstring in data["bitstrings"]:
@@ -551,12 +733,18 @@ class Measurements:
 
         return cls(bitstrings=bitstrings)
 
-    def save(self, filename: AnyPath):
+    def save(self, filename: AnyPath, binary: bool = False):
         """Serialize the Measurements object into a file in JSON format.
 
         Args:
             filename (string): filename to save the data to
+            binary: if True, save only the counts of the measurements in a compact
+                binary format instead. The order of the bitstrings is not preserved.
         """
+        if binary:
+            _write_binary_measurements(filename, *self.get_histogram())
+            return
+
         data = {
             "schema": SCHEMA_VERSION + "-measurements",
             "counts": self.get_counts(),
@@ -575,8 +763,19 @@ class Measurements:
             A dictionary mapping bitstrings to integers representing the number of times
             the bitstring was measured
         """
-        bitstrings = convert_tuples_to_bitstrings(self.bitstrings)
-        return dict(Counter(bitstrings))
+        if self._bitstrings is not None:
+            # Bitstrings of different lengths are counted as well
+            frequencies = Counter(map(tuple, self._bitstrings))
+            return dict(
+                zip(convert_tuples_to_bitstrings(frequencies), frequencies.values())
+            )
+
+        return dict(
+            zip(
+                _convert_outcomes_to_bitstrings(self._outcomes, self._n_qubits),
+                self._counts.tolist(),
+            )
+        )
 
     def add_counts(self, counts: Dict[str, int]):
         """Add measurements from a histogram
@@ -587,12 +786,50 @@ class Measurements:
                 NOTE: bitstrings are also indexed from 0 -> N-1, where the "001"
                 bitstring represents a measurement of qubit 2 in the 1 state
         """
-        for bitstring in counts.keys():
-            measurement = []
-            for bitvalue in bitstring:
-                measurement.append(int(bitvalue))
-
-            self.bitstrings += [tuple(measurement)] * counts[bitstring]
+        counts = {bitstring: count for bitstring, count in counts.items() if count > 0}
+        if not counts:
+            return
+
+        n_qubits = len(next(iter(counts)))
+        if self._bitstrings is not None and len(self._bitstrings) == 0:
+            self._bitstrings = None
+            self._reset_histogram()
+        if self._bitstrings is None and self._counts.size == 0:
+            self._n_qubits = n_qubits
+            self._outcomes = self._outcomes.astype(_get_outcome_dtype(n_qubits))
+
+        if (
+            self._bitstrings is not None
+            or n_qubits != self._n_qubits
+            or any(len(bitstring) != n_qubits for bitstring in counts)
+        ):
+            for bitstring in counts.keys():
+                measurement = []
+                for bitvalue in bitstring:
+                    measurement.append(int(bitvalue))
+
+                self.bitstrings += [tuple(measurement)] * counts[bitstring]
+            return
+
+        new_outcomes = np.array(
+            [int(bitstring[::-1], 2) if bitstring else 0 for bitstring in counts],
+            dtype=self._outcomes.dtype,
+        )
+        outcomes, first_indices, inverse = np.unique(
+            np.concatenate([self._outcomes, new_outcomes]),
+            return_index=True,
+            return_inverse=True,
+        )
+        merged_counts = np.zeros(len(outcomes), dtype=np.int64)
+        np.add.at(
+            merged_counts,
+            inverse.ravel(),
+            np.concatenate([self._counts, np.fromiter(counts.values(), np.int64)]),
+        )
+        # Keep the outcomes in the order in which they were first added
+        order = np.argsort(first_indices, kind="stable")
+        self._outcomes = outcomes[order]
+        self._counts = merged_counts[order]
 
     def get_distribution(self) -> BitstringDistribution:
         """Get the normalized probability distribution representing the measurements
@@ -601,7 +838,7 @@ class Measurements:
             distribution: bitstring distribution based on the frequency of measurements
         """
         counts = self.get_counts()
-        num_measurements = len(self.bitstrings)
+        num_measurements = sum(counts.values())
 
         distribution = {}
         for bitstring in counts.keys():
@@ -609,6 +846,27 @@ class Measurements:
 
         return BitstringDistribution(distribution)
 
+    def _get_histogram_for_operator(
+        self, ising_operator: IsingOperator
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Get the histogram of the measurements of qubits the operator acts on.
+
+        Bitstrings of different lengths are truncated to the shortest of them, as long
+        as it includes all qubits the operator acts on.
+        """
+        if self._bitstrings is None or len(set(map(len, self._bitstrings))) <= 1:
+            return self.get_histogram()
+
+        n_qubits = min(map(len, self._bitstrings))
+        if any(qubit >= n_qubits for term in ising_operator.terms for qubit, _ in term):
+            raise ValueError(
+                f"Operator acts on qubits missing from some of the bitstrings, the "
+                f"shortest of which has {n_qubits} qubits."
+            )
+        return Measurements(
+            [bitstring[:n_qubits] for bitstring in self._bitstrings]
+        ).get_histogram()
+
     def get_expectation_values(
         self, ising_operator: IsingOperator, use_bessel_correction: bool = True
     ) -> ExpectationValues:
@@ -624,6 +882,8 @@ class Measurements:
         Returns:
             expectation values of each term in the operator
         """
+        from openfermion.ops import IsingOperator
+
         # We require operator to be IsingOperator because measurements are always
         # performed in the Z basis, so we need the operator to be Ising (containing only
         # Z terms). A general Qubit Operator could have X or Y terms which don’t get
@@ -631,38 +891,24 @@ class Measurements:
         if not isinstance(ising_operator, IsingOperator):
             raise TypeError("Input operator is not openfermion.IsingOperator")
 
-        # Count number of occurrences of bitstrings
-        bitstring_frequencies = self.get_counts()
-        num_measurements = len(self.bitstrings)
+        outcomes, counts, n_qubits = self._get_histogram_for_operator(ising_operator)
+        num_measurements = int(counts.sum())
 
-        # Perform weighted average
-        expectation_values_list = [
-            coefficient
-            * get_expectation_value_from_frequencies(
-                [cast(int, op[0]) for op in term], bitstring_frequencies
-            )
-            for term, coefficient in ising_operator.terms.items()
-        ]
-        expectation_values = np.array(expectation_values_list)
+        # The expectation value of a product of Z operators is the average of its
+        # eigenvalues, and the eigenvalue of the product of two terms is the product
+        # of their eigenvalues. Sums of the signed counts are integers, so they are
+        # computed exactly regardless of the order of summation.
+        signs = _get_parity_signs(ising_operator, outcomes, n_qubits)
+        signed_counts = signs * counts
+        normalization = max(num_measurements, 1)
+        coefficients = np.array(list(ising_operator.terms.values()))
+        expectation_values = coefficients * (signed_counts.sum(axis=1) / normalization)
 
         correlations = np.zeros((len(ising_operator.terms),) * 2)
-        for i, first_term in enumerate(ising_operator.terms):
-            correlations[i, i] = ising_operator.terms[first_term] ** 2
-            for j in range(i):
-                second_term = list(ising_operator.terms.keys())[j]
-                first_term_qubits = set(op[0] for op in first_term)
-                second_term_qubits = set(op[0] for op in second_term)
-                marked_qubits = first_term_qubits.symmetric_difference(
-                    second_term_qubits
-                )
-                correlations[i, j] = (
-                    ising_operator.terms[first_term]
-                    * ising_operator.terms[second_term]
-                    * get_expectation_value_from_frequencies(
-                        marked_qubits, bitstring_frequencies
-                    )
-                )
-                correlations[j, i] = correlations[i, j]
+        correlations[:] = np.outer(coefficients, coefficients) * (
+            (signed_counts @ signs.T) / normalization
+        )
+        np.fill_diagonal(correlations, coefficients ** 2)
 
         denominator = (
             num_measurements - 1 if use_bessel_correction else num_measurements
@@ -678,6 +924,28 @@ class Measurements:
         )
 
 
+def get_total_estimator_variance(estimator_covariances: List[np.ndarray]) -> float:
+    """Get the estimated variance of the sum of all expectation values.
+
+    Args:
+        estimator_covariances: estimator covariances of the expectation values of
+            each frame.
+
+    Returns:
+        The sum of the entries of all the covariance matrices.
+    """
+    if not estimator_covariances:
+        return 0.0
+    # A single reduction over all entries, instead of summing each frame separately
+    return float(
+        np.sum(
+            np.concatenate(
+                [np.ravel(covariance) for covariance in estimator_covariances]
+            )
+        )
+    )
+
+
 def concatenate_expectation_values(
     expectation_values_set: Iterable[ExpectationValues],
 ) -> ExpectationValues:
@@ -690,21 +958,36 @@ def concatenate_expectation_values(
         The combined expectation values.
     """
 
-    combined_expectation_values = ExpectationValues(np.zeros(0))
+    expectation_values_list = list(expectation_values_set)
 
-    for expectation_values in expectation_values_set:
-        combined_expectation_values.values = np.concatenate(
-            (combined_expectation_values.values, expectation_values.values)
+    # All values are copied into a single preallocated array, instead of growing
+    # the array with each of the concatenated objects.
+    combined_expectation_values = ExpectationValues(
+        np.concatenate(
+            [np.zeros(0)]
+            + [
+                expectation_values.values
+                for expectation_values in expectation_values_list
+            ]
         )
-        if expectation_values.correlations:
-            if not combined_expectation_values.correlations:
-                combined_expectation_values.correlations = []
-            combined_expectation_values.correlations += expectation_values.correlations
-        if expectation_values.estimator_covariances:
-            if not combined_expectation_values.estimator_covariances:
-                combined_expectation_values.estimator_covariances = []
-            combined_expectation_values.estimator_covariances += (
-                expectation_values.estimator_covariances
-            )
+    )
+
+    correlations = list(
+        itertools.chain.from_iterable(
+            expectation_values.correlations or []
+            for expectation_values in expectation_values_list
+        )
+    )
+    if correlations:
+        combined_expectation_values.correlations = correlations
+
+    estimator_covariances = list(
+        itertools.chain.from_iterable(
+            expectation_values.estimator_covariances or []
+            for expectation_values in expectation_values_list
+        )
+    )
+    if estimator_covariances:
+        combined_expectation_values.estimator_covariances = estimator_covariances
 
     return combined_expectation_values
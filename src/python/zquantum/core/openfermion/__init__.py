@@ -1,4 +1,64 @@
-from ._io import *  # noqa: F403
-from ._pyquil_conversions import *  # noqa: F403
-from ._qiskit_conversions import *  # noqa: F403
-from ._utils import *  # noqa: F403
+import importlib
+
+# Submodules are imported on first use, so that importing openfermion doesn't
+# import OpenFermion, Cirq, PyQuil and Qiskit.
+_LAZY_ATTRIBUTES = {
+    "convert_interaction_op_to_dict": "._io",
+    "convert_dict_to_interaction_op": "._io",
+    "load_interaction_operator": "._io",
+    "save_interaction_operator": "._io",
+    "convert_dict_to_qubitop": "._io",
+    "convert_qubitop_to_dict": "._io",
+    "convert_dict_to_operator": "._io",
+    "save_qubit_operator": "._io",
+    "load_qubit_operator": "._io",
+    "save_qubit_operator_set": "._io",
+    "load_qubit_operator_set": "._io",
+    "get_pauli_strings": "._io",
+    "convert_isingop_to_dict": "._io",
+    "convert_dict_to_isingop": "._io",
+    "load_ising_operator": "._io",
+    "save_ising_operator": "._io",
+    "save_parameter_grid_evaluation": "._io",
+    "convert_interaction_rdm_to_dict": "._io",
+    "convert_dict_to_interaction_rdm": "._io",
+    "load_interaction_rdm": "._io",
+    "save_interaction_rdm": "._io",
+    "SUPPORTED_TRANSFORMATIONS": "._transforms",
+    "get_interaction_operator_hash": "._transforms",
+    "transform_interaction_operator": "._transforms",
+    "get_qubitop_from_matrix": "._utils",
+    "get_qubitop_from_coeffs_and_labels": "._utils",
+    "generate_random_qubitop": "._utils",
+    "evaluate_qubit_operator": "._utils",
+    "evaluate_qubit_operator_list": "._utils",
+    "reverse_qubit_order": "._utils",
+    "get_expectation_value": "._utils",
+    "get_expectation_values_for_terms": "._utils",
+    "change_operator_type": "._utils",
+    "get_fermion_number_operator": "._utils",
+    "get_diagonal_component": "._utils",
+    "get_polynomial_tensor": "._utils",
+    "qubitop_to_paulisum": "._utils",
+    "create_circuits_from_qubit_operator": "._utils",
+    "get_ground_state_rdm_from_qubit_op": "._utils",
+    "remove_inactive_orbitals": "._utils",
+    "qubitop_to_pyquilpauli": "._pyquil_conversions",
+    "pyquilpauli_to_qubitop": "._pyquil_conversions",
+    "qubitop_to_qiskitpauli": "._qiskit_conversions",
+    "qiskitpauli_to_qubitop": "._qiskit_conversions",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
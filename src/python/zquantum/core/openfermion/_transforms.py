@@ -0,0 +1,231 @@
+import hashlib
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+from openfermion import (
+    FermionOperator,
+    InteractionOperator,
+    QubitOperator,
+    bravyi_kitaev,
+    get_fermion_operator,
+    jordan_wigner,
+    jordan_wigner_one_body,
+    jordan_wigner_two_body,
+)
+
+from ..typing import AnyPath
+from ._io import load_qubit_operator, save_qubit_operator
+
+__all__ = [
+    "SUPPORTED_TRANSFORMATIONS",
+    "get_interaction_operator_hash",
+    "transform_interaction_operator",
+]
+
+SUPPORTED_TRANSFORMATIONS = ("Jordan-Wigner", "Bravyi-Kitaev")
+
+
+def get_interaction_operator_hash(
+    interaction_operator: InteractionOperator, transformation: str = ""
+) -> str:
+    """Compute a hash of the content of an interaction operator.
+
+    Two operators with identical constants and tensors (including their shapes and
+    dtypes) have the same hash, regardless of their identity in memory.
+
+    Args:
+        interaction_operator: the operator to hash.
+        transformation: optional name of the transformation mixed into the hash, so
+            that results of different transformations can share a cache directory.
+
+    Returns:
+        Hex digest of the SHA-256 hash of the operator's content.
+    """
+    digest = hashlib.sha256()
+    digest.update(transformation.encode())
+    digest.update(np.asarray(interaction_operator.constant, dtype=complex).tobytes())
+    for tensor in (
+        interaction_operator.one_body_tensor,
+        interaction_operator.two_body_tensor,
+    ):
+        tensor = np.ascontiguousarray(tensor)
+        digest.update(str((tensor.shape, tensor.dtype.str)).encode())
+        digest.update(tensor.tobytes())
+    return digest.hexdigest()
+
+
+def _split_interaction_operator(
+    interaction_operator: InteractionOperator, n_blocks: int
+) -> List[Tuple[complex, Optional[np.ndarray], np.ndarray, int]]:
+    """Split an interaction operator into blocks summing up to the original operator.
+
+    The two-body tensor is partitioned along its first index, and each block holds
+    only its slice of the tensor together with the index at which the slice starts.
+    The constant and the one-body tensor are put in the first block.
+    """
+    n_modes = interaction_operator.two_body_tensor.shape[0]
+    boundaries = np.linspace(0, n_modes, min(n_blocks, max(n_modes, 1)) + 1).astype(int)
+    return [
+        (
+            interaction_operator.constant if block_index == 0 else 0.0,
+            interaction_operator.one_body_tensor if block_index == 0 else None,
+            interaction_operator.two_body_tensor[start:stop],
+            int(start),
+        )
+        for block_index, (start, stop) in enumerate(
+            zip(boundaries[:-1], boundaries[1:])
+        )
+    ]
+
+
+def _count_active_modes(interaction_operator: InteractionOperator) -> int:
+    """Number of modes up to the highest one with a nonzero coefficient, i.e. the
+    number of qubits of the operator's fermion operator counterpart.
+    """
+    highest_mode = -1
+    for tensor in (
+        interaction_operator.one_body_tensor,
+        interaction_operator.two_body_tensor,
+    ):
+        nonzero_indices = np.nonzero(tensor)
+        if len(nonzero_indices[0]) > 0:
+            highest_mode = max(highest_mode, max(map(np.max, nonzero_indices)))
+    return int(highest_mode) + 1
+
+
+def _jordan_wigner_block(
+    constant: complex,
+    one_body_tensor: Optional[np.ndarray],
+    two_body_tensor: np.ndarray,
+    offset: int,
+) -> QubitOperator:
+    """Jordan-Wigner transformation of a block of a hermitian interaction operator.
+
+    jordan_wigner_one_body and jordan_wigner_two_body map a term together with its
+    hermitian conjugate, unless the term is its own conjugate. Coefficients of all
+    other terms are therefore halved, as their conjugates are also in the operator.
+    """
+    transformed_operator = QubitOperator((), constant)
+    if one_body_tensor is not None:
+        for p, q in zip(*np.nonzero(one_body_tensor)):
+            coefficient = one_body_tensor[p, q] * (1 if p == q else 0.5)
+            transformed_operator += jordan_wigner_one_body(int(p), int(q), coefficient)
+    for p, q, r, s in zip(*np.nonzero(two_body_tensor)):
+        modes = (int(p) + offset, int(q), int(r), int(s))
+        coefficient = two_body_tensor[p, q, r, s] * (1 if len(set(modes)) == 2 else 0.5)
+        transformed_operator += jordan_wigner_two_body(*modes, coefficient)
+    return transformed_operator
+
+
+def _get_block_fermion_operator(
+    constant: complex,
+    one_body_tensor: Optional[np.ndarray],
+    two_body_tensor: np.ndarray,
+    offset: int,
+) -> FermionOperator:
+    fermion_operator = FermionOperator((), constant)
+    if one_body_tensor is not None:
+        for p, q in zip(*np.nonzero(one_body_tensor)):
+            fermion_operator += FermionOperator(
+                ((int(p), 1), (int(q), 0)), one_body_tensor[p, q]
+            )
+    for p, q, r, s in zip(*np.nonzero(two_body_tensor)):
+        fermion_operator += FermionOperator(
+            ((int(p) + offset, 1), (int(q), 1), (int(r), 0), (int(s), 0)),
+            two_body_tensor[p, q, r, s],
+        )
+    return fermion_operator
+
+
+def _transform_block(
+    transformation: str,
+    block: Tuple[complex, Optional[np.ndarray], np.ndarray, int],
+    n_qubits: int,
+) -> QubitOperator:
+    if transformation == "Jordan-Wigner":
+        return _jordan_wigner_block(*block)
+    # Unlike Jordan-Wigner, Bravyi-Kitaev depends on the total number of qubits,
+    # which a single block may underestimate.
+    return bravyi_kitaev(_get_block_fermion_operator(*block), n_qubits=n_qubits)
+
+
+def _transform(
+    transformation: str, interaction_operator: InteractionOperator, n_workers: int
+) -> QubitOperator:
+    if n_workers <= 1:
+        if transformation == "Jordan-Wigner":
+            return jordan_wigner(interaction_operator)
+        return bravyi_kitaev(get_fermion_operator(interaction_operator))
+
+    blocks = _split_interaction_operator(interaction_operator, n_workers)
+    n_qubits = _count_active_modes(interaction_operator)
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        partial_operators = list(
+            executor.map(
+                _transform_block,
+                [transformation] * len(blocks),
+                blocks,
+                [n_qubits] * len(blocks),
+            )
+        )
+
+    transformed_operator = QubitOperator()
+    for partial_operator in partial_operators:
+        transformed_operator += partial_operator
+    return transformed_operator
+
+
+def transform_interaction_operator(
+    interaction_operator: InteractionOperator,
+    transformation: str = "Jordan-Wigner",
+    n_workers: int = 1,
+    cache_dir: Optional[AnyPath] = None,
+) -> QubitOperator:
+    """Map an interaction operator to a qubit operator, optionally in parallel and
+    with the result memoized on disk.
+
+    With n_workers > 1 the two-body tensor is split into blocks along its first index,
+    each block is transformed term by term in a separate process and the results are
+    summed. For hermitian operators this agrees with the serial
+    transformation up to floating point rounding.
+
+    Args:
+        interaction_operator: the operator to transform.
+        transformation: either "Jordan-Wigner" or "Bravyi-Kitaev".
+        n_workers: number of worker processes used for the transformation.
+        cache_dir: directory in which transformed operators are stored, keyed by the
+            hash of the operator's content and the transformation. If the directory
+            already contains the result, the transformation is skipped.
+
+    Returns:
+        The transformed qubit operator.
+    """
+    if transformation not in SUPPORTED_TRANSFORMATIONS:
+        raise RuntimeError("Unrecognized transformation ", transformation)
+
+    cache_path = None
+    if cache_dir is not None:
+        operator_hash = get_interaction_operator_hash(
+            interaction_operator, transformation
+        )
+        cache_path = os.path.join(cache_dir, f"{operator_hash}.json")
+        if os.path.exists(cache_path):
+            return load_qubit_operator(cache_path)
+
+    transformed_operator = _transform(transformation, interaction_operator, n_workers)
+
+    if cache_path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temporary file first, so that concurrent workflows never read
+        # a partially written operator.
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            dir=cache_dir, suffix=".json.tmp"
+        )
+        os.close(file_descriptor)
+        save_qubit_operator(transformed_operator, temporary_path)
+        os.replace(temporary_path, cache_path)
+
+    return transformed_operator
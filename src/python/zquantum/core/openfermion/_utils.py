@@ -1,6 +1,6 @@
-import itertools
 import random
-from typing import Iterable, List, Optional, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
 import cirq
 import numpy as np
@@ -19,21 +19,30 @@ from openfermion import (
     normal_ordered,
     number_operator,
 )
+from openfermion.config import EQ_TOLERANCE
 from openfermion.linalg import jw_get_ground_state_at_particle_number
-from openfermion.transforms import freeze_orbitals, get_fermion_operator
+from openfermion.ops import SymbolicOperator
 
 from ..circuits import Circuit, X, Y, Z
 from ..measurement import ExpectationValues, expectation_values_to_real
-from ..utils import ValueEstimate, bin2dec, dec2bin
+from ..utils import ValueEstimate, reverse_bit_order
 
 
-def get_qubitop_from_matrix(operator: List[List]) -> QubitOperator:
+def get_qubitop_from_matrix(
+    operator: List[List], threshold: float = EQ_TOLERANCE
+) -> QubitOperator:
     r"""Expands a 2^n by 2^n matrix into n-qubit Pauli basis. The runtime of
-    this function is O(2^2n).
+    this function is O(n 2^2n).
+
+    For every set of flipped qubits, the traces with all the Pauli strings flipping
+    these qubits are obtained at once from the Walsh-Hadamard transform of the
+    corresponding "XOR-diagonal" of the matrix, i.e. of its elements O[j, j ^ x].
 
     Args:
         operator: a list of lists (rows) representing a 2^n by 2^n
             matrix.
+        threshold: terms with coefficients smaller in absolute value than
+            threshold are omitted.
 
     Returns:
         A QubitOperator instance corresponding to the expansion of
@@ -57,65 +66,55 @@ def get_qubitop_from_matrix(operator: List[List]) -> QubitOperator:
 
     n = int(np.log2(nrows))  # number of qubits
 
-    def decode(bit_string):  # Helper function for converting any 2n-bit
-        # string to a label vector representing a Pauli
-        # string of length n
-
-        if len(bit_string) != 2 * n:
-            raise Exception("LH_expand:decode: input bit string length not 2n")
-
-        output_label = list(np.zeros(n))
-        for i in range(0, n):
-            output_label[i] = bin2dec(bit_string[2 * i : 2 * i + 2])
-
-        return output_label
-
-    def trace_product(label_vec):  # Helper function for computing tr(OP)
-        # where O is the input operator and P is a
-        # Pauli string operator
-
-        def f(j):  # Function which computes the index of the nonzero
-            # element in P for a given column j
-
-            j_str = dec2bin(j, n)
-            for index in range(0, n):
-                if label_vec[index] in [1, 2]:  # flip if X or Y
-                    j_str[index] = int(not j_str[index])
-            return bin2dec(j_str)
-
-        def nz(j):  # Function which computes the value of the nonzero
-            # element in P on the column j
-
-            val_nz = 1.0
-            j_str = dec2bin(j, n)
-            for index in range(0, n):
-                if label_vec[index] == 2:
-                    if j_str[index] == 0:
-                        val_nz = val_nz * (1j)
-                    if j_str[index] == 1:
-                        val_nz = val_nz * (-1j)
-                if label_vec[index] == 3:
-                    if j_str[index] == 1:
-                        val_nz = val_nz * (-1)
-            return val_nz
-
-        # Compute the trace
-        tr = 0.0
-        for j in range(0, 2 ** n):  # loop over the columns
-            tr = tr + operator[j][f(j)] * nz(j)
-
-        return tr / 2 ** n
-
-    # Expand the operator in Pauli basis
-    coeffs = list(np.zeros(4 ** n))
-    labels = list(np.zeros(4 ** n))
-    for i in range(0, 4 ** n):  # loop over all 2n-bit strings
-        current_string = dec2bin(i, 2 * n)  # see util.py
-        current_label = decode(current_string)
-        coeffs[i] = trace_product(current_label)
-        labels[i] = current_label
+    # Qubit k corresponds to bit n - 1 - k of row/column index. Coefficients are
+    # indexed by masks of qubits on which the Pauli string acts with X or Y
+    # (flip_masks) and with Y or Z (phase_masks).
+    indices = np.arange(nrows)
+    xor_diagonals = np.asarray(operator, dtype=complex)[
+        indices[np.newaxis, :], indices[np.newaxis, :] ^ indices[:, np.newaxis]
+    ]
+
+    # Walsh-Hadamard transform along the column index, one bit at a time.
+    transformed = xor_diagonals.reshape((nrows,) + (2,) * n)
+    for axis in range(1, n + 1):
+        even, odd = transformed.take(0, axis=axis), transformed.take(1, axis=axis)
+        transformed = np.stack((even + odd, even - odd), axis=axis)
+    transformed = transformed.reshape(nrows, nrows)
+
+    number_of_ys = np.zeros((nrows, nrows), dtype=int)
+    y_masks = indices[:, np.newaxis] & indices[np.newaxis, :]
+    for bit in range(n):
+        number_of_ys += (y_masks >> bit) & 1
+    coefficients = transformed * np.array([1, 1j, -1, -1j])[number_of_ys % 4] / nrows
+
+    # Order the terms by labels (I=0, X=1, Y=2, Z=3; qubit 0 is the most significant
+    # digit), in the same way as get_qubitop_from_coeffs_and_labels would.
+    label_indices = np.arange(4 ** n)
+    labels = np.zeros((4 ** n, n), dtype=int)
+    flip_masks = np.zeros(4 ** n, dtype=int)
+    phase_masks = np.zeros(4 ** n, dtype=int)
+    for qubit in range(n):
+        labels[:, qubit] = (label_indices >> (2 * (n - 1 - qubit))) & 3
+        bit = 1 << (n - 1 - qubit)
+        flip_masks |= np.isin(labels[:, qubit], (1, 2)) * bit
+        phase_masks |= np.isin(labels[:, qubit], (2, 3)) * bit
+
+    ordered_coefficients = coefficients[flip_masks, phase_masks]
+    if np.all(ordered_coefficients.imag == 0):
+        ordered_coefficients = ordered_coefficients.real
+
+    kept = (np.abs(ordered_coefficients) >= threshold) & (ordered_coefficients != 0)
 
-    return get_qubitop_from_coeffs_and_labels(coeffs, labels)
+    output = QubitOperator()
+    for label, coefficient in zip(
+        labels[kept].tolist(), ordered_coefficients[kept].tolist()
+    ):
+        term = tuple(
+            (qubit, "IXYZ"[pauli]) for qubit, pauli in enumerate(label) if pauli != 0
+        )
+        output.terms[term] = coefficient
+
+    return output
 
 
 def get_qubitop_from_coeffs_and_labels(
@@ -311,18 +310,88 @@ def get_expectation_value(qubit_op, wavefunction, reverse_operator=True):
     """
     n_qubits = wavefunction.amplitudes.shape[0].bit_length() - 1
 
-    # Convert the qubit operator to a sparse matrix. Note that the qubit indices
+    # Convert the qubit operator to a sparse matrix. Note that the qubit order
     # must be reversed because OpenFermion and pyquil use different conventions
-    # for how to order the computational basis states!
+    # for how to order the computational basis states! Reordering the amplitudes
+    # is equivalent to, and cheaper than, reversing the operator.
+    if count_qubits(qubit_op) > n_qubits:
+        raise ValueError("Invalid number of qubits specified.")
+    amplitudes = wavefunction.amplitudes
     if reverse_operator:
-        qubit_op = reverse_qubit_order(qubit_op, n_qubits=n_qubits)
+        amplitudes = reverse_bit_order(amplitudes)
     sparse_op = get_sparse_operator(qubit_op, n_qubits=n_qubits)
 
     # Computer the expectation value
-    exp_val = openfermion_expectation(sparse_op, wavefunction.amplitudes)
+    exp_val = openfermion_expectation(sparse_op, amplitudes)
     return exp_val
 
 
+def _bit_parity(numbers: np.ndarray) -> np.ndarray:
+    """Parity of the number of set bits of each of the (64-bit) integers."""
+    for shift in (32, 16, 8, 4, 2, 1):
+        numbers = numbers ^ (numbers >> shift)
+    return numbers & 1
+
+
+def get_expectation_values_for_terms(
+    operator: SymbolicOperator, wavefunction
+) -> np.ndarray:
+    """Get the expectation values of each term of a Pauli operator with respect to a
+    wavefunction.
+
+    This gives the same results as calling get_expectation_value (with
+    reverse_operator=True) for every term of the operator, but works directly on the
+    amplitudes instead of constructing a sparse matrix for every term. Terms that flip
+    the same qubits share the overlap between the wavefunction and its flipped copy.
+
+    Args:
+        operator: QubitOperator or IsingOperator
+        wavefunction (pyquil.wavefunction.Wavefunction): the wavefunction, using
+            the convention in which qubit 0 is the least significant bit of
+            the basis state index
+
+    Returns:
+        complex array containing the expectation values of the terms multiplied by
+            their coefficients, in the order of operator.terms
+    """
+    amplitudes = np.asarray(wavefunction.amplitudes)
+    n_qubits = amplitudes.shape[0].bit_length() - 1
+    if count_qubits(operator) > n_qubits:
+        raise ValueError("Operator acts on more qubits than the wavefunction has.")
+
+    term_indices_by_flip_mask: Dict[int, List[int]] = {}
+    phase_masks = []
+    phases = []
+    for term_index, term in enumerate(operator.terms):
+        flip_mask = 0
+        phase_mask = 0
+        phase = 1 + 0j
+        for qubit, pauli in term:
+            if pauli in ("X", "Y"):
+                flip_mask |= 1 << qubit
+            if pauli in ("Y", "Z"):
+                phase_mask |= 1 << qubit
+            if pauli == "Y":
+                phase *= 1j
+        term_indices_by_flip_mask.setdefault(flip_mask, []).append(term_index)
+        phase_masks.append(phase_mask)
+        phases.append(phase)
+
+    basis_states = np.arange(amplitudes.shape[0], dtype=np.int64)
+    coefficients = list(operator.terms.values())
+    values = np.zeros(len(coefficients), dtype=complex)
+    for flip_mask, term_indices in term_indices_by_flip_mask.items():
+        overlaps = np.conj(amplitudes[basis_states ^ flip_mask]) * amplitudes
+        for term_index in term_indices:
+            odd = _bit_parity(basis_states & phase_masks[term_index]).astype(bool)
+            values[term_index] = (
+                coefficients[term_index]
+                * phases[term_index]
+                * (np.sum(overlaps) - 2 * np.sum(overlaps[odd]))
+            )
+    return values
+
+
 def change_operator_type(operator, operatorType):
     """Take an operator and attempt to cast it to an operator of a different type
 
@@ -370,6 +439,23 @@ def get_diagonal_component(operator):
         )
 
 
+@lru_cache(maxsize=32)
+def _get_diagonal_terms_mask(n_modes: int, key: Tuple[int, ...]) -> np.ndarray:
+    """Boolean mask of the elements of an n-body tensor with given key that correspond
+    to products of number operators, i.e. in which every mode is created as many times
+    as it is annihilated.
+    """
+    indices = np.indices((n_modes,) * len(key))
+    creation_indices = np.sort(indices[[action == 1 for action in key]], axis=0)
+    annihilation_indices = np.sort(indices[[action == 0 for action in key]], axis=0)
+    if creation_indices.shape != annihilation_indices.shape:
+        mask = np.zeros((n_modes,) * len(key), dtype=bool)
+    else:
+        mask = np.all(creation_indices == annihilation_indices, axis=0)
+    mask.setflags(write=False)
+    return mask
+
+
 def _get_diagonal_component_polynomial_tensor(polynomial_tensor):
     """Get the component of an interaction operator that is
     diagonal in the computational basis under Jordan-Wigner
@@ -390,43 +476,10 @@ def _get_diagonal_component_polynomial_tensor(polynomial_tensor):
     for key in polynomial_tensor.n_body_tensors:
         if key == ():
             continue
-        remainder_tensors[key] = np.zeros((n_modes,) * len(key), complex)
-        diagonal_tensors[key] = np.zeros((n_modes,) * len(key), complex)
-
-        for indices in itertools.product(range(n_modes), repeat=len(key)):
-            creation_counts = {}
-            annihilation_counts = {}
-
-            for meta_index, index in enumerate(indices):
-                if key[meta_index] == 0:
-                    if annihilation_counts.get(index) is None:
-                        annihilation_counts[index] = 1
-                    else:
-                        annihilation_counts[index] += 1
-                elif key[meta_index] == 1:
-                    if creation_counts.get(index) is None:
-                        creation_counts[index] = 1
-                    else:
-                        creation_counts[index] += 1
-
-            term_is_diagonal = True
-            for index in creation_counts:
-                if creation_counts[index] != annihilation_counts.get(index):
-                    term_is_diagonal = False
-                    break
-            if term_is_diagonal:
-                for index in annihilation_counts:
-                    if annihilation_counts[index] != creation_counts.get(index):
-                        term_is_diagonal = False
-                        break
-            if term_is_diagonal:
-                diagonal_tensors[key][indices] = polynomial_tensor.n_body_tensors[key][
-                    indices
-                ]
-            else:
-                remainder_tensors[key][indices] = polynomial_tensor.n_body_tensors[key][
-                    indices
-                ]
+        tensor = np.asarray(polynomial_tensor.n_body_tensors[key], dtype=complex)
+        mask = _get_diagonal_terms_mask(n_modes, tuple(key))
+        diagonal_tensors[key] = np.where(mask, tensor, 0)
+        remainder_tensors[key] = np.where(mask, 0, tensor)
 
     return PolynomialTensor(diagonal_tensors), PolynomialTensor(remainder_tensors)
 
@@ -459,21 +512,20 @@ def _get_diagonal_component_interaction_operator(interaction_operator):
     remainder_op = InteractionOperator(0.0, one_body_tensor, two_body_tensor)
 
     n_spin_orbitals = interaction_operator.two_body_tensor.shape[0]
+    modes = np.arange(n_spin_orbitals)
+    p, q = np.meshgrid(modes, modes, indexing="ij")
+
+    for indices in [(p, q, p, q), (p, q, q, p)]:
+        diagonal_op.two_body_tensor[indices] = interaction_operator.two_body_tensor[
+            indices
+        ]
+    for indices in [(p, q, p, q), (p, q, q, p)]:
+        remainder_op.two_body_tensor[indices] = 0.0
 
-    for p in range(n_spin_orbitals):
-        for q in range(n_spin_orbitals):
-            diagonal_op.two_body_tensor[
-                p, q, p, q
-            ] = interaction_operator.two_body_tensor[p, q, p, q]
-            diagonal_op.two_body_tensor[
-                p, q, q, p
-            ] = interaction_operator.two_body_tensor[p, q, q, p]
-            remainder_op.two_body_tensor[p, q, p, q] = 0.0
-            remainder_op.two_body_tensor[p, q, q, p] = 0.0
-
-    for p in range(n_spin_orbitals):
-        diagonal_op.one_body_tensor[p, p] = interaction_operator.one_body_tensor[p, p]
-        remainder_op.one_body_tensor[p, p] = 0.0
+    diagonal_op.one_body_tensor[modes, modes] = interaction_operator.one_body_tensor[
+        modes, modes
+    ]
+    remainder_op.one_body_tensor[modes, modes] = 0.0
 
     return diagonal_op, remainder_op
 
@@ -587,11 +639,43 @@ def create_circuits_from_qubit_operator(qubit_operator: QubitOperator) -> List[C
     return circuit_set
 
 
+def _apply_annihilation_operator(
+    states: np.ndarray, mode: int, n_qubits: int
+) -> np.ndarray:
+    """Apply Jordan-Wigner transformed annihilation operator on given mode to states.
+
+    States follow OpenFermion's convention, in which qubit 0 corresponds to the most
+    significant bit of the basis state index.
+
+    Args:
+        states: array of shape (..., 2 ** n_qubits) with states in its last axis
+        mode: index of the mode to annihilate
+        n_qubits: number of qubits
+
+    Returns:
+        array of the same shape as states
+    """
+    basis_states = np.arange(2 ** n_qubits)
+    mode_bit = 1 << (n_qubits - 1 - mode)
+    occupied = basis_states[(basis_states & mode_bit) != 0]
+    # Parity of the occupation of modes preceding the annihilated one
+    preceding_modes_mask = ((1 << n_qubits) - 1) ^ ((mode_bit << 1) - 1)
+    signs = 1 - 2 * _bit_parity(occupied & preceding_modes_mask)
+
+    result = np.zeros_like(states)
+    result[..., occupied ^ mode_bit] = states[..., occupied] * signs
+    return result
+
+
 def get_ground_state_rdm_from_qubit_op(
     qubit_operator: QubitOperator, n_particles: int
 ) -> InteractionRDM:
     """Diagonalize operator and compute the ground state 1- and 2-RDM
 
+    Annihilation operators are applied directly to the ground state, so that
+    <a_p^ a_q^ a_r a_s> = <a_q a_p psi|a_r a_s psi> is computed from the overlaps of
+    states with one and two annihilated modes.
+
     Args:
         qubit_operator: The openfermion operator to diagonalize
         n_particles: number of particles in the target ground state
@@ -605,37 +689,36 @@ def get_ground_state_rdm_from_qubit_op(
         sparse_operator, n_particles
     )  # float/np.array pair
     n_qubits = count_qubits(qubit_operator)
+    ground_state_wf = np.asarray(ground_state_wf, dtype=complex)
+
+    # one_annihilated[j] = a_j |psi>
+    one_annihilated = np.array(
+        [
+            _apply_annihilation_operator(ground_state_wf, j, n_qubits)
+            for j in range(n_qubits)
+        ]
+    )
+    one_body_tensor = np.conjugate(one_annihilated) @ one_annihilated.T
 
-    one_body_tensor_list = []
-    for i in range(n_qubits):
-        for j in range(n_qubits):
-            idag_j = get_sparse_operator(
-                FermionOperator(f"{i}^ {j}"), n_qubits=n_qubits
-            )
-            idag_j = idag_j.toarray()
-            one_body_tensor_list.append(
-                np.conjugate(ground_state_wf) @ idag_j @ ground_state_wf
-            )
-
-    one_body_tensor = np.array(one_body_tensor_list)
-    one_body_tensor = one_body_tensor.reshape(n_qubits, n_qubits)
+    # two_annihilated[k] = a_p a_q |psi> for k-th pair (p, q) with p < q
+    first_modes, second_modes = np.triu_indices(n_qubits, k=1)
+    two_annihilated = np.zeros((len(first_modes), 2 ** n_qubits), dtype=complex)
+    for p in range(n_qubits):
+        pair_indices = np.nonzero(first_modes == p)[0]
+        two_annihilated[pair_indices] = _apply_annihilation_operator(
+            one_annihilated[second_modes[pair_indices]], p, n_qubits
+        )
+    overlaps = np.conjugate(two_annihilated) @ two_annihilated.T
 
+    # overlaps[k, l] = <a_p^ a_q^ a_r a_s> for k-th pair (q, p) and l-th pair (r, s).
+    # The remaining elements follow from antisymmetry.
     two_body_tensor = np.zeros((n_qubits,) * 4, dtype=complex)
-    for p in range(n_qubits):
-        for q in range(0, p + 1):
-            for r in range(n_qubits):
-                for s in range(0, r + 1):
-                    pdag_qdag_r_s = get_sparse_operator(
-                        FermionOperator(f"{p}^ {q}^ {r} {s}"), n_qubits=n_qubits
-                    )
-                    pdag_qdag_r_s = pdag_qdag_r_s.toarray()
-                    rdm_element = (
-                        np.conjugate(ground_state_wf) @ pdag_qdag_r_s @ ground_state_wf
-                    )
-                    two_body_tensor[p, q, r, s] = rdm_element
-                    two_body_tensor[q, p, r, s] = -rdm_element
-                    two_body_tensor[q, p, s, r] = rdm_element
-                    two_body_tensor[p, q, s, r] = -rdm_element
+    bra_first, ket_first = np.meshgrid(first_modes, first_modes, indexing="ij")
+    bra_second, ket_second = np.meshgrid(second_modes, second_modes, indexing="ij")
+    two_body_tensor[bra_second, bra_first, ket_first, ket_second] = overlaps
+    two_body_tensor[bra_first, bra_second, ket_first, ket_second] = -overlaps
+    two_body_tensor[bra_second, bra_first, ket_second, ket_first] = -overlaps
+    two_body_tensor[bra_first, bra_second, ket_second, ket_first] = overlaps
 
     return InteractionRDM(one_body_tensor, two_body_tensor)
 
@@ -658,29 +741,47 @@ def remove_inactive_orbitals(
             energy of the core orbitals added to the constant.
     """
 
-    # This implementation is probably not very efficient, because it converts the
-    # interaction operator into a fermion operator and then back to an interaction
-    # operator.
-
-    # Convert the InteractionOperator to a FermionOperator
-    fermion_op = get_fermion_operator(interaction_op)
-
-    # Determine which occupied spin-orbitals are to be frozen
-    occupied = range(2 * n_core)
-
-    unoccupied: Iterable
-    # Determine which unoccupied spin-orbitals are to be frozen
+    n_spin_orbitals = interaction_op.one_body_tensor.shape[0]
+    occupied = np.arange(2 * n_core)
     if n_active is not None:
-        unoccupied = range(
-            2 * n_core + 2 * n_active, interaction_op.one_body_tensor.shape[0]
-        )
+        active = np.arange(2 * n_core, min(2 * n_core + 2 * n_active, n_spin_orbitals))
     else:
-        unoccupied = []
-
-    # Freeze the spin-orbitals
-    frozen_fermion_op = freeze_orbitals(fermion_op, occupied, unoccupied)
+        active = np.arange(2 * n_core, n_spin_orbitals)
+
+    one_body_tensor = np.asarray(interaction_op.one_body_tensor, dtype=complex)
+    two_body_tensor = np.asarray(interaction_op.two_body_tensor, dtype=complex)
+
+    def two_body_block(*index_sets):
+        return two_body_tensor[np.ix_(*index_sets)]
+
+    # Contributions of the frozen core. Frozen unoccupied orbitals annihilate every
+    # term acting on them, so they are simply dropped.
+    core_two_body = two_body_block(occupied, occupied, occupied, occupied)
+    constant = (
+        interaction_op.constant
+        + np.trace(one_body_tensor[np.ix_(occupied, occupied)])
+        + np.einsum("ijji->", core_two_body)
+        - np.einsum("ijij->", core_two_body)
+    )
+    one_body = (
+        one_body_tensor[np.ix_(active, active)]
+        + np.einsum("piis->ps", two_body_block(active, occupied, occupied, active))
+        + np.einsum("ipsi->ps", two_body_block(occupied, active, active, occupied))
+        - np.einsum("pisi->ps", two_body_block(active, occupied, active, occupied))
+        - np.einsum("ipis->ps", two_body_block(occupied, active, occupied, active))
+    )
 
-    # Convert back to an interaction operator
-    frozen_interaction_op = get_interaction_operator(frozen_fermion_op)
+    # Bring the two-body tensor into the normal ordered form produced by
+    # openfermion.get_interaction_operator, in which only the p > q, r > s entries are
+    # populated.
+    two_body = two_body_block(active, active, active, active)
+    two_body = (
+        two_body
+        - two_body.transpose(1, 0, 2, 3)
+        - two_body.transpose(0, 1, 3, 2)
+        + two_body.transpose(1, 0, 3, 2)
+    )
+    lower_triangle = np.tril(np.ones((len(active), len(active)), dtype=bool), k=-1)
+    two_body *= lower_triangle[:, :, None, None] & lower_triangle[None, None, :, :]
 
-    return frozen_interaction_op
+    return InteractionOperator(constant, one_body, two_body)
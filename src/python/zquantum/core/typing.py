@@ -1,7 +1,8 @@
 """Types commonly encountered in zquantum repositories."""
 from os import PathLike
-from typing import Callable, Dict, Union
+from typing import Callable, Dict, Optional, Union
 
+import numpy as np
 from typing_extensions import Protocol
 
 from .history.recorder import ArtifactRecorder, SimpleRecorder
@@ -31,5 +32,7 @@ DumpTarget = Union[Writeable, AnyPath]
 
 Specs = Union[str, Dict]
 
+RandomSeed = Optional[Union[int, np.random.Generator]]
+
 AnyRecorder = Union[SimpleRecorder, ArtifactRecorder]
 RecorderFactory = Callable[[Callable], AnyRecorder]
@@ -4,18 +4,33 @@ import copy
 import importlib
 import inspect
 import json
+import random
 import sys
+import time
 import warnings
-from functools import partial
+from functools import lru_cache, partial
 from types import FunctionType
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
-import lea
 import numpy as np
 import sympy
-from openfermion import InteractionRDM, hermitian_conjugated
 
-from .typing import AnyPath, LoadSource, Specs
+from .typing import AnyPath, LoadSource, RandomSeed, Specs
+
+if TYPE_CHECKING:
+    from openfermion import InteractionRDM
 
 SCHEMA_VERSION = "zapata-v1"
 RNDSEED = 12345
@@ -105,6 +120,76 @@ def bin2dec(x: List[int]) -> int:
     return dec
 
 
+def reverse_bit_order(array: np.ndarray) -> np.ndarray:
+    """Reorder an array of length 2^n so that the entry at index i moves to the index
+    whose n-bit binary representation is that of i reversed.
+
+    This converts e.g. wavefunction amplitudes or probabilities between the
+    conventions in which qubit 0 is the most and the least significant bit. The
+    reordering is a transposition of the (2,) * n shaped view of the array, so the
+    only copy made is the returned array.
+
+    Args:
+        array: one-dimensional array whose length is a power of 2.
+
+    Returns:
+        The reordered array.
+    """
+    array = np.asarray(array)
+    n_bits = array.shape[0].bit_length() - 1
+    if array.ndim != 1 or array.shape[0] != 2 ** n_bits:
+        raise ValueError("Array has to be one-dimensional with length a power of 2.")
+    return array.reshape((2,) * n_bits).transpose().reshape(-1)
+
+
+@lru_cache(maxsize=32)
+def get_bit_reversal_permutation(n_bits: int) -> np.ndarray:
+    """Get the permutation of the 2^n_bits integers reversing their binary digits.
+
+    The i-th entry of the returned array is the integer whose n_bits-long binary
+    representation is that of i reversed. Results are cached per n_bits and are
+    read-only.
+
+    Args:
+        n_bits: number of bits of the integers.
+
+    Returns:
+        The bit-reversal permutation.
+    """
+    permutation = reverse_bit_order(np.arange(2 ** n_bits))
+    permutation.setflags(write=False)
+    return permutation
+
+
+def _convert_integers_to_bitstrings(integers: np.ndarray, n_bits: int) -> List[str]:
+    """Convert integers to their n_bits-long binary representations, most significant
+    bit first.
+    """
+    integers = np.asarray(integers)
+    if n_bits == 0:
+        return [""] * len(integers)
+    bits = (integers[:, None] >> np.arange(n_bits - 1, -1, -1)) & 1
+    characters = (bits + ord("0")).astype(np.uint8)
+    return characters.view(f"S{n_bits}").ravel().astype(str).tolist()
+
+
+def _convert_bitstrings_to_integers(bitstrings: Sequence[str]) -> np.ndarray:
+    """Convert binary representations, most significant bit first, to integers.
+
+    Integers wider than 63 bits, as well as bitstrings of different lengths, are
+    converted one by one into an array of Python integers.
+    """
+    bitstrings = list(bitstrings)
+    n_bits = len(bitstrings[0]) if bitstrings else 0
+    if n_bits > 63 or any(len(bitstring) != n_bits for bitstring in bitstrings):
+        return np.array([int(bitstring, 2) for bitstring in bitstrings], dtype=object)
+    if n_bits == 0:
+        return np.zeros(len(bitstrings), dtype=np.int64)
+    characters = np.frombuffer("".join(bitstrings).encode(), dtype=np.uint8)
+    bits = (characters.reshape(-1, n_bits) - ord("0")).astype(np.int64)
+    return bits @ (1 << np.arange(n_bits - 1, -1, -1, dtype=np.int64))
+
+
 # The functions PAULI_X, PAULI_Y, PAULI_Z and IDENTITY below are used for
 # generating the generators of the Pauli group, which include Pauli X, Y, Z
 # operators as well as identity operator
@@ -146,7 +231,7 @@ def is_unitary(u: np.ndarray, tol=1e-15) -> bool:
     if dims[0] != dims[1]:
         raise Exception("Input matrix is not square.")
 
-    test_matrix = np.dot(hermitian_conjugated(np.array(u)), u)
+    test_matrix = np.dot(np.array(u).T.conj(), u)
     return is_identity(test_matrix, tol)
 
 
@@ -173,34 +258,139 @@ def compare_unitary(u1: np.ndarray, u2: np.ndarray, tol: float = 1e-15) -> bool:
     return is_identity(phase * test_matrix, tol)
 
 
+def _get_random_generator(seed: RandomSeed = None) -> np.random.Generator:
+    """Get a NumPy random generator from a seed or an existing generator.
+
+    Without a seed, the generator is seeded from Python's random module, so that
+    results can still be reproduced with random.seed.
+    """
+    if seed is None:
+        return np.random.default_rng(random.getrandbits(64))
+    return np.random.default_rng(seed)
+
+
+def _get_outcomes_and_probabilities(
+    probability_distribution: dict,
+) -> Tuple[list, np.ndarray]:
+    if not isinstance(probability_distribution, dict):
+        raise RuntimeError(
+            "Probability distribution should be a dictionary with key value \
+        being the thing being sampled and the value being probability of getting \
+        sampled "
+        )
+    probabilities = np.fromiter(
+        probability_distribution.values(),
+        dtype=float,
+        count=len(probability_distribution),
+    )
+    return list(probability_distribution.keys()), probabilities / probabilities.sum()
+
+
+def _convert_sample_counts_to_counter(
+    outcomes: list, counts: np.ndarray
+) -> collections.Counter:
+    sampled_indices = np.flatnonzero(counts)
+    return collections.Counter(
+        dict(
+            zip(
+                [outcomes[index] for index in sampled_indices],
+                counts[sampled_indices].tolist(),
+            )
+        )
+    )
+
+
 def sample_from_probability_distribution(
-    probability_distribution: dict, n_samples: int
+    probability_distribution: dict, n_samples: int, seed: RandomSeed = None
 ) -> collections.Counter:
     """
     Samples events from a discrete probability distribution
 
+    All samples are drawn at once from a multinomial distribution. To draw samples
+    from the same distribution repeatedly, use AliasSampler instead.
+
     Args:
         probabilty_distribution: The discrete probability distribution to be used
         for sampling. This should be a dictionary
 
         n_samples (int): The number of samples desired
+        seed: seed or NumPy random generator used for sampling
 
     Returns:
         A dictionary of the outcomes sampled. The key values are the things be sampled
         and values are how many times those things appeared in the sampling
     """
-    if isinstance(probability_distribution, dict):
-        prob_pmf = lea.pmf(probability_distribution)
-        sampled_dict: collections.Counter = collections.Counter(
-            prob_pmf.random(n_samples)
+    outcomes, probabilities = _get_outcomes_and_probabilities(probability_distribution)
+    counts = _get_random_generator(seed).multinomial(n_samples, probabilities)
+    return _convert_sample_counts_to_counter(outcomes, counts)
+
+
+class AliasSampler:
+    """Sampler drawing events from a fixed discrete probability distribution.
+
+    The alias table (Walker's alias method, in Vose's formulation) is built once in
+    time linear in the number of events. Afterwards, every sample takes constant
+    time regardless of the size of the distribution.
+
+    Args:
+        probability_distribution: The discrete probability distribution to be used
+            for sampling, mapping events to their probabilities.
+    """
+
+    def __init__(self, probability_distribution: dict):
+        self.outcomes, probabilities = _get_outcomes_and_probabilities(
+            probability_distribution
         )
-        return sampled_dict
-    else:
-        raise RuntimeError(
-            "Probability distribution should be a dictionary with key value \
-        being the thing being sampled and the value being probability of getting \
-        sampled "
+        n_outcomes = len(self.outcomes)
+        scaled_probabilities = (probabilities * n_outcomes).tolist()
+        acceptance_probabilities = [1.0] * n_outcomes
+        aliases = list(range(n_outcomes))
+
+        small = [i for i, p in enumerate(scaled_probabilities) if p < 1]
+        large = [i for i, p in enumerate(scaled_probabilities) if p >= 1]
+        while small and large:
+            small_index = small.pop()
+            large_index = large[-1]
+            acceptance_probabilities[small_index] = scaled_probabilities[small_index]
+            aliases[small_index] = large_index
+            scaled_probabilities[large_index] -= 1 - scaled_probabilities[small_index]
+            if scaled_probabilities[large_index] < 1:
+                small.append(large.pop())
+        # Events left in either list have probability 1 up to rounding errors, so
+        # they keep the default acceptance probability of 1.
+
+        self._acceptance_probabilities = np.array(acceptance_probabilities)
+        self._aliases = np.array(aliases, dtype=np.int64)
+
+    def sample_indices(self, n_samples: int, seed: RandomSeed = None) -> np.ndarray:
+        """Draw samples as indices of the events in the order of self.outcomes.
+
+        Args:
+            n_samples: The number of samples desired.
+            seed: seed or NumPy random generator used for sampling.
+
+        Returns:
+            Array with the index of each sampled event.
+        """
+        rng = _get_random_generator(seed)
+        indices = rng.integers(len(self.outcomes), size=n_samples)
+        accepted = rng.random(n_samples) < self._acceptance_probabilities[indices]
+        return np.where(accepted, indices, self._aliases[indices])
+
+    def sample(self, n_samples: int, seed: RandomSeed = None) -> collections.Counter:
+        """Draw samples from the distribution.
+
+        Args:
+            n_samples: The number of samples desired.
+            seed: seed or NumPy random generator used for sampling.
+
+        Returns:
+            A dictionary mapping sampled events to how many times they were sampled.
+        """
+        counts = np.bincount(
+            self.sample_indices(n_samples, seed), minlength=len(self.outcomes)
         )
+        return _convert_sample_counts_to_counter(self.outcomes, counts)
 
 
 def convert_bitstrings_to_tuples(bitstrings: Iterable[str]) -> List[Tuple[int, ...]]:
@@ -411,12 +601,111 @@ def get_func_from_specs(specs: Dict):
     return create_object(specs)
 
 
+class _ResolvedCreator(NamedTuple):
+    creator: Callable
+    # Names of parameters of function creators, None for other callables
+    parameter_names: Optional[FrozenSet[str]]
+    resolution_time: float
+
+
+_creator_cache: Dict[Tuple[str, str], _ResolvedCreator] = {}
+
+
+def _resolve_creator(module_name: str, function_name: str) -> _ResolvedCreator:
+    """Import the creator of objects described by specs, reusing earlier results.
+
+    A cached creator is only reused while it is still the attribute of its module,
+    so that creators replaced at runtime (e.g. mocked in tests) are resolved anew.
+    """
+    key = (module_name, function_name)
+    resolved = _creator_cache.get(key)
+    module = sys.modules.get(module_name)
+    if (
+        resolved is not None
+        and module is not None
+        and getattr(module, function_name, None) is resolved.creator
+    ):
+        return resolved
+
+    start_time = time.perf_counter()
+    creator = getattr(importlib.import_module(module_name), function_name)
+    parameter_names = (
+        frozenset(inspect.signature(creator).parameters)
+        if isinstance(creator, FunctionType)
+        else None
+    )
+    resolved = _ResolvedCreator(
+        creator, parameter_names, time.perf_counter() - start_time
+    )
+    _creator_cache[key] = resolved
+    return resolved
+
+
+def get_creator_cache_info() -> Dict[Tuple[str, str], float]:
+    """Get the creators resolved from specs so far.
+
+    Returns:
+        Dictionary mapping (module_name, function_name) pairs to the time in seconds
+        it took to resolve them, including importing their module if it hadn't been
+        imported before.
+    """
+    return {key: resolved.resolution_time for key, resolved in _creator_cache.items()}
+
+
+def clear_creator_cache():
+    """Forget all creators resolved from specs."""
+    _creator_cache.clear()
+
+
+def prepare_specs(specs: Dict) -> Callable[..., Any]:
+    """Resolve specs into a factory of objects.
+
+    Calling the factory with keyword arguments is equivalent to calling
+    create_object with the same specs and arguments, but the module is imported and
+    the creator's signature inspected only once, when preparing the specs.
+
+    Args:
+        specs (dict): dictionary containing the following keys:
+            module_name: specifies from which module an object comes.
+            function_name: specifies the name of the function used to create object.
+
+    Returns:
+        callable: factory accepting additional input parameters as keyword
+            arguments and returning the created object.
+    """
+    specs = copy.copy(specs)
+    resolved = _resolve_creator(specs.pop("module_name"), specs.pop("function_name"))
+
+    def _factory(**kwargs):
+        for key in specs.keys():
+            if key in kwargs.keys():
+                raise ValueError(
+                    "Cannot have same parameter assigned to multiple values"
+                )
+
+        if resolved.parameter_names is None:
+            return resolved.creator(**specs, **kwargs)
+        if kwargs == {} and specs == {}:
+            return resolved.creator
+        function_args = {
+            key: value
+            for key, value in {**specs, **kwargs}.items()
+            if key in resolved.parameter_names
+        }
+        return partial(resolved.creator, **function_args)
+
+    return _factory
+
+
 def create_object(specs: Dict, **kwargs):
     """
     Creates an object based on given specs.
     Specs include information about module and function necessary to create the object,
     as well as any additional input parameters for it.
 
+    Creators are cached per module and function name, see prepare_specs for creating
+    many objects from the same specs.
+
     Args:
         specs (dict): dictionary containing the following keys:
             module_name: specifies from which module an object comes.
@@ -425,29 +714,7 @@ def create_object(specs: Dict, **kwargs):
     Returns:
         object: object of any type
     """
-    specs = copy.copy(specs)
-    module_name = specs.pop("module_name")
-    module = importlib.import_module(module_name)
-    creator_name = specs.pop("function_name")
-    creator = getattr(module, creator_name)
-
-    for key in specs.keys():
-        if key in kwargs.keys():
-            raise ValueError("Cannot have same parameter assigned to multiple values")
-
-    if isinstance(creator, FunctionType):
-        if kwargs != {} or specs != {}:
-            function_parameter_names = inspect.signature(creator).parameters.keys()
-            function_args = {
-                key: value
-                for key, value in {**specs, **kwargs}.items()
-                if key in function_parameter_names
-            }
-            return partial(creator, **function_args)
-        else:
-            return creator
-    else:
-        return creator(**specs, **kwargs)
+    return prepare_specs(specs)(**kwargs)
 
 
 def load_noise_model(file: LoadSource):
@@ -575,6 +842,35 @@ def load_nmeas_estimate(filename: AnyPath) -> Tuple[float, int, np.ndarray]:
     return K_coeff, nterms, frame_meas
 
 
+def _apportion_by_largest_remainders(
+    quotas: np.ndarray, total: int, rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """Round quotas summing up to total to integers with the same sum.
+
+    This is the largest remainder (Hamilton) method: every quota is rounded down, and
+    the units still missing to the total are given to the quotas with the largest
+    fractional parts.
+
+    Args:
+        quotas: non-negative numbers summing up (up to rounding errors) to total.
+        total: the sum of the returned integers.
+        rng: random generator used to break ties between equal fractional parts.
+            If not provided, ties are broken in favour of later quotas.
+
+    Returns:
+        Array of integers, one per quota.
+    """
+    counts = np.floor(quotas)
+    remainders = quotas - counts
+    n_missing = int(round(total - counts.sum()))
+    if rng is None:
+        order = np.argsort(remainders, kind="stable")[::-1]
+    else:
+        order = np.lexsort((rng.random(len(remainders)), remainders))[::-1]
+    counts[order[:n_missing]] += 1
+    return counts.astype(np.int64)
+
+
 def scale_and_discretize(values: Iterable[float], total: int) -> List[int]:
     """Convert a list of floats to a list of integers such that the total equals
     a given value and the ratios of elements are approximately preserved.
@@ -588,27 +884,15 @@ def scale_and_discretize(values: Iterable[float], total: int) -> List[int]:
             ratios of the list elements are approximately equal to the ratios
             of the input list elements.
     """
+    values = np.fromiter(values, dtype=float)
+    result = _apportion_by_largest_remainders(values * (total / values.sum()), total)
 
-    # Note: combining the two lines below breaks type checking; see mypy #6040
-    value_sum = sum(values)
-    scale_factor = total / value_sum
+    assert result.sum() == total, "The scaled list does not sum to the desired total."
 
-    result = [np.floor(value * scale_factor) for value in values]
-    remainders = [
-        value * scale_factor - np.floor(value * scale_factor) for value in values
-    ]
-    indexes_sorted_by_remainder = np.argsort(remainders)[::-1]
-    for index in range(int(round(total - sum(result)))):
-        result[indexes_sorted_by_remainder[index]] += 1
+    return result.tolist()
 
-    result = [int(value) for value in result]
 
-    assert sum(result) == total, "The scaled list does not sum to the desired total."
-
-    return result
-
-
-def hf_rdm(n_alpha: int, n_beta: int, n_orbitals: int) -> InteractionRDM:
+def hf_rdm(n_alpha: int, n_beta: int, n_orbitals: int) -> "InteractionRDM":
     """Construct the RDM corresponding to a Hartree-Fock state.
 
     Args:
@@ -619,6 +903,9 @@ def hf_rdm(n_alpha: int, n_beta: int, n_orbitals: int) -> InteractionRDM:
     Returns:
         openfermion.ops.InteractionRDM: the reduced density matrix
     """
+    # Imported here, so that importing utils doesn't import OpenFermion and Cirq
+    from openfermion import InteractionRDM
+
     # Determine occupancy of each spin orbital
     occ = np.zeros(2 * n_orbitals)
     occ[: (2 * n_alpha) : 2] = 1
@@ -652,10 +939,7 @@ def get_ordered_list_of_bitstrings(num_qubits: int) -> List[str]:
     Returns:
         The ordered bitstring representations of the integers
     """
-    bitstrings = []
-    for i in range(2 ** num_qubits):
-        bitstring = "{0:b}".format(i)
-        while len(bitstring) < num_qubits:
-            bitstring = "0" + bitstring
-        bitstrings.append(bitstring)
-    return bitstrings
+    # Like format(0, "b"), the only state of zero qubits is represented as "0"
+    return _convert_integers_to_bitstrings(
+        np.arange(2 ** num_qubits), max(num_qubits, 1)
+    )
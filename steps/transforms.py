@@ -1,18 +1,19 @@
 import time
-from typing import Union
+from typing import Optional, Union
 
-from openfermion import (
-    SymbolicOperator,
-    bravyi_kitaev,
-    get_fermion_operator,
-    jordan_wigner,
-)
+from openfermion import SymbolicOperator
 from zquantum.core.openfermion import load_interaction_operator, save_qubit_operator
+from zquantum.core.openfermion import (
+    transform_interaction_operator as _transform_interaction_operator,
+)
 from zquantum.core.utils import save_timing
 
 
 def transform_interaction_operator(
-    transformation: str, input_operator: Union[str, SymbolicOperator]
+    transformation: str,
+    input_operator: Union[str, SymbolicOperator],
+    n_workers: int = 1,
+    cache_dir: Optional[str] = None,
 ):
     """Transform an interaction operator through either the Bravyi-Kitaev or
     Jordan-Wigner transformations. The results are serialized into a JSON under the
@@ -22,20 +23,17 @@ def transform_interaction_operator(
         transformation: The transformation to use. Either "Jordan-Wigner" or
             "Bravyi-Kitaev"
         input_operator: The interaction operator to transform
+        n_workers: The number of processes used to transform blocks of the operator
+        cache_dir: Directory in which transformed operators are memoized by the
+            content of the interaction operator. If None, nothing is cached.
     """
     if isinstance(input_operator, str):
         input_operator = load_interaction_operator(input_operator)
 
-    if transformation == "Jordan-Wigner":
-        transformation = jordan_wigner
-    elif transformation == "Bravyi-Kitaev":
-        input_operator = get_fermion_operator(input_operator)
-        transformation = bravyi_kitaev
-    else:
-        raise RuntimeError("Unrecognized transformation ", transformation)
-
     start_time = time.time()
-    transformed_operator = transformation(input_operator)
+    transformed_operator = _transform_interaction_operator(
+        input_operator, transformation, n_workers=n_workers, cache_dir=cache_dir
+    )
     walltime = time.time() - start_time
 
     save_qubit_operator(transformed_operator, "transformed-operator.json")
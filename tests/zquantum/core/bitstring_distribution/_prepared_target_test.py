@@ -0,0 +1,199 @@
+import numpy as np
+import pytest
+from zquantum.core.bitstring_distribution import (
+    BitstringDistribution,
+    PreparedTargetDistribution,
+    compute_clipped_negative_log_likelihood,
+    compute_jensen_shannon_divergence,
+    compute_mmd,
+    evaluate_distribution_distance,
+)
+from zquantum.core.measurement import Measurements
+
+DISTANCE_MEASURES_AND_PARAMETERS = [
+    (compute_clipped_negative_log_likelihood, {"epsilon": 1e-3}),
+    (compute_jensen_shannon_divergence, {}),
+    (compute_mmd, {"sigma": 1.0}),
+    (compute_mmd, {"sigma": [0.5, 2, 1e6]}),
+]
+
+
+@pytest.fixture
+def target_distribution():
+    return BitstringDistribution(
+        {"0000": 0.3, "0011": 0.2, "0110": 0.1, "1100": 0.15, "1111": 0.25}
+    )
+
+
+@pytest.fixture
+def measured_distributions():
+    return [
+        BitstringDistribution({"0000": 0.5, "0011": 0.5}),
+        BitstringDistribution({"0001": 0.25, "0110": 0.25, "1111": 0.5}),
+        BitstringDistribution({"1000": 0.1, "0100": 0.2, "0010": 0.3, "0001": 0.4}),
+    ]
+
+
+@pytest.mark.parametrize(
+    "distance_measure_function,distance_measure_parameters",
+    DISTANCE_MEASURES_AND_PARAMETERS,
+)
+class TestPreparedTargetDistribution:
+    def test_agrees_with_evaluate_distribution_distance(
+        self,
+        target_distribution,
+        measured_distributions,
+        distance_measure_function,
+        distance_measure_parameters,
+    ):
+        prepared_target = PreparedTargetDistribution(
+            target_distribution,
+            distance_measure_function,
+            distance_measure_parameters=distance_measure_parameters,
+        )
+
+        for measured_distribution in measured_distributions:
+            assert prepared_target.evaluate(measured_distribution) == pytest.approx(
+                evaluate_distribution_distance(
+                    target_distribution,
+                    measured_distribution,
+                    distance_measure_function,
+                    distance_measure_parameters=distance_measure_parameters,
+                ),
+                rel=1e-12,
+            )
+
+    def test_batch_evaluation_agrees_with_single_evaluations(
+        self,
+        target_distribution,
+        measured_distributions,
+        distance_measure_function,
+        distance_measure_parameters,
+    ):
+        prepared_target = PreparedTargetDistribution(
+            target_distribution,
+            distance_measure_function,
+            distance_measure_parameters=distance_measure_parameters,
+        )
+
+        np.testing.assert_allclose(
+            prepared_target.evaluate_batch(measured_distributions),
+            [
+                prepared_target.evaluate(measured_distribution)
+                for measured_distribution in measured_distributions
+            ],
+            rtol=1e-12,
+        )
+
+    def test_evaluating_empty_batch_gives_empty_array(
+        self,
+        target_distribution,
+        distance_measure_function,
+        distance_measure_parameters,
+    ):
+        prepared_target = PreparedTargetDistribution(
+            target_distribution,
+            distance_measure_function,
+            distance_measure_parameters=distance_measure_parameters,
+        )
+
+        assert prepared_target.evaluate_batch([]).shape == (0,)
+
+    def test_evaluates_distance_to_distribution_of_measurements(
+        self,
+        target_distribution,
+        distance_measure_function,
+        distance_measure_parameters,
+    ):
+        measurements = Measurements([(0, 0, 1, 1), (0, 1, 1, 0), (0, 0, 1, 1)])
+        counts_measurements = Measurements.from_counts({"0011": 2, "1000": 1})
+        prepared_target = PreparedTargetDistribution(
+            target_distribution,
+            distance_measure_function,
+            distance_measure_parameters=distance_measure_parameters,
+        )
+
+        for measured in [measurements, counts_measurements]:
+            assert prepared_target.evaluate(measured) == pytest.approx(
+                prepared_target.evaluate(measured.get_distribution()), rel=1e-12
+            )
+
+
+def test_falls_back_to_calling_other_distance_measures(target_distribution):
+    def count_common_bitstrings(
+        target_distribution, measured_distribution, distance_measure_parameters
+    ):
+        return len(
+            set(target_distribution.distribution_dict)
+            & set(measured_distribution.distribution_dict)
+        )
+
+    prepared_target = PreparedTargetDistribution(
+        target_distribution, count_common_bitstrings, distance_measure_parameters={}
+    )
+    measurements = Measurements.from_counts({"0000": 2, "0001": 1})
+
+    np.testing.assert_array_equal(
+        prepared_target.evaluate_batch(
+            [BitstringDistribution({"0000": 0.5, "1111": 0.5}), measurements]
+        ),
+        [2, 1],
+    )
+
+
+def test_target_distribution_has_to_be_bitstring_distribution():
+    with pytest.raises(TypeError):
+        PreparedTargetDistribution({"0": 0.5, "1": 0.5}, compute_mmd)
+
+
+def test_measured_distribution_has_to_be_bitstring_distribution_or_measurements(
+    target_distribution,
+):
+    prepared_target = PreparedTargetDistribution(target_distribution, compute_mmd)
+
+    with pytest.raises(TypeError):
+        prepared_target.evaluate({"0000": 1.0})
+
+
+@pytest.mark.parametrize(
+    "measured",
+    [
+        BitstringDistribution({"00": 0.5, "11": 0.5}),
+        Measurements.from_counts({"000": 1}),
+        BitstringDistribution({"0000": 10, "1111": 5}, normalize=False),
+    ],
+)
+def test_distance_cannot_be_evaluated_for_incompatible_distributions(
+    target_distribution, measured
+):
+    prepared_target = PreparedTargetDistribution(target_distribution, compute_mmd)
+
+    with pytest.raises(RuntimeError):
+        prepared_target.evaluate(measured)
+
+
+def test_distance_cannot_be_evaluated_for_empty_measurements(target_distribution):
+    prepared_target = PreparedTargetDistribution(target_distribution, compute_mmd)
+
+    with pytest.raises(ValueError):
+        prepared_target.evaluate(Measurements())
+
+
+def test_evaluates_distance_to_measurements_of_many_qubits():
+    bitstrings = ["1" + "0" * 69, "0" * 69 + "1"]
+    target_distribution = BitstringDistribution({bitstrings[0]: 1.0})
+    prepared_target = PreparedTargetDistribution(
+        target_distribution,
+        compute_clipped_negative_log_likelihood,
+        distance_measure_parameters={},
+    )
+    measurements = Measurements.from_counts({bitstrings[0]: 1, bitstrings[1]: 3})
+
+    assert prepared_target.evaluate(measurements) == pytest.approx(
+        evaluate_distribution_distance(
+            target_distribution,
+            measurements.get_distribution(),
+            compute_clipped_negative_log_likelihood,
+            distance_measure_parameters={},
+        )
+    )
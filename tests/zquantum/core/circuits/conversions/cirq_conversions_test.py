@@ -4,6 +4,7 @@ import pytest
 import sympy
 from zquantum.core.circuits import _builtin_gates, _circuit, _gates
 from zquantum.core.circuits.conversions.cirq_conversions import (
+    CirqConverter,
     export_to_cirq,
     import_from_cirq,
     make_rotation_factory,
@@ -287,3 +288,61 @@ class TestImportingFromCirq:
     def test_with_unsupported_gates_raises_not_implemented_error(self, cirq_circuit):
         with pytest.raises(NotImplementedError):
             import_from_cirq(cirq_circuit)
+
+
+class TestCirqConverter:
+    def test_exporting_circuitset_gives_same_circuits_as_exporting_each_circuit(self):
+        circuits = [zquantum_circuit for zquantum_circuit, _ in EQUIVALENT_CIRCUITS]
+
+        assert CirqConverter().export_circuitset(circuits) == [
+            export_to_cirq(circuit) for circuit in circuits
+        ]
+
+    def test_repeated_gates_are_exported_once(self):
+        converter = CirqConverter()
+        circuits = converter.export_circuitset(
+            [
+                _circuit.Circuit(
+                    [_builtin_gates.RX(0.5)(0), _builtin_gates.RX(0.5)(1)]
+                ),
+                _circuit.Circuit([_builtin_gates.X.controlled(1)(0, 1)]),
+                _circuit.Circuit([_builtin_gates.X.controlled(1)(1, 0)]),
+            ]
+        )
+
+        assert circuits[0][0].operations[0].gate is circuits[0][0].operations[1].gate
+        assert circuits[1][0].operations[0].gate is circuits[2][0].operations[0].gate
+
+    def test_gates_with_native_and_sympy_parameters_are_exported_separately(self):
+        circuit = _circuit.Circuit(
+            [_builtin_gates.RX(1)(0), _builtin_gates.RX(sympy.Integer(1))(0)]
+        )
+
+        assert CirqConverter().export_circuit(circuit) == export_to_cirq(circuit)
+
+    @pytest.mark.parametrize("zquantum_circuit, _", EQUIVALENT_PARAMETRIZED_CIRCUITS)
+    def test_exported_bound_circuits_are_equivalent_to_exported_bound_circuit(
+        self, zquantum_circuit, _
+    ):
+        symbols_maps = [EXAMPLE_PARAM_VALUES, {THETA: -1.2, GAMMA: 0.7}]
+
+        bound_circuits = CirqConverter().export_bound_circuits(
+            zquantum_circuit, symbols_maps
+        )
+
+        for bound_circuit, symbols_map in zip(bound_circuits, symbols_maps):
+            np.testing.assert_allclose(
+                cirq.unitary(bound_circuit),
+                cirq.unitary(export_to_cirq(zquantum_circuit.bind(symbols_map))),
+            )
+
+    def test_importing_circuitset_shares_custom_gate_definitions(self):
+        cirq_circuits = CIRQ_ONLY_CIRCUITS_WITHOUT_FREE_SYMBOLS * 2
+
+        circuits = CirqConverter().import_circuitset(cirq_circuits)
+
+        assert circuits == [import_from_cirq(circuit) for circuit in cirq_circuits]
+        assert (
+            circuits[1].operations[0].gate.matrix_factory.gate_definition
+            is circuits[3].operations[0].gate.matrix_factory.gate_definition
+        )
@@ -3,7 +3,9 @@ import pyquil
 import pytest
 import sympy
 from zquantum.core.circuits import _builtin_gates, _circuit, _gates
+from zquantum.core.circuits.conversions import pyquil_conversions
 from zquantum.core.circuits.conversions.pyquil_conversions import (
+    PyQuilProgramTemplate,
     export_to_pyquil,
     import_from_pyquil,
 )
@@ -242,6 +244,87 @@ class TestExportingToPyQuil:
         )
 
 
+class TestPyQuilProgramTemplate:
+    def test_parameters_of_gates_are_read_from_declared_memory(self):
+        zquantum_circuit = _circuit.Circuit(
+            [
+                _builtin_gates.RX(SYMPY_GAMMA * SYMPY_THETA)(1),
+                CUSTOM_PARAMETRIC_DEF(SYMPY_THETA)(0),
+            ]
+        )
+        quil_gamma = pyquil.quilatom.MemoryReference("gamma")
+        quil_theta = pyquil.quilatom.MemoryReference("theta")
+        gate_def = _example_parametric_pyquil_program().defined_gates[0]
+
+        template = PyQuilProgramTemplate(zquantum_circuit)
+
+        assert template.symbols == [SYMPY_GAMMA, SYMPY_THETA]
+        assert template.program == pyquil.Program(
+            pyquil.quil.Declare("gamma", "REAL"),
+            pyquil.quil.Declare("theta", "REAL"),
+            gate_def,
+            pyquil.gates.RX(quil_gamma * quil_theta, 1),
+            gate_def.get_constructor()(quil_theta)(0),
+        ), template.program.out()
+
+    def test_memory_maps_assign_values_to_regions_named_after_symbols(self):
+        template = PyQuilProgramTemplate(
+            _circuit.Circuit(
+                [
+                    _builtin_gates.RX(SYMPY_THETA)(0),
+                    _builtin_gates.RY(SYMPY_GAMMA)(0),
+                ]
+            )
+        )
+
+        assert template.memory_map({SYMPY_THETA: 0.5, SYMPY_GAMMA: -1}) == {
+            "gamma": [-1.0],
+            "theta": [0.5],
+        }
+        assert template.memory_maps(np.array([[1, 2], [3, 4]])) == [
+            {"gamma": [1.0], "theta": [2.0]},
+            {"gamma": [3.0], "theta": [4.0]},
+        ]
+        with pytest.raises(ValueError):
+            template.memory_maps(np.array([1, 2]))
+
+    def test_gate_definitions_are_exported_once_per_circuitset(self, monkeypatch):
+        exported_gate_names = []
+        export_gate_def = pyquil_conversions._export_gate_def
+
+        def _export_gate_def_spy(gate_def):
+            exported_gate_names.append(gate_def.gate_name)
+            return export_gate_def(gate_def)
+
+        monkeypatch.setattr(
+            pyquil_conversions, "_export_gate_def", _export_gate_def_spy
+        )
+        circuits = [
+            _circuit.Circuit(
+                [
+                    CUSTOM_PARAMETRIC_DEF(SYMPY_THETA)(0),
+                    _builtin_gates.RH(SYMPY_GAMMA)(1),
+                ]
+            ),
+            _circuit.Circuit(
+                [
+                    _builtin_gates.RH(0.5)(0),
+                    CUSTOM_PARAMETRIC_DEF(2 * SYMPY_THETA)(1),
+                    SQRT_X_DEF()(0),
+                ]
+            ),
+        ]
+
+        templates = PyQuilProgramTemplate.for_circuitset(circuits)
+
+        assert sorted(exported_gate_names) == ["CUSTOM-PARAMETRIC", "RH", "SQRT-X"]
+        assert [gate_def.name for gate_def in templates[1].program.defined_gates] == [
+            "CUSTOM-PARAMETRIC",
+            "SQRT-X",
+            "RH",
+        ]
+
+
 class TestImportingFromPyQuil:
     @pytest.mark.parametrize(
         "zquantum_circuit, pyquil_circuit",
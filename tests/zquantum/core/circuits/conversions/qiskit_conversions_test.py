@@ -5,6 +5,7 @@ import qiskit.circuit.random
 import sympy
 from zquantum.core.circuits import _builtin_gates, _circuit, _gates
 from zquantum.core.circuits.conversions.qiskit_conversions import (
+    QiskitCircuitTemplate,
     export_to_qiskit,
     import_from_qiskit,
 )
@@ -456,6 +457,90 @@ class TestExportingToQiskit:
         )
 
 
+class TestQiskitCircuitTemplate:
+    @pytest.mark.parametrize(
+        "zquantum_circuit",
+        [zquantum_circuit for zquantum_circuit, _ in EQUIVALENT_PARAMETRIZED_CIRCUITS],
+    )
+    def test_binding_template_results_in_equivalent_circuit(self, zquantum_circuit):
+        symbols_map = {
+            symbol: EXAMPLE_PARAM_VALUES[str(symbol)]
+            for symbol in zquantum_circuit.free_symbols
+        }
+
+        bound = QiskitCircuitTemplate(zquantum_circuit).bind(symbols_map)
+
+        assert bound == export_to_qiskit(zquantum_circuit.bind(symbols_map))
+
+    @pytest.mark.parametrize(
+        "zquantum_circuit",
+        [zquantum_circuit for zquantum_circuit, _ in EQUIVALENT_PARAMETRIZED_CIRCUITS],
+    )
+    def test_binding_template_to_batch_of_values_results_in_equivalent_circuits(
+        self, zquantum_circuit
+    ):
+        template = QiskitCircuitTemplate(zquantum_circuit)
+        parameter_values = np.random.default_rng(3).uniform(
+            -np.pi, np.pi, size=(3, len(template.symbols))
+        )
+
+        bound_circuits = template.bind_batch(parameter_values)
+
+        assert bound_circuits == [
+            export_to_qiskit(zquantum_circuit.bind(dict(zip(template.symbols, values))))
+            for values in parameter_values
+        ]
+
+    def test_symbols_used_by_multiple_gates_are_exported_as_single_parameter(self):
+        zquantum_circuit = _circuit.Circuit(
+            [
+                _builtin_gates.RX(SYMPY_THETA)(0),
+                _builtin_gates.RY(2 * SYMPY_THETA)(1),
+            ]
+        )
+
+        template = QiskitCircuitTemplate(zquantum_circuit)
+
+        assert [str(param) for param in template.qiskit_circuit.parameters] == ["theta"]
+        assert template.bind_batch([[0.5]]) == [
+            export_to_qiskit(zquantum_circuit.bind({SYMPY_THETA: 0.5}))
+        ]
+
+    def test_symbols_are_sorted_by_name(self):
+        zquantum_circuit = _circuit.Circuit(
+            [
+                _builtin_gates.RX(SYMPY_THETA)(0),
+                _builtin_gates.RY(SYMPY_GAMMA)(1),
+            ]
+        )
+
+        template = QiskitCircuitTemplate(zquantum_circuit)
+
+        assert template.symbols == [SYMPY_GAMMA, SYMPY_THETA]
+        assert template.bind_batch([[0.5, 0.25]]) == [
+            export_to_qiskit(
+                zquantum_circuit.bind({SYMPY_GAMMA: 0.5, SYMPY_THETA: 0.25})
+            )
+        ]
+
+    def test_binding_batch_of_values_to_circuit_without_symbols_copies_it(self):
+        zquantum_circuit = _circuit.Circuit([_builtin_gates.RX(0.5)(0)])
+
+        bound_circuits = QiskitCircuitTemplate(zquantum_circuit).bind_batch(
+            np.zeros((2, 0))
+        )
+
+        assert bound_circuits == [export_to_qiskit(zquantum_circuit)] * 2
+
+    def test_binding_batch_of_values_for_wrong_number_of_symbols_fails(self):
+        template = QiskitCircuitTemplate(
+            _circuit.Circuit([_builtin_gates.RX(SYMPY_THETA)(0)])
+        )
+
+        with pytest.raises(ValueError):
+            template.bind_batch(np.zeros((2, 2)))
+
+
 class TestImportingFromQiskit:
     @pytest.mark.parametrize(
         "zquantum_circuit, qiskit_circuit", EQUIVALENT_NON_PARAMETRIZED_CIRCUITS
@@ -0,0 +1,75 @@
+"""Test cases for numpy_expressions module."""
+import numpy as np
+import pytest
+import sympy
+from zquantum.core.circuits.symbolic.numpy_expressions import compile_expressions
+
+THETA = sympy.Symbol("theta")
+GAMMA = sympy.Symbol("gamma")
+
+
+@pytest.mark.parametrize(
+    "sympy_expression",
+    [
+        THETA,
+        2 * THETA - GAMMA,
+        THETA * GAMMA / 3,
+        sympy.cos(THETA) + sympy.I * sympy.sin(GAMMA),
+        sympy.exp(THETA - GAMMA),
+        sympy.tan(THETA) ** 2,
+        sympy.sqrt(THETA),
+        GAMMA ** THETA,
+        1.5,
+    ],
+)
+def test_compiled_expression_agrees_with_substitution(sympy_expression):
+    symbol_values = np.random.default_rng(7).uniform(-2, 2, size=(5, 2))
+
+    compiled = compile_expressions([sympy_expression], [THETA, GAMMA])
+
+    np.testing.assert_allclose(
+        compiled(symbol_values)[:, 0],
+        [
+            complex(sympy.sympify(sympy_expression).subs({THETA: theta, GAMMA: gamma}))
+            for theta, gamma in symbol_values
+        ],
+    )
+
+
+def test_compiled_expressions_are_evaluated_for_whole_batch():
+    compiled = compile_expressions([THETA + GAMMA, 3, GAMMA], [THETA, GAMMA])
+
+    np.testing.assert_array_equal(
+        compiled(np.array([[1.0, 2.0], [3.0, 4.0]])), [[3, 3, 2], [7, 3, 4]]
+    )
+
+
+def test_evaluating_no_expressions_gives_empty_array_for_each_batch_element():
+    assert compile_expressions([], [THETA])(np.zeros((4, 1))).shape == (4, 0)
+
+
+def test_evaluating_for_wrong_number_of_symbols_fails():
+    compiled = compile_expressions([THETA], [THETA])
+
+    with pytest.raises(ValueError):
+        compiled(np.zeros((2, 2)))
+
+
+def test_integer_powers_of_negative_numbers_are_real():
+    compiled = compile_expressions([THETA ** 2, THETA ** -1], [THETA])
+
+    result = compiled(np.array([[-2.0], [4.0]]))
+
+    assert not np.iscomplexobj(result)
+    np.testing.assert_allclose(result, [[4, -0.5], [16, 0.25]])
+
+
+def test_fractional_powers_of_negative_numbers_are_imaginary():
+    compiled = compile_expressions([THETA ** 0.5], [THETA])
+
+    np.testing.assert_allclose(compiled(np.array([[-4.0], [4.0]])), [[2j], [2]])
+
+
+def test_compiling_expressions_with_missing_symbols_fails():
+    with pytest.raises(ValueError):
+        compile_expressions([THETA + GAMMA], [THETA])
@@ -1,7 +1,10 @@
 """Test cases for symbolic_expressions module."""
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import sympy
 from pyquil import quil, quilatom
+from zquantum.core.circuits.symbolic.expressions import FunctionCall, Symbol
 from zquantum.core.circuits.symbolic.pyquil_expressions import (
     QUIL_DIALECT,
     expression_from_pyquil,
@@ -10,7 +13,10 @@ from zquantum.core.circuits.symbolic.sympy_expressions import (
     SYMPY_DIALECT,
     expression_from_sympy,
 )
-from zquantum.core.circuits.symbolic.translations import translate_expression
+from zquantum.core.circuits.symbolic.translations import (
+    ExpressionTranslator,
+    translate_expression,
+)
 
 
 @pytest.mark.parametrize(
@@ -137,3 +143,81 @@ def test_translating_tree_from_quil_to_sympy_gives_expected_result(
 ):
     expression = expression_from_pyquil(quil_expression)
     assert translate_expression(expression, SYMPY_DIALECT) - sympy_expression == 0
+
+
+class TestExpressionTranslator:
+    @pytest.mark.parametrize(
+        "sympy_expression",
+        [
+            sympy.Symbol("theta"),
+            sympy.cos(2 * sympy.Symbol("theta")),
+            sympy.Symbol("x") / sympy.Symbol("y"),
+            -5 * sympy.Symbol("x") * sympy.Symbol("y"),
+        ],
+    )
+    def test_translates_expressions_like_translate_expression(self, sympy_expression):
+        expression = expression_from_sympy(sympy_expression)
+        translator = ExpressionTranslator(QUIL_DIALECT)
+
+        for _ in range(2):
+            assert translator(expression) == translate_expression(
+                expression, QUIL_DIALECT
+            )
+
+    def test_reuses_translations_of_structurally_equal_subexpressions(self):
+        multiplications = []
+
+        def _mul(*args):
+            multiplications.append(args)
+            return SYMPY_DIALECT.known_functions["mul"](*args)
+
+        translator = ExpressionTranslator(
+            SYMPY_DIALECT._replace(
+                known_functions={**SYMPY_DIALECT.known_functions, "mul": _mul}
+            )
+        )
+        translator(FunctionCall("cos", (FunctionCall("mul", (2, Symbol("theta"))),)))
+        translator(FunctionCall("sin", (FunctionCall("mul", (2, Symbol("theta"))),)))
+
+        assert len(multiplications) == 1
+
+    def test_numbers_of_different_types_are_translated_separately(self):
+        translator = ExpressionTranslator(SYMPY_DIALECT)
+
+        with_integer = translator(FunctionCall("mul", (2, Symbol("x"))))
+        with_float = translator(FunctionCall("mul", (2.0, Symbol("x"))))
+
+        assert with_integer == 2 * sympy.Symbol("x")
+        assert with_float == 2.0 * sympy.Symbol("x")
+        assert with_integer != with_float
+
+    def test_cache_is_bounded(self):
+        translator = ExpressionTranslator(SYMPY_DIALECT, maxsize=3)
+
+        for name in ["a", "b", "c", "d", "e"]:
+            translator(FunctionCall("add", (Symbol(name), 1)))
+
+        assert translator.cache_size == 3
+        translator.clear_cache()
+        assert translator.cache_size == 0
+
+    def test_can_be_shared_between_threads(self):
+        translator = ExpressionTranslator(SYMPY_DIALECT, maxsize=8)
+        expressions = [
+            FunctionCall("add", (Symbol(f"x_{i % 16}"), i % 3)) for i in range(2000)
+        ]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            translations = list(executor.map(translator, expressions))
+
+        assert translations == [
+            translate_expression(expression, SYMPY_DIALECT)
+            for expression in expressions
+        ]
+        assert translator.cache_size == 8
+
+    def test_fails_for_functions_unknown_in_dialect(self):
+        translator = ExpressionTranslator(SYMPY_DIALECT)
+
+        with pytest.raises(ValueError):
+            translator(FunctionCall("cosh", (Symbol("x"),)))
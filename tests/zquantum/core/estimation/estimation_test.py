@@ -9,10 +9,12 @@ from openfermion.linalg.sparse_tools import (
 )
 from zquantum.core.circuits import RX, RY, RZ, Circuit, H, X
 from zquantum.core.estimation import (
+    WavefunctionCache,
     allocate_shots_proportionally,
     allocate_shots_uniformly,
     calculate_exact_expectation_values,
     estimate_expectation_values_by_averaging,
+    estimate_expectation_values_to_precision,
     evaluate_constant_estimation_tasks,
     evaluate_estimation_circuits,
     get_context_selection_circuit_for_group,
@@ -24,7 +26,10 @@ from zquantum.core.estimation import (
 from zquantum.core.interfaces.estimation import EstimationTask
 from zquantum.core.interfaces.mock_objects import MockQuantumBackend
 from zquantum.core.measurement import ExpectationValues
-from zquantum.core.openfermion._utils import change_operator_type
+from zquantum.core.openfermion._utils import (
+    change_operator_type,
+    get_expectation_values_for_terms,
+)
 from zquantum.core.symbolic_simulator import SymbolicSimulator
 
 
@@ -652,6 +657,102 @@ class TestBasicEstimationMethods:
                 expectation_values.values, target.values, atol=0.1
             )
 
+    def test_estimate_expectation_values_by_averaging_runs_identical_circuits_once(
+        self, simulator
+    ):
+        estimation_tasks = [
+            EstimationTask(
+                IsingOperator("Z0"), Circuit([X(0)], n_qubits=2), number_of_shots=10
+            ),
+            EstimationTask(IsingOperator("Z1"), Circuit([H(1)]), number_of_shots=10),
+            EstimationTask(
+                IsingOperator("Z1", 2.0),
+                Circuit([X(0)], n_qubits=2),
+                number_of_shots=20,
+            ),
+            EstimationTask(
+                IsingOperator("Z0 Z1", -1.0),
+                Circuit([X(0)], n_qubits=2),
+                number_of_shots=15,
+            ),
+        ]
+
+        expectation_values_list = estimate_expectation_values_by_averaging(
+            simulator, estimation_tasks
+        )
+
+        assert simulator.number_of_circuits_run == 2
+        np.testing.assert_array_equal(expectation_values_list[0].values, [-1])
+        np.testing.assert_array_equal(expectation_values_list[2].values, [2])
+        np.testing.assert_array_equal(expectation_values_list[3].values, [1])
+        assert len(expectation_values_list[1].values) == 1
+
+    @pytest.mark.parametrize(
+        "estimation_tasks,target_expectations", TEST_CASES_EIGENSTATES
+    )
+    def test_estimate_expectation_values_to_precision_for_eigenstates(
+        self, simulator, estimation_tasks, target_expectations
+    ):
+        expectation_values_list = estimate_expectation_values_to_precision(
+            simulator, estimation_tasks, target_precision=1e-3
+        )
+        for expectation_values, target in zip(
+            expectation_values_list, target_expectations
+        ):
+            np.testing.assert_array_equal(expectation_values.values, target.values)
+        assert simulator.number_of_circuits_run == 1
+
+    @pytest.mark.parametrize(
+        "estimation_tasks,target_expectations", TEST_CASES_NONEIGENSTATES
+    )
+    def test_estimate_expectation_values_to_precision_reaches_target_precision(
+        self, simulator, estimation_tasks, target_expectations
+    ):
+        target_precision = 0.1
+        expectation_values_list = estimate_expectation_values_to_precision(
+            simulator, estimation_tasks, target_precision=target_precision
+        )
+        precision = np.sqrt(
+            sum(
+                np.sum(covariance)
+                for expectation_values in expectation_values_list
+                for covariance in expectation_values.estimator_covariances
+            )
+        )
+        assert precision <= target_precision
+        for expectation_values, target in zip(
+            expectation_values_list, target_expectations
+        ):
+            np.testing.assert_allclose(
+                expectation_values.values, target.values, atol=0.3
+            )
+
+    def test_estimate_expectation_values_to_precision_respects_shot_cap(
+        self, simulator
+    ):
+        estimation_tasks = [
+            EstimationTask(IsingOperator("Z0"), Circuit([H(0)]), number_of_shots=10)
+        ]
+        expectation_values_list = estimate_expectation_values_to_precision(
+            simulator,
+            estimation_tasks,
+            target_precision=1e-6,
+            max_number_of_shots=35,
+        )
+        assert len(expectation_values_list) == 1
+        assert simulator.number_of_circuits_run == 3
+
+    def test_estimate_expectation_values_to_precision_fails_without_shots(
+        self, simulator
+    ):
+        estimation_tasks = [
+            EstimationTask(IsingOperator("Z0"), Circuit([H(0)]), number_of_shots=None)
+        ]
+        with pytest.raises(ValueError):
+            estimate_expectation_values_to_precision(
+                simulator, estimation_tasks, target_precision=0.1
+            )
+
     @pytest.mark.parametrize(
         "estimation_tasks,target_expectations",
         TEST_CASES_EIGENSTATES + TEST_CASES_NONEIGENSTATES,
@@ -671,6 +772,91 @@ class TestBasicEstimationMethods:
                 expectation_values.values, target.values
             )
 
+    def test_calculate_exact_expectation_values_simulates_identical_circuits_once(
+        self, simulator
+    ):
+        estimation_tasks = [
+            EstimationTask(QubitOperator("Z0"), Circuit([H(0)]), None),
+            EstimationTask(QubitOperator("X0", 2.0), Circuit([H(0)]), None),
+            EstimationTask(QubitOperator("Z0"), Circuit([X(0)]), None),
+        ]
+
+        expectation_values_list = calculate_exact_expectation_values(
+            simulator, estimation_tasks
+        )
+
+        assert simulator.number_of_circuits_run == 2
+        for expectation_values, target in zip(expectation_values_list, [0, 2, -1]):
+            np.testing.assert_array_almost_equal(expectation_values.values, [target])
+
+    def test_calculate_exact_expectation_values_evaluates_each_state_once(
+        self, simulator, monkeypatch
+    ):
+        evaluated_operators = []
+
+        def _get_expectation_values_for_terms(operator, wavefunction):
+            evaluated_operators.append(operator)
+            return get_expectation_values_for_terms(operator, wavefunction)
+
+        monkeypatch.setattr(
+            "zquantum.core.openfermion.get_expectation_values_for_terms",
+            _get_expectation_values_for_terms,
+        )
+        estimation_tasks = [
+            EstimationTask(
+                QubitOperator("Z0") + QubitOperator("X0"), Circuit([H(0)]), None
+            ),
+            EstimationTask(IsingOperator("Z0", 3.0), Circuit([X(0)]), None),
+            EstimationTask(QubitOperator("X0", 2.0), Circuit([H(0)]), None),
+        ]
+
+        expectation_values_list = calculate_exact_expectation_values(
+            simulator, estimation_tasks
+        )
+
+        assert len(evaluated_operators) == 2
+        for expectation_values, target in zip(
+            expectation_values_list, [[0, 1], [-3], [2]]
+        ):
+            np.testing.assert_array_almost_equal(expectation_values.values, target)
+
+    def test_calculate_exact_expectation_values_reuses_cached_wavefunctions(
+        self, simulator
+    ):
+        estimation_tasks = [
+            EstimationTask(QubitOperator("X0"), Circuit([H(0)]), None),
+            EstimationTask(QubitOperator("Z0"), Circuit([X(0)]), None),
+        ]
+        wavefunction_cache = WavefunctionCache(maxsize=1)
+
+        calculate_exact_expectation_values(
+            simulator, estimation_tasks, wavefunction_cache
+        )
+        expectation_values_list = calculate_exact_expectation_values(
+            simulator, estimation_tasks[1:], wavefunction_cache
+        )
+
+        assert len(wavefunction_cache) == 1
+        assert simulator.number_of_circuits_run == 2
+        np.testing.assert_array_almost_equal(expectation_values_list[0].values, [-1])
+
+    def test_calculate_exact_expectation_values_uses_backend_implementation(self):
+        class ConstantExpectationSimulator(SymbolicSimulator):
+            def get_exact_expectation_values(self, circuit, operator, **kwargs):
+                return ExpectationValues(np.full(len(operator.terms), 0.5))
+
+        simulator = ConstantExpectationSimulator()
+        estimation_tasks = [
+            EstimationTask(QubitOperator("Z0"), Circuit([X(0)]), None),
+        ]
+
+        expectation_values_list = calculate_exact_expectation_values(
+            simulator, estimation_tasks, WavefunctionCache()
+        )
+
+        assert simulator.number_of_circuits_run == 0
+        np.testing.assert_array_equal(expectation_values_list[0].values, [0.5])
+
     def test_calculate_exact_expectation_values_fails_with_non_simulator(
         self, estimation_tasks
     ):
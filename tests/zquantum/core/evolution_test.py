@@ -6,7 +6,7 @@ from openfermion import QubitOperator
 from pyquil.paulis import PauliSum, PauliTerm
 from zquantum.core import circuits
 from zquantum.core.evolution import (
-    _generate_circuit_sequence,
+    TrotterCircuitTemplate,
     time_evolution,
     time_evolution_derivatives,
     time_evolution_for_term,
@@ -149,67 +149,57 @@ class TestTimeEvolutionOfPauliSum:
         assert compare_unitary(unitary, reference_unitary, tol=1e-10)
 
 
-class TestGeneratingCircuitSequence:
-    @pytest.mark.parametrize(
-        "repeated_circuit, different_circuit, length, position, expected_result",
-        [
-            (
-                circuits.Circuit([circuits.X(0), circuits.Y(1)]),
-                circuits.Circuit([circuits.Z(1)]),
-                5,
-                1,
-                circuits.Circuit(
-                    [
-                        *[circuits.X(0), circuits.Y(1)],
-                        circuits.Z(1),
-                        *([circuits.X(0), circuits.Y(1)] * 3),
-                    ]
-                ),
-            ),
-            (
-                circuits.Circuit([circuits.RX(0.5)(1)]),
-                circuits.Circuit([circuits.CNOT(0, 2)]),
-                3,
-                0,
-                circuits.Circuit(
-                    [circuits.CNOT(0, 2), circuits.RX(0.5)(1), circuits.RX(0.5)(1)]
-                ),
-            ),
-            (
-                circuits.Circuit([circuits.RX(0.5)(1)]),
-                circuits.Circuit([circuits.CNOT(0, 2)]),
-                3,
-                2,
-                circuits.Circuit(
-                    [
-                        circuits.RX(0.5)(1),
-                        circuits.RX(0.5)(1),
-                        circuits.CNOT(0, 2),
-                    ]
-                ),
+class TestTrotterCircuitTemplate:
+    @pytest.fixture(
+        params=[
+            PauliSum(
+                [
+                    PauliTerm("X", 0) * PauliTerm("X", 1),
+                    PauliTerm("Y", 0, 0.5) * PauliTerm("Y", 1),
+                    PauliTerm("Z", 0, 0.3) * PauliTerm("Z", 2),
+                ]
             ),
-        ],
+            QubitOperator("[X0 X1] + 0.5[Y0 Y1] + 0.3[Z0 Z2]"),
+        ]
     )
-    def test_produces_correct_sequence(
-        self, repeated_circuit, different_circuit, position, length, expected_result
+    def hamiltonian(self, request):
+        return request.param
+
+    @pytest.mark.parametrize("order", [1, 3])
+    def test_instantiated_circuits_match_circuits_built_term_by_term(
+        self, hamiltonian, order
     ):
-        actual_result = _generate_circuit_sequence(
-            repeated_circuit, different_circuit, length, position
+        template = TrotterCircuitTemplate(hamiltonian)
+        terms = (
+            list(hamiltonian.get_operators())
+            if isinstance(hamiltonian, QubitOperator)
+            else hamiltonian.terms
         )
 
-        assert actual_result == expected_result
+        for time in [0.1, 0.4, 1.0]:
+            expected_circuit = circuits.Circuit()
+            for _ in range(order):
+                for term in terms:
+                    expected_circuit += time_evolution_for_term(term, time / order)
 
-    @pytest.mark.parametrize("length, invalid_position", [(5, 5), (4, 6)])
-    def test_raises_error_if_position_is_larger_or_equal_to_length(
-        self, length, invalid_position
+            assert template.instantiate(time, order) == expected_circuit
+
+    def test_instantiating_with_symbolic_time_and_binding_gives_numeric_circuit(
+        self, hamiltonian
     ):
-        repeated_circuit = circuits.Circuit([circuits.X(0)])
-        different_circuit = circuits.Circuit([circuits.Y(0)])
+        template = TrotterCircuitTemplate(hamiltonian)
+        time_symbol = sympy.Symbol("t")
 
-        with pytest.raises(ValueError):
-            _generate_circuit_sequence(
-                repeated_circuit, different_circuit, length, invalid_position
-            )
+        symbolic_circuit = template.instantiate(time_symbol, trotter_order=2)
+
+        assert symbolic_circuit.free_symbols == [time_symbol]
+        assert symbolic_circuit.bind({time_symbol: 0.4}) == template.instantiate(
+            0.4, trotter_order=2
+        )
+
+    def test_fails_for_unsupported_hamiltonian_type(self):
+        with pytest.raises(TypeError):
+            TrotterCircuitTemplate("X0 X1")
 
 
 class TestTimeEvolutionDerivatives:
@@ -243,3 +233,46 @@ class TestTimeEvolutionDerivatives:
         assert len(factors) == order * 2 * len(hamiltonian.terms)
         assert factors[0:18:2] == reference_factors_1
         assert factors[1:18:2] == reference_factors_2
+
+    @pytest.mark.parametrize("order", [1, 3])
+    def test_lazy_derivatives_are_the_same_as_eager_ones(self, hamiltonian, order):
+        time = 0.4
+        eager_derivatives, eager_factors = time_evolution_derivatives(
+            hamiltonian, time, trotter_order=order
+        )
+        lazy_derivatives, lazy_factors = time_evolution_derivatives(
+            hamiltonian, time, trotter_order=order, lazy=True
+        )
+
+        assert not isinstance(lazy_derivatives, list)
+        assert len(lazy_derivatives) == len(eager_derivatives)
+        assert list(lazy_derivatives) == eager_derivatives
+        assert lazy_derivatives[-1] == eager_derivatives[-1]
+        assert lazy_derivatives[1:4] == eager_derivatives[1:4]
+        assert lazy_factors == eager_factors
+
+    def test_unshifted_steps_of_derivatives_are_trotter_steps(self, hamiltonian):
+        time, order = 0.4, 3
+        trotter_step = time_evolution(hamiltonian, time / order).operations
+        step_length = len(trotter_step)
+
+        derivatives, _ = time_evolution_derivatives(
+            hamiltonian, time, trotter_order=order
+        )
+
+        for index, derivative in enumerate(derivatives):
+            position = index // (2 * len(hamiltonian.terms))
+            operations = derivative.operations
+            assert len(operations) == order * step_length
+            assert operations[: position * step_length] == trotter_step * position
+            assert operations[(position + 1) * step_length :] == trotter_step * (
+                order - position - 1
+            )
+
+    def test_lazy_derivatives_raise_index_error_when_out_of_range(self, hamiltonian):
+        lazy_derivatives, _ = time_evolution_derivatives(
+            hamiltonian, 0.4, trotter_order=2, lazy=True
+        )
+
+        with pytest.raises(IndexError):
+            lazy_derivatives[len(lazy_derivatives)]
@@ -0,0 +1,73 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from zquantum.core import circuits, openfermion
+from zquantum.core.circuits.conversions import cirq_conversions
+from zquantum.core.openfermion import _utils
+
+# Every workflow step imports zquantum.core in a fresh process, so these imports are
+# on its critical path. The budget leaves room for slow machines, but not for
+# importing OpenFermion, Cirq and PyQuil eagerly.
+IMPORT_TIME_BUDGET = 2.0
+
+_MEASURE_IMPORT = """
+import json, sys, time
+modules_before = set(sys.modules)
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+frameworks = sorted(
+    framework
+    for framework in ("cirq", "networkx", "openfermion", "pyquil", "qiskit")
+    if framework in sys.modules and framework not in modules_before
+)
+print(json.dumps({{"time": elapsed, "frameworks": frameworks}}))
+"""
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "zquantum.core.utils",
+        "zquantum.core.bitstring_distribution",
+        "zquantum.core.circuits",
+        "zquantum.core.measurement",
+        "zquantum.core.openfermion",
+        "zquantum.core.interfaces.backend",
+        "zquantum.core.interfaces.estimation",
+        "zquantum.core.estimation",
+    ],
+)
+def test_cold_import_is_fast_and_does_not_import_heavy_frameworks(module):
+    output = subprocess.run(
+        [sys.executable, "-c", _MEASURE_IMPORT.format(module=module)],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    ).stdout
+    measurement = json.loads(output.splitlines()[-1])
+
+    assert measurement["frameworks"] == []
+    assert measurement["time"] < IMPORT_TIME_BUDGET
+
+
+def test_conversions_are_imported_on_first_use():
+    assert circuits.export_to_cirq is cirq_conversions.export_to_cirq
+    assert "import_from_qiskit" in dir(circuits)
+
+
+def test_openfermion_utilities_are_imported_on_first_use():
+    assert (
+        openfermion.get_expectation_values_for_terms
+        is _utils.get_expectation_values_for_terms
+    )
+    assert "load_qubit_operator" in dir(openfermion)
+
+
+def test_accessing_missing_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        circuits.export_to_nonexistent_framework
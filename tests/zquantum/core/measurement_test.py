@@ -19,6 +19,7 @@ from zquantum.core.measurement import (
     get_expectation_value_from_frequencies,
     get_expectation_values_from_parities,
     get_parities_from_measurements,
+    get_total_estimator_variance,
     load_expectation_values,
     load_parities,
     load_wavefunction,
@@ -171,6 +172,19 @@ def test_parities_io():
     remove_file_if_exists("parities.json")
 
 
+def test_get_parities_from_measurements():
+    measurements = [(0, 1, 0), (0, 1, 0), (0, 0, 0), (1, 0, 0), (1, 1, 1)]
+    ising_operator = IsingOperator("[Z0 Z1] + [Z2]")
+
+    parities = get_parities_from_measurements(measurements, ising_operator)
+
+    np.testing.assert_array_equal(parities.values, [[2, 3], [4, 1]])
+    np.testing.assert_array_equal(
+        parities.correlations[0],
+        [[[5, 0], [1, 4]], [[1, 4], [5, 0]]],
+    )
+
+
 def test_get_expectation_values_from_parities():
     parities = Parities(values=np.array([[18, 50], [120, 113], [75, 26]]))
     expectation_values = get_expectation_values_from_parities(parities)
@@ -249,6 +263,13 @@ def test_get_expectation_value_from_frequencies():
     )
 
 
+def test_get_total_estimator_variance():
+    estimator_covariances = [np.array([[0.5, 0.1], [0.1, 0.2]]), np.array([[0.3]])]
+
+    assert get_total_estimator_variance(estimator_covariances) == pytest.approx(1.2)
+    assert get_total_estimator_variance([]) == 0.0
+
+
 def test_concatenate_expectation_values():
     expectation_values_set = [
         ExpectationValues(np.array([1.0, 2.0])),
@@ -261,6 +282,19 @@ def test_concatenate_expectation_values():
     assert np.allclose(combined_expectation_values.values, [1.0, 2.0, 3.0, 4.0])
 
 
+def test_concatenate_expectation_values_from_generator_of_complex_values():
+    expectation_values_set = (
+        ExpectationValues(np.array([1.0 + 1j * i, 2.0])) for i in range(100)
+    )
+
+    combined_expectation_values = expectation_values_to_real(
+        concatenate_expectation_values(expectation_values_set)
+    )
+
+    assert combined_expectation_values.values.dtype == np.float64
+    np.testing.assert_array_equal(combined_expectation_values.values, [1.0, 2.0] * 100)
+
+
 def test_concatenate_expectation_values_with_cov_and_corr():
     expectation_values_set = [
         ExpectationValues(
@@ -356,6 +390,43 @@ class TestMeasurements:
         assert target_measurements.bitstrings == recreated_measurements.bitstrings
         remove_file_if_exists("measurementstest.json")
 
+    def test_binary_io_preserves_counts_and_memory_maps_file(self, tmp_path):
+        # Given
+        counts = {"000": 1, "001": 2, "110": 5, "111": 3}
+        filename = tmp_path / "measurements.bin"
+        ising_operator = IsingOperator("[Z0] + 2[Z1 Z2]")
+
+        # When
+        Measurements.from_counts(counts).save(filename, binary=True)
+        measurements = Measurements.load_from_file(filename)
+
+        # Then
+        assert isinstance(measurements._counts, np.memmap)
+        assert measurements.get_counts() == counts
+        np.testing.assert_array_equal(
+            measurements.get_expectation_values(ising_operator).values,
+            Measurements.from_counts(counts)
+            .get_expectation_values(ising_operator)
+            .values,
+        )
+
+    def test_binary_format_is_detected_when_loading_from_file_object(self, tmp_path):
+        filename = tmp_path / "measurements.bin"
+        Measurements([(0, 1), (1, 1), (0, 1)]).save(filename, binary=True)
+
+        with open(filename, "rb") as f:
+            measurements = Measurements.load_from_file(f)
+
+        assert measurements.get_counts() == {"01": 2, "11": 1}
+
+    def test_binary_io_for_more_than_64_qubits(self, tmp_path):
+        counts = {"1" + "0" * 68 + "1": 3, "0" * 70: 1}
+        filename = tmp_path / "measurements.bin"
+
+        Measurements.from_counts(counts).save(filename, binary=True)
+
+        assert Measurements.load_from_file(filename).get_counts() == counts
+
     def test_intialize_with_bitstrings(self):
         # Given
         bitstrings = [
@@ -729,6 +800,90 @@ class TestMeasurements:
             expectation_values.estimator_covariances[0], target_covariances
         )
 
+    def test_statistics_of_large_counts_are_computed_without_bitstrings(self):
+        measurements = Measurements.from_counts({"01": 10 ** 9, "11": 3 * 10 ** 9})
+
+        assert measurements.get_counts() == {"01": 10 ** 9, "11": 3 * 10 ** 9}
+        assert measurements.get_distribution().distribution_dict == {
+            "01": 0.25,
+            "11": 0.75,
+        }
+        expectation_values = measurements.get_expectation_values(
+            IsingOperator("[Z0] + 2[Z1] + [Z0 Z1]")
+        )
+        np.testing.assert_allclose(expectation_values.values, [-0.5, -2, 0.5])
+        assert measurements._bitstrings is None
+
+    def test_add_counts_merges_outcomes_in_order_of_first_appearance(self):
+        measurements = Measurements.from_counts({"10": 1, "00": 2})
+
+        measurements.add_counts({"11": 1, "10": 2})
+
+        assert measurements.get_counts() == {"10": 3, "00": 2, "11": 1}
+        assert measurements.bitstrings == [(1, 0)] * 3 + [(0, 0)] * 2 + [(1, 1)]
+
+    def test_modifying_bitstrings_of_measurements_from_counts_updates_counts(self):
+        measurements = Measurements.from_counts({"10": 1, "00": 2})
+
+        measurements.bitstrings.append((1, 1))
+        measurements.bitstrings += [(0, 0)]
+
+        assert measurements.get_counts() == {"10": 1, "00": 3, "11": 1}
+
+    def test_add_counts_to_bitstrings_appends_bitstrings(self):
+        measurements = Measurements([(1, 1), (0, 1)])
+
+        measurements.add_counts({"01": 1, "00": 1})
+
+        assert measurements.bitstrings == [(1, 1), (0, 1), (0, 1), (0, 0)]
+
+    def test_get_histogram(self):
+        measurements = Measurements([(1, 0), (0, 0), (1, 0)])
+
+        outcomes, counts, n_qubits = measurements.get_histogram()
+
+        assert outcomes.tolist() == [0b01, 0b00]
+        assert counts.tolist() == [2, 1]
+        assert n_qubits == 2
+
+    def test_assigning_bitstrings_discards_previous_counts(self):
+        measurements = Measurements.from_counts({"01": 5})
+
+        measurements.bitstrings = []
+        measurements.add_counts({"11": 1})
+
+        assert measurements.get_counts() == {"11": 1}
+
+    def test_clearing_bitstrings_discards_previous_counts(self):
+        measurements = Measurements.from_counts({"01": 5})
+
+        measurements.bitstrings.clear()
+        measurements.add_counts({"11": 1})
+
+        assert measurements.get_counts() == {"11": 1}
+
+    def test_counts_of_bitstrings_of_different_lengths(self):
+        measurements = Measurements.from_counts({"0": 1})
+
+        measurements.add_counts({"11": 1})
+
+        assert measurements.get_counts() == {"0": 1, "11": 1}
+        np.testing.assert_allclose(
+            measurements.get_expectation_values(IsingOperator("Z0")).values, [0]
+        )
+        with pytest.raises(ValueError):
+            measurements.get_expectation_values(IsingOperator("Z1"))
+
+    def test_counts_of_more_than_64_qubits_are_supported(self):
+        bitstring = "1" + "0" * 68 + "1"
+        measurements = Measurements.from_counts({bitstring: 2, "0" * 70: 2})
+
+        assert measurements.get_counts() == {bitstring: 2, "0" * 70: 2}
+        assert measurements.bitstrings[0] == (1,) + (0,) * 68 + (1,)
+        np.testing.assert_allclose(
+            measurements.get_expectation_values(IsingOperator("Z69")).values, [0]
+        )
+
     @pytest.mark.parametrize(
         "bitstring_distribution, number_of_samples",
         [
@@ -857,3 +1012,16 @@ class TestMeasurements:
         counts = measurements.get_counts()
         for bitstring, probability in bitstring_distribution.distribution_dict.items():
             assert probability * number_of_samples == counts[bitstring]
+
+    def test_get_measurements_representing_distribution_gives_largest_remainders(
+        self,
+    ):
+        bitstring_distribution = BitstringDistribution(
+            {"000": 0.16, "010": 0.37, "101": 0.47}
+        )
+
+        measurements = Measurements.get_measurements_representing_distribution(
+            bitstring_distribution, 10
+        )
+
+        assert measurements.get_counts() == {"000": 1, "010": 4, "101": 5}
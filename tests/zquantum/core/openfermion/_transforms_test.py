@@ -0,0 +1,107 @@
+import os
+
+import pytest
+from openfermion import (
+    bravyi_kitaev,
+    get_fermion_operator,
+    jordan_wigner,
+    random_interaction_operator,
+)
+from zquantum.core.openfermion._transforms import (
+    get_interaction_operator_hash,
+    transform_interaction_operator,
+)
+
+
+@pytest.fixture
+def interaction_operator():
+    return random_interaction_operator(4, real=True, seed=1234)
+
+
+class TestTransformInteractionOperator:
+    @pytest.mark.parametrize(
+        "transformation,expected_transformation",
+        [
+            ("Jordan-Wigner", jordan_wigner),
+            (
+                "Bravyi-Kitaev",
+                lambda operator: bravyi_kitaev(get_fermion_operator(operator)),
+            ),
+        ],
+    )
+    @pytest.mark.parametrize("n_workers", [1, 3])
+    def test_matches_openfermion_transformation(
+        self, interaction_operator, transformation, expected_transformation, n_workers
+    ):
+        transformed_operator = transform_interaction_operator(
+            interaction_operator, transformation, n_workers=n_workers
+        )
+
+        assert transformed_operator == expected_transformation(interaction_operator)
+
+    @pytest.mark.parametrize("transformation", ["Jordan-Wigner", "Bravyi-Kitaev"])
+    def test_parallel_transformation_of_complex_operator_matches_serial_one(
+        self, transformation
+    ):
+        interaction_operator = random_interaction_operator(5, real=False, seed=1234)
+
+        assert transform_interaction_operator(
+            interaction_operator, transformation, n_workers=3
+        ) == transform_interaction_operator(interaction_operator, transformation)
+
+    def test_raises_error_for_unknown_transformation(self, interaction_operator):
+        with pytest.raises(RuntimeError):
+            transform_interaction_operator(interaction_operator, "Parity")
+
+    def test_result_is_loaded_from_cache_directory(
+        self, interaction_operator, tmp_path, monkeypatch
+    ):
+        transformed_operator = transform_interaction_operator(
+            interaction_operator, cache_dir=tmp_path
+        )
+        assert len(os.listdir(tmp_path)) == 1
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("Cached transformation was recomputed.")
+
+        monkeypatch.setattr(
+            "zquantum.core.openfermion._transforms.jordan_wigner", _fail
+        )
+        cached_operator = transform_interaction_operator(
+            interaction_operator, cache_dir=tmp_path
+        )
+
+        assert cached_operator == transformed_operator
+
+    def test_different_transformations_are_cached_separately(
+        self, interaction_operator, tmp_path
+    ):
+        transform_interaction_operator(
+            interaction_operator, "Jordan-Wigner", cache_dir=tmp_path
+        )
+        bk_operator = transform_interaction_operator(
+            interaction_operator, "Bravyi-Kitaev", cache_dir=tmp_path
+        )
+
+        assert len(os.listdir(tmp_path)) == 2
+        assert bk_operator == bravyi_kitaev(get_fermion_operator(interaction_operator))
+
+
+class TestGetInteractionOperatorHash:
+    def test_depends_only_on_content(self, interaction_operator):
+        copied_operator = random_interaction_operator(4, real=True, seed=1234)
+
+        assert get_interaction_operator_hash(
+            interaction_operator
+        ) == get_interaction_operator_hash(copied_operator)
+
+    def test_changes_when_tensor_changes(self, interaction_operator):
+        original_hash = get_interaction_operator_hash(interaction_operator)
+        interaction_operator.two_body_tensor[0, 1, 2, 3] += 1e-12
+
+        assert get_interaction_operator_hash(interaction_operator) != original_hash
+
+    def test_changes_with_transformation(self, interaction_operator):
+        assert get_interaction_operator_hash(
+            interaction_operator, "Jordan-Wigner"
+        ) != get_interaction_operator_hash(interaction_operator, "Bravyi-Kitaev")
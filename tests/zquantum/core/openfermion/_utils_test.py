@@ -1,3 +1,4 @@
+import itertools
 import random
 import unittest
 
@@ -9,12 +10,15 @@ from cirq import GridQubit, LineQubit, PauliString, PauliSum
 from openfermion import (
     FermionOperator,
     IsingOperator,
+    PolynomialTensor,
     QubitOperator,
+    freeze_orbitals,
     get_fermion_operator,
     get_interaction_operator,
     get_sparse_operator,
     jordan_wigner,
     qubit_operator_sparse,
+    random_interaction_operator,
 )
 from openfermion.hamiltonians import fermi_hubbard
 from openfermion.linalg import jw_get_ground_state_at_particle_number
@@ -30,6 +34,7 @@ from zquantum.core.openfermion._utils import (
     generate_random_qubitop,
     get_diagonal_component,
     get_expectation_value,
+    get_expectation_values_for_terms,
     get_fermion_number_operator,
     get_ground_state_rdm_from_qubit_op,
     get_polynomial_tensor,
@@ -73,6 +78,34 @@ class TestQubitOperator(unittest.TestCase):
             for elem in row:
                 self.assertEqual(abs(elem) < TOL, True)
 
+    def test_qubitop_matrix_conversion_gives_expected_terms(self):
+        # Given
+        expected_qubitop = (
+            QubitOperator("X0 Y2", 0.5)
+            + QubitOperator("Z1", -1.5j)
+            + QubitOperator("Y0 Y1 Z2", 0.25)
+            + QubitOperator("", 2.0)
+        )
+        matrix = qubit_operator_sparse(expected_qubitop, n_qubits=3).toarray()
+
+        # When
+        qubitop = get_qubitop_from_matrix(matrix)
+
+        # Then
+        self.assertEqual(qubitop, expected_qubitop)
+        self.assertEqual(len(qubitop.terms), len(expected_qubitop.terms))
+
+    def test_qubitop_matrix_conversion_omits_terms_below_threshold(self):
+        # Given
+        qubitop = QubitOperator("X0 X1", 1.0) + QubitOperator("Z0", 1e-4)
+        matrix = qubit_operator_sparse(qubitop, n_qubits=2).toarray()
+
+        # When
+        thresholded_qubitop = get_qubitop_from_matrix(matrix, threshold=1e-3)
+
+        # Then
+        self.assertEqual(thresholded_qubitop, QubitOperator("X0 X1", 1.0))
+
     def test_generate_random_qubitop(self):
         # Given
         nqubits = 4
@@ -155,6 +188,46 @@ class TestQubitOperator(unittest.TestCase):
         self.assertAlmostEqual(-1, exp_op1)
         self.assertAlmostEqual(1, exp_op2)
 
+    def test_get_expectation_values_for_terms_matches_get_expectation_value(self):
+        # Given
+        random_generator = np.random.default_rng(RNDSEED)
+        amplitudes = random_generator.normal(size=16) + 1j * random_generator.normal(
+            size=16
+        )
+        wf = pyquil.wavefunction.Wavefunction(amplitudes / np.linalg.norm(amplitudes))
+        operator = (
+            QubitOperator("X0 Y2 Z3", 0.5)
+            + QubitOperator("Y1", -1.2)
+            + QubitOperator("", 2.0)
+            + QubitOperator("Z0 Z1")
+            + QubitOperator("X0 Y2", 0.3j)
+            + QubitOperator("Y0 Y1 X2 X3", 0.7)
+        )
+
+        # When
+        expectation_values = get_expectation_values_for_terms(operator, wf)
+
+        # Then
+        np.testing.assert_allclose(
+            expectation_values, [get_expectation_value(term, wf) for term in operator]
+        )
+
+    def test_get_expectation_values_for_terms_accepts_ising_operator(self):
+        # Given
+        wf = pyquil.wavefunction.Wavefunction([0, 1, 0, 0, 0, 0, 0, 0])
+        operator = IsingOperator("Z0", 2.0) + IsingOperator("Z1 Z2", -1.0)
+
+        # When
+        expectation_values = get_expectation_values_for_terms(operator, wf)
+
+        # Then
+        np.testing.assert_allclose(expectation_values, [-2.0, -1.0])
+
+    def test_get_expectation_values_for_terms_fails_for_too_large_operator(self):
+        wf = pyquil.wavefunction.Wavefunction([1, 0, 0, 0])
+        with self.assertRaises(ValueError):
+            get_expectation_values_for_terms(QubitOperator("X2"), wf)
+
     def test_change_operator_type(self):
         # Given
         operator1 = QubitOperator("Z0 Z1", 4.5)
@@ -255,6 +328,19 @@ class TestOtherUtils(unittest.TestCase):
                     break
             self.assertFalse(is_diagonal)
 
+    def test_get_diagonal_component_polynomial_tensor_matches_number_operators(self):
+        n_modes = 3
+        tensor = np.arange(1, n_modes ** 4 + 1).reshape((n_modes,) * 4)
+        polynomial_tensor = PolynomialTensor({(1, 0, 1, 0): tensor})
+        diagonal_op, remainder_op = get_diagonal_component(polynomial_tensor)
+
+        for p, q, r, s in itertools.product(range(n_modes), repeat=4):
+            is_diagonal = sorted([p, r]) == sorted([q, s])
+            diagonal_value = diagonal_op.n_body_tensors[(1, 0, 1, 0)][p, q, r, s]
+            remainder_value = remainder_op.n_body_tensors[(1, 0, 1, 0)][p, q, r, s]
+            self.assertEqual(diagonal_value, tensor[p, q, r, s] if is_diagonal else 0)
+            self.assertEqual(remainder_value, 0 if is_diagonal else tensor[p, q, r, s])
+
     def test_get_diagonal_component_interaction_op(self):
         fermion_op = FermionOperator("1^ 1", 0.5)
         fermion_op += FermionOperator("2^ 2", 0.5)
@@ -381,6 +467,40 @@ class TestOtherUtils(unittest.TestCase):
         # Then
         self.assertAlmostEqual(e, rdm.expectation(fhm_int))
 
+    def test_get_ground_state_rdm_from_qubit_op_matches_fermion_operators(self):
+        # Given
+        fhm = fermi_hubbard(
+            x_dimension=2,
+            y_dimension=1,
+            tunneling=1.0,
+            coulomb=5.0,
+            chemical_potential=2.5,
+            spinless=False,
+        )
+        fhm_qubit = jordan_wigner(fhm)
+        n_qubits = 4
+        _, wf = jw_get_ground_state_at_particle_number(get_sparse_operator(fhm), 2)
+
+        def expectation(fermion_operator):
+            matrix = get_sparse_operator(fermion_operator, n_qubits=n_qubits)
+            return np.conjugate(wf) @ matrix @ wf
+
+        # When
+        rdm = get_ground_state_rdm_from_qubit_op(
+            qubit_operator=fhm_qubit, n_particles=2
+        )
+
+        # Then
+        for p, q in itertools.product(range(n_qubits), repeat=2):
+            self.assertAlmostEqual(
+                rdm.one_body_tensor[p, q], expectation(FermionOperator(f"{p}^ {q}"))
+            )
+        for p, q, r, s in itertools.product(range(n_qubits), repeat=4):
+            self.assertAlmostEqual(
+                rdm.two_body_tensor[p, q, r, s],
+                expectation(FermionOperator(f"{p}^ {q}^ {r} {s}")),
+            )
+
     def test_remove_inactive_orbitals(self):
         fermion_ham = load_interaction_operator(
             pkg_resources.resource_filename(
@@ -392,3 +512,24 @@ class TestOtherUtils(unittest.TestCase):
 
         hf_energy = hf_rdm(1, 1, 2).expectation(fermion_ham)
         self.assertAlmostEqual(frozen_ham.constant, hf_energy)
+
+    def test_remove_inactive_orbitals_matches_freezing_fermion_operator(self):
+        interaction_op = random_interaction_operator(
+            4, expand_spin=True, real=True, seed=RNDSEED
+        )
+        fermion_op = get_fermion_operator(interaction_op)
+
+        for n_core, n_active in [(0, 2), (1, 2), (1, 3), (2, None)]:
+            frozen_op = remove_inactive_orbitals(interaction_op, n_active, n_core)
+
+            unoccupied = range(2 * n_core + 2 * n_active, 8) if n_active else []
+            expected_op = get_interaction_operator(
+                freeze_orbitals(fermion_op, range(2 * n_core), unoccupied)
+            )
+            self.assertAlmostEqual(frozen_op.constant, expected_op.constant)
+            np.testing.assert_allclose(
+                frozen_op.one_body_tensor, expected_op.one_body_tensor, atol=1e-12
+            )
+            np.testing.assert_allclose(
+                frozen_op.two_body_tensor, expected_op.two_body_tensor, atol=1e-12
+            )
@@ -12,8 +12,12 @@ from zquantum.core.openfermion import load_interaction_operator
 from zquantum.core.utils import (
     RNDSEED,
     SCHEMA_VERSION,
+    AliasSampler,
     ValueEstimate,
+    _apportion_by_largest_remainders,
+    _convert_bitstrings_to_integers,
     bin2dec,
+    clear_creator_cache,
     compare_unitary,
     convert_array_to_dict,
     convert_dict_to_array,
@@ -21,6 +25,8 @@ from zquantum.core.utils import (
     create_object,
     create_symbols_map,
     dec2bin,
+    get_bit_reversal_permutation,
+    get_creator_cache_info,
     get_func_from_specs,
     get_ordered_list_of_bitstrings,
     hf_rdm,
@@ -30,6 +36,8 @@ from zquantum.core.utils import (
     load_nmeas_estimate,
     load_noise_model,
     load_value_estimate,
+    prepare_specs,
+    reverse_bit_order,
     sample_from_probability_distribution,
     save_generic_dict,
     save_list,
@@ -107,6 +115,35 @@ class TestUtils:
         counts = sample_from_probability_distribution(distribution, number_of_samples)
         assert sum(counts.values()) == number_of_samples
 
+    @pytest.mark.parametrize(
+        "sample",
+        [
+            sample_from_probability_distribution,
+            lambda distribution, n_samples, seed: AliasSampler(distribution).sample(
+                n_samples, seed
+            ),
+        ],
+    )
+    def test_sampling_is_reproducible_with_seed_or_generator(self, sample):
+        distribution = {"00": 0.1, "01": 0.2, "10": 0.3, "11": 0.4}
+
+        assert sample(distribution, 100, 1234) == sample(distribution, 100, 1234)
+        assert sample(distribution, 100, np.random.default_rng(5)) == sample(
+            distribution, 100, np.random.default_rng(5)
+        )
+
+    def test_alias_sampler_samples_from_distribution(self):
+        distribution = {"a": 0.55, "b": 0.3, "c": 0.0, "d": 0.15}
+        sampler = AliasSampler(distribution)
+        n_samples = 100000
+
+        counts = sampler.sample(n_samples, seed=RNDSEED)
+
+        assert "c" not in counts
+        assert sum(counts.values()) == n_samples
+        for outcome, probability in distribution.items():
+            assert counts[outcome] / n_samples == pytest.approx(probability, abs=0.01)
+
     def test_convert_bitstrings_to_tuples(self):
         pass
 
@@ -258,6 +295,71 @@ class TestUtils:
         with pytest.raises(ValueError):
             _ = create_object(specs, parameters=data)
 
+    def test_prepared_specs_create_objects_like_create_object(self):
+        # Given
+        data = np.array([1.0, 2.0])
+        specs = {
+            "module_name": "zquantum.core.interfaces.mock_objects",
+            "function_name": "mock_cost_function",
+        }
+
+        # When
+        factory = prepare_specs(specs)
+
+        # Then
+        for _ in range(2):
+            function = factory(parameters=data)
+            assert isinstance(function, partial)
+            assert function() == create_object(specs, parameters=data)()
+        with pytest.raises(ValueError):
+            prepare_specs({**specs, "parameters": data})(parameters=data)
+
+    def test_resolved_creators_are_cached(self):
+        # Given
+        clear_creator_cache()
+        specs = {
+            "module_name": "zquantum.core.interfaces.mock_objects",
+            "function_name": "MockQuantumBackend",
+            "n_samples": 10,
+        }
+
+        # When
+        create_object(specs)
+
+        # Then
+        cache_info = get_creator_cache_info()
+        assert list(cache_info) == [
+            ("zquantum.core.interfaces.mock_objects", "MockQuantumBackend")
+        ]
+        assert (
+            cache_info[("zquantum.core.interfaces.mock_objects", "MockQuantumBackend")]
+            >= 0
+        )
+
+        clear_creator_cache()
+        assert get_creator_cache_info() == {}
+
+    def test_creators_replaced_in_their_module_are_resolved_again(self, monkeypatch):
+        # Given
+        specs = {
+            "module_name": "zquantum.core.interfaces.mock_objects",
+            "function_name": "MockQuantumBackend",
+        }
+        create_object(specs, n_samples=10)
+
+        class ReplacedBackend:
+            def __init__(self, n_samples):
+                self.n_samples = n_samples
+
+        # When
+        monkeypatch.setattr(
+            "zquantum.core.interfaces.mock_objects.MockQuantumBackend",
+            ReplacedBackend,
+        )
+
+        # Then
+        assert isinstance(create_object(specs, n_samples=10), ReplacedBackend)
+
     def test_save_generic_dict(self):
         data = {"flavor": "chocolate", "weight": 42}
         save_generic_dict(data, "dict.json")
@@ -446,6 +548,19 @@ def test_scale_and_discretize(values, total, expected_result):
     assert scale_and_discretize(values, total) == expected_result
 
 
+def test_apportion_by_largest_remainders_breaks_ties_at_random():
+    quotas = np.array([1.5, 1.5, 1.5, 1.5])
+
+    apportionments = {
+        tuple(_apportion_by_largest_remainders(quotas, 6, np.random.default_rng(seed)))
+        for seed in range(20)
+    }
+
+    assert all(sum(apportionment) == 6 for apportionment in apportionments)
+    assert all(set(apportionment) == {1, 2} for apportionment in apportionments)
+    assert len(apportionments) > 1
+
+
 # Hamiltonians and energies from Psi4 H2 minimal basis
 # first one is RHF, second one is H2- doublet with ROHF
 @pytest.mark.parametrize(
@@ -485,3 +600,42 @@ def test_ordered_bitstring(num_qubits):
     )
     assert np.all(expected_bitstrings == bitstrings)
     assert np.all([len(bitstring) == num_qubits for bitstring in bitstrings])
+
+
+@pytest.mark.parametrize("n_bits", [0, 1, 3, 6])
+def test_bit_reversal_permutation_reverses_binary_representations(n_bits):
+    permutation = get_bit_reversal_permutation(n_bits)
+
+    for integer, reversed_integer in enumerate(permutation):
+        assert dec2bin(reversed_integer, n_bits) == dec2bin(integer, n_bits)[::-1]
+    assert not permutation.flags.writeable
+    assert get_bit_reversal_permutation(n_bits) is permutation
+
+
+def test_reverse_bit_order_matches_bit_reversal_permutation():
+    array = np.random.default_rng(RNDSEED).normal(size=32)
+
+    np.testing.assert_array_equal(
+        reverse_bit_order(array), array[get_bit_reversal_permutation(5)]
+    )
+
+
+def test_reverse_bit_order_raises_error_for_length_not_power_of_two():
+    with pytest.raises(ValueError):
+        reverse_bit_order(np.ones(6))
+
+
+@pytest.mark.parametrize(
+    "bitstrings,expected_integers",
+    [
+        (["000", "011", "110"], [0, 3, 6]),
+        (["1" * 63, "0" * 62 + "1"], [2 ** 63 - 1, 1]),
+        (["1" + "0" * 69, "1" * 70], [2 ** 69, 2 ** 70 - 1]),
+        (["1", "10", "111"], [1, 2, 7]),
+        ([], []),
+    ],
+)
+def test_convert_bitstrings_to_integers(bitstrings, expected_integers):
+    integers = _convert_bitstrings_to_integers(bitstrings)
+
+    assert integers.tolist() == expected_integers